@@ -0,0 +1,92 @@
+# edge_cache.py
+# Author(s): Edvard Bruun
+
+from collections import OrderedDict
+
+class EdgeCache:
+	""" A bounded least recently used (LRU) cache of the collision results of the edges between recorded vertices.
+
+	An edge is identified by the indices of its two end vertices, in any order. Since a recorded vertex never moves, the result of the collision check of an edge stays valid for the whole solution, and the cache only needs to be bounded to limit its memory. The number of hits and misses is counted to measure how much collision checking the cache removes.
+
+	"""
+
+	def __init__(self, max_size=4096):
+		"""Initialize an empty EdgeCache.
+
+		Parameters:
+			max_size (:obj:`int`): The maximum number of edges stored, the least recently used edge is dropped when it is exceeded.
+
+		Attributes:
+			max_size: see Parameters
+
+			edges (:obj:`collections.OrderedDict`):
+				Maps the (lower index, higher index) key of an edge to :obj:`True` if the edge is blocked, ordered from the least to the most recently used.
+			hits (:obj:`int`):
+				The number of lookups that found the edge in the cache.
+			misses (:obj:`int`):
+				The number of lookups that did not find the edge in the cache.
+
+		"""
+		self.max_size = max_size
+
+		self.edges = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def __len__(self):
+		return len(self.edges)
+
+	@property
+	def hit_rate(self):
+		""" The fraction of the lookups that found the edge in the cache, 0 if there were no lookups.
+		"""
+		lookups = self.hits + self.misses
+		return self.hits/lookups if lookups > 0 else 0.0
+
+	@staticmethod
+	def key(index_1, index_2):
+		""" This function returns the key of the edge between two vertices, which does not depend on their order.
+		"""
+		index_1 = int(index_1)
+		index_2 = int(index_2)
+		return (index_1, index_2) if index_1 <= index_2 else (index_2, index_1)
+
+	def lookup(self, index_1, index_2):
+		""" This function returns the cached collision result of an edge.
+
+		Parameters:
+			index_1 (:obj:`int`): The index of one end vertex of the edge.
+			index_2 (:obj:`int`): The index of the other end vertex of the edge.
+
+		Returns:
+			blocked (:obj:`bool`): The stored result, or :obj:`None` if the edge is not in the cache.
+
+		"""
+		key = self.key(index_1, index_2)
+		blocked = self.edges.get(key)
+		if blocked is None:
+			self.misses += 1
+		else:
+			self.hits += 1
+			self.edges.move_to_end(key)
+		return blocked
+
+	def store(self, index_1, index_2, blocked):
+		""" This function stores the collision result of an edge, dropping the least recently used edge if the cache is full.
+
+		Parameters:
+			index_1 (:obj:`int`): The index of one end vertex of the edge.
+			index_2 (:obj:`int`): The index of the other end vertex of the edge.
+			blocked (:obj:`bool`): :obj:`True` if the edge is blocked.
+
+		"""
+		key = self.key(index_1, index_2)
+		self.edges[key] = bool(blocked)
+		self.edges.move_to_end(key)
+		if len(self.edges) > self.max_size:
+			self.edges.popitem(last=False)
+
+	def clear(self):
+		""" This function removes all stored edges, the hit and miss counters are kept.
+		"""
+		self.edges.clear()
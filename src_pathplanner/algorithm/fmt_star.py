@@ -0,0 +1,194 @@
+# fmt_star.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.rrt.RRT` class
+
+Imports the :class:`~algorithm.roadmap.Roadmap` class
+
+"""
+
+import heapq
+import numpy as np
+
+from algorithm.rrt import RRT
+from algorithm.roadmap import Roadmap
+
+
+class FMT_Star(RRT):
+	""" A class for the Fast Marching Tree (FMT*) algorithm, a batch planner which inherits from the :class:`~algorithm.rrt.RRT` abstract class.
+
+	Instead of growing the tree one random configuration at a time, all of the samples are drawn at once when the algorithm is initialized and the neighbors of every sample are found with array operations. The tree is then grown from the origin as a wavefront in order of increasing cost (Janson et al., 2015): the open vertex with the lowest cost is expanded by connecting each of its unvisited neighbors to the open vertex that gives it the lowest cost. Only that one edge is collision-checked for each neighbor, and the edges of all of the neighbors are checked together with the :meth:`~input.domain_class.Domain.edges_blocked()` method.
+
+	Each step of the algorithm expands one vertex of the wavefront, so that the run can be stopped early by the termination policies of the :class:`~solver.solution.Solution` class. The connected samples are written to the :obj:`~solver.recorder.Recorder` object in the order they are added to the tree, with their parents and costs, the same as for the other algorithms.
+
+	"""
+
+	def __init__(self,domain_object,recorder,params):
+		"""Initializes with abstract base class definition, and draws the batch of samples.
+
+		The number of samples is given by the optional "batch_size" parameter. By default it is chosen so that the `n_trials` iterations of the :class:`~solver.solution.Solution` class are enough to expand every sample. They are drawn with the sampler selected in the input parameters (see :meth:`~algorithm.rrt.RRT.create_sampler()`), the samples inside an obstacle are discarded, and one free sample is added inside each goal if one is found.
+
+		Attributes:
+			samples (:obj:`numpy.ndarray` of :obj:`float`):
+				The free samples, one per row. The first sample is the origin.
+			radius (:obj:`float`):
+				The connection radius, see :meth:`~algorithm.fmt_star.FMT_Star.connection_radius()`.
+			neighbor_start, neighbor_indices, neighbor_dist (:obj:`numpy.ndarray`):
+				The neighbors of every sample, in compressed sparse row format: the indices and distances of the neighbors of sample `i` are stored from `neighbor_start[i]` to `neighbor_start[i+1]`.
+			sample_costs (:obj:`numpy.ndarray` of :obj:`float`):
+				The cost of the path to each sample in the tree, :obj:`numpy.inf` if the sample is not in the tree yet.
+			sample_rows (:obj:`numpy.ndarray` of :obj:`int`):
+				The row of each sample in the :obj:`~solver.recorder.Recorder` object, -1 if the sample is not in the tree yet.
+			is_open (:obj:`numpy.ndarray` of :obj:`bool`):
+				True for the samples on the wavefront, which are in the tree but not expanded yet.
+			is_unvisited (:obj:`numpy.ndarray` of :obj:`bool`):
+				True for the samples that are not in the tree yet.
+			open_heap (:obj:`list` of :obj:`tuple`):
+				Heap of the (cost, sample index) pairs of the open samples.
+
+		Note:
+			The `nearest_index` attribute of the base class is not used, since no nearest vertex queries are made.
+
+		"""
+		super().__init__(domain_object,recorder,params)
+
+		n_samples = self.params.get("batch_size", max(self.params["n_trials"] - 2 - len(domain_object.goals), 1))
+		samples = self.sample_buffer.next_batch(n_samples)
+		samples = samples[~self.domain_object.points_blocked(samples)]
+		goal_samples = [Roadmap.sample_free_point(domain_object, goal) for goal in self.domain_object.goals]
+		goal_samples = [sample.reshape(1, -1) for sample in goal_samples if sample is not None]
+
+		self.samples = np.concatenate([np.asarray(domain_object.origin, dtype=float).reshape(1, -1), samples] + goal_samples).reshape(-1, domain_object.dim)
+		self.radius = self.connection_radius(n_samples, len(samples))
+		self.find_neighbors()
+
+		n = len(self.samples)
+		self.sample_costs = np.full(n, np.inf)
+		self.sample_costs[0] = 0.0
+		self.sample_rows = np.full(n, -1, dtype=int)
+		self.sample_rows[0] = 0
+		self.is_open = np.zeros(n, dtype=bool)
+		self.is_open[0] = True
+		self.is_unvisited = np.ones(n, dtype=bool)
+		self.is_unvisited[0] = False
+		self.open_heap = [(0.0, 0)]
+
+	def connection_radius(self, n_drawn, n_free):
+		""" This function returns the radius within which the samples are connected.
+
+		The radius is given by the optional "connection_radius" parameter if it is set, and otherwise by the FMT* radius of the :meth:`~algorithm.roadmap.Roadmap.optimal_radius()` method. Its tuning factor is given by the optional "radius_factor" parameter (0.1 by default).
+
+		Parameters:
+			n_drawn (:obj:`int`): The number of samples drawn.
+			n_free (:obj:`int`): The number of samples outside of the obstacles.
+
+		Returns:
+			radius (:obj:`float`): The connection radius.
+		"""
+		radius = self.params.get("connection_radius")
+		if radius is not None:
+			return radius
+
+		return Roadmap.optimal_radius(self.domain_object, n_drawn, n_free, self.params.get("radius_factor", 0.1))
+
+	def find_neighbors(self):
+		""" This function finds the neighbors of every sample within the connection radius, with the :meth:`~algorithm.roadmap.Roadmap.radius_neighbors()` method.
+		"""
+		self.neighbor_start, self.neighbor_indices, self.neighbor_dist = Roadmap.radius_neighbors(self.samples, self.radius)
+
+	def gather_neighbors(self, indices):
+		""" This function returns the neighbors of a set of samples.
+
+		Parameters:
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the samples.
+
+		Returns:
+			owners (:obj:`numpy.ndarray` of :obj:`int`): For each neighbor, the position in indices of the sample it belongs to.
+			neighbors (:obj:`numpy.ndarray` of :obj:`int`): The indices of the neighbors.
+			dist (:obj:`numpy.ndarray` of :obj:`float`): The distance from each sample to its neighbor.
+		"""
+		starts = self.neighbor_start[indices]
+		counts = self.neighbor_start[indices + 1] - starts
+		owners = np.repeat(np.arange(len(indices)), counts)
+		positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(starts, counts)
+		return owners, self.neighbor_indices[positions], self.neighbor_dist[positions]
+
+	def rrt_step(self,trial, print_vertex=True):
+		"""This function performs a single step/iteration using the FMT* algorithm, which expands the open vertex with the lowest cost.
+
+		Notes::
+
+			Step 1. Take the open vertex with the lowest cost from the wavefront
+
+			Step 2. Find its unvisited neighbors
+
+			Step 3. For each of them, find the open neighbor that gives the lowest cost
+
+			Step 4. Collision-check the edges to these parents all at once
+
+			Step 5. Record the connected neighbors and add them to the wavefront, and close the expanded vertex
+
+		Once the wavefront is empty all of the reachable samples are in the tree, and the step does nothing.
+
+		Note:
+			A step can add several vertices to the recorder, so the row of a vertex is not its iteration. The number of recorded vertices is kept in `recorder.n_vertices`.
+
+		"""
+		if print_vertex == True:
+			print("-- -- Expanding Vertex:", trial+1)
+
+		# Step 1. Take the open vertex with the lowest cost from the wavefront
+		while len(self.open_heap) > 0 and not self.is_open[self.open_heap[0][1]]:
+			heapq.heappop(self.open_heap)
+		if len(self.open_heap) == 0:
+			return
+		cost, z = heapq.heappop(self.open_heap)
+
+		# Step 2. Find its unvisited neighbors
+		owners, neighbors, dist = self.gather_neighbors(np.array([z]))
+		new = neighbors[self.is_unvisited[neighbors]]
+
+		if len(new) > 0:
+			# Step 3. For each of them, find the open neighbor that gives the lowest cost
+			owners, neighbors, dist = self.gather_neighbors(new)
+			is_open = self.is_open[neighbors]
+			owners, neighbors, costs = owners[is_open], neighbors[is_open], self.sample_costs[neighbors[is_open]] + dist[is_open]
+
+			order = np.lexsort((costs, owners))
+			first = order[np.unique(owners[order], return_index=True)[1]]
+			parents = neighbors[first]
+			costs = costs[first]
+
+			# Step 4. Collision-check the edges to these parents all at once
+			free = ~self.domain_object.edges_blocked(self.samples[parents], self.samples[new])
+
+			# Step 5. Record the connected neighbors and add them to the wavefront
+			self.add_vertices(new[free], parents[free], costs[free])
+
+		self.is_open[z] = False
+
+	def add_vertices(self, indices, parents, costs):
+		""" This function records a set of samples as new vertices of the tree and adds them to the wavefront.
+
+		Parameters:
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the samples.
+			parents (:obj:`numpy.ndarray` of :obj:`int`): The indices of the samples of their parents.
+			costs (:obj:`numpy.ndarray` of :obj:`float`): The costs of the paths to the samples.
+
+		"""
+		n_vertices = self.recorder.n_vertices
+		rows = np.arange(n_vertices, n_vertices + len(indices))
+
+		self.recorder.reserve(n_vertices + len(indices))
+		self.recorder.vertices[rows,:] = self.samples[indices]
+		self.recorder.parents[rows] = self.sample_rows[parents]
+		self.recorder.costs[rows] = costs
+		self.recorder.n_vertices = n_vertices + len(indices)
+
+		self.sample_rows[indices] = rows
+		self.sample_costs[indices] = costs
+		self.is_unvisited[indices] = False
+		self.is_open[indices] = True
+		for index, cost in zip(indices.tolist(), costs.tolist()):
+			heapq.heappush(self.open_heap, (cost, index))
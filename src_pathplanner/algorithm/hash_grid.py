@@ -0,0 +1,110 @@
+# hash_grid.py
+# Author(s): Edvard Bruun
+
+import itertools
+import math
+import numpy as np
+
+class HashGrid:
+	""" A uniform spatial hash grid used to find all vertices within a radius of a point.
+
+	The space is divided into square (cubic) cells of equal size. Each occupied cell is stored in a dictionary keyed by its integer cell coordinates, and holds the storage slots of the points that fall inside it. A radius query only visits the cells overlapping the query radius, so its cost depends on the local density of points and not on the total number of points stored.
+
+	"""
+
+	def __init__(self, cell_size, dim):
+		"""Initialize an empty HashGrid.
+
+		Parameters:
+			cell_size (:obj:`float`): The edge length of a grid cell. Queries are cheapest when the query radius is equal to the cell size.
+			dim (:obj:`int`): Dimensions of the stored points.
+
+		Attributes:
+			cell_size: see Parameters
+			dim: see Parameters
+
+			cells (:obj:`dict`):
+				Maps the integer coordinates of a cell (:obj:`tuple` of :obj:`int`) to the list of storage slots of the points inside it.
+			points (:obj:`numpy.ndarray` of :obj:`float`):
+				Storage for the coordinates of the inserted points. Grows by doubling, only the first `n_points` rows are in use.
+			ids (:obj:`numpy.ndarray` of :obj:`int`):
+				The user-specified index (e.g. the row in the :obj:`~solver.recorder.Recorder` object) of each stored point.
+			n_points (:obj:`int`):
+				The number of points stored in the grid.
+
+		"""
+		self.cell_size = float(cell_size)
+		self.dim = dim
+
+		self.cells = {}
+		self.points = np.zeros((64, dim), dtype=float)
+		self.ids = np.zeros(64, dtype=int)
+		self.n_points = 0
+
+	def __len__(self):
+		return self.n_points
+
+	def cell_of(self, point):
+		""" This function returns the integer coordinates of the cell containing a point.
+
+		Returns:
+			cell (:obj:`tuple` of :obj:`int`)
+		"""
+		return tuple(math.floor(x/self.cell_size) for x in point)
+
+	def insert(self, index, point):
+		""" This function adds a new point to the grid.
+
+		Parameters:
+			index (:obj:`int`): The index reported back by :meth:`~algorithm.hash_grid.HashGrid.query_radius()` for this point.
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the point.
+
+		"""
+		slot = self.n_points
+		if slot == self.points.shape[0]:
+			self.points = np.concatenate((self.points, np.zeros_like(self.points)))
+			self.ids = np.concatenate((self.ids, np.zeros_like(self.ids)))
+
+		self.points[slot,:] = point
+		self.ids[slot] = index
+		self.n_points += 1
+
+		self.cells.setdefault(self.cell_of(self.points[slot]), []).append(slot)
+
+	def query_radius(self, point, radius):
+		""" This function finds all stored points within a radius of the given point.
+
+		The candidate points are gathered from the cells overlapping the bounding box of the query circle (sphere) and their distances are computed in a single vectorized operation. Points on the perimeter are considered as inside, the same as :meth:`~input.shape_circle.Circle.is_point_inside()`.
+
+		Parameters:
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the query point.
+			radius (:obj:`float`): The query radius.
+
+		Returns:
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the points found, in increasing order.
+
+			distances (:obj:`numpy.ndarray` of :obj:`float`): The distances from the found points to the query point.
+
+		"""
+		q = np.asarray(point, dtype=float)
+		low = self.cell_of(q - radius)
+		high = self.cell_of(q + radius)
+
+		slots = []
+		for cell in itertools.product(*[range(l, h + 1) for l, h in zip(low, high)]):
+			bucket = self.cells.get(cell)
+			if bucket:
+				slots.extend(bucket)
+
+		if not slots:
+			return np.zeros(0, dtype=int), np.zeros(0, dtype=float)
+
+		diff = self.points[slots] - q
+		distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+		inside = distances <= radius
+
+		indices = self.ids[slots][inside]
+		distances = distances[inside]
+
+		order = np.argsort(indices, kind='stable')
+		return indices[order], distances[order]
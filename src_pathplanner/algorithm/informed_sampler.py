@@ -0,0 +1,150 @@
+# informed_sampler.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+import numpy as np
+
+from algorithm.sampler import Sampler
+
+class InformedSampler(Sampler):
+	""" A refillable buffer of random configurations drawn from the informed set of the current solution, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	Once a path of cost `c` to a goal point `x_g` is known, only the configurations `x` with `|x - x_s| + |x_g - x| <= c`, where `x_s` is the origin, can be on a shorter path to that point. These form a prolate ellipse (ellipsoid) with foci at the origin and the goal point. With several goals the informed set is the union of the ellipses of all goals.
+
+	Note:
+		The ellipse only covers the paths ending at the second focus. For a goal region, the caller passes a point and a cost that cover the whole region (see :meth:`~algorithm.rrt_star_informed.RRT_Star_Informed.update_informed_set()`), otherwise a shorter path ending elsewhere in the goal can lie outside of the informed set. The configurations are drawn uniformly from this set intersected with the domain shape, in batches, the same as the :class:`~algorithm.sample_buffer.SampleBuffer` class.
+
+	"""
+
+	def __init__(self, shape, start, batch_size=256, shrink_tolerance=0.01):
+		"""Initialize an InformedSampler without a solution (inactive).
+
+		Parameters:
+			shape (:obj:`~input.shape.Shape` object): The shape the configurations are restricted to (the domain).
+			start (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the origin, the first focus of all ellipses.
+			batch_size (:obj:`int`): The number of points drawn each time the buffer is refilled, before rejecting the points outside of the domain.
+			shrink_tolerance (:obj:`float`): The buffered points are only discarded when a path cost decreases by more than this fraction, see :meth:`~algorithm.informed_sampler.InformedSampler.set_solution()`.
+
+		Attributes:
+			start: see Parameters
+			shrink_tolerance: see Parameters
+
+			goals (:obj:`numpy.ndarray` of :obj:`float`):
+				The second focus (goal point) of each ellipse, one per row.
+			costs (:obj:`numpy.ndarray` of :obj:`float`):
+				The path cost of each ellipse, the sum of the distances of its points to the two foci.
+			centers, radii, rotations (:obj:`numpy.ndarray` of :obj:`float`):
+				The center, the radii (major axis first) and the rotation matrix of each ellipse, which maps the unit ball onto the ellipse.
+			batch_costs (:obj:`numpy.ndarray` of :obj:`float`):
+				The path costs of the ellipses the current batch was drawn from.
+
+		"""
+		super().__init__(shape, batch_size)
+		self.start = np.asarray(start, dtype=float)
+		self.shrink_tolerance = shrink_tolerance
+
+		self.goals = np.zeros((0, shape.dim), dtype=float)
+		self.costs = np.zeros(0, dtype=float)
+		self.clear()
+
+	@property
+	def is_active(self):
+		""" True if a solution has been set and the configurations are drawn from the informed set.
+		"""
+		return len(self.costs) > 0
+
+	def clear(self):
+		""" This function empties the buffer, the next point is drawn from a new batch.
+		"""
+		self.points = np.zeros((0, self.shape.dim), dtype=float)
+		self.n_used = 0
+		self.batch_costs = self.costs
+
+	def set_solution(self, goals, costs):
+		""" This function sets the ellipses of the informed set from the current best path to each goal.
+
+		Since the path costs only decrease, the ellipses of the current batch contain the new ellipses when the goal points are the same. The buffered points are then still handed out, unless a cost has decreased by more than the shrink tolerance since the batch was drawn. The buffer is always emptied when a goal point changed.
+
+		Parameters:
+			goals (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the second focus of each ellipse, one per row.
+			costs (:obj:`numpy.ndarray` of :obj:`float`): The cost of each ellipse, at least the cost of the best path to the focus.
+
+		"""
+		goals = np.asarray(goals, dtype=float).reshape(-1, self.shape.dim)
+		costs = np.asarray(costs, dtype=float).ravel()
+		if np.array_equal(goals, self.goals) and np.array_equal(costs, self.costs):
+			return
+
+		same_goals = np.array_equal(goals, self.goals)
+		self.goals = goals
+		self.costs = costs
+
+		dim = self.shape.dim
+		axis = goals - self.start
+		c_min = np.linalg.norm(axis, axis=1)
+
+		self.centers = (goals + self.start)/2.0
+		self.radii = np.zeros((len(costs), dim), dtype=float)
+		self.radii[:,0] = costs/2.0
+		self.radii[:,1:] = (np.sqrt(np.maximum(costs**2 - c_min**2, 0.0))/2.0)[:,np.newaxis]
+
+		self.rotations = np.zeros((len(costs), dim, dim), dtype=float)
+		for i in range(len(costs)):
+			self.rotations[i] = self.rotation_to_world(axis[i], c_min[i])
+
+		if not same_goals or np.any(costs < self.batch_costs*(1.0 - self.shrink_tolerance)):
+			self.clear()
+
+	@staticmethod
+	def rotation_to_world(axis, length):
+		""" This function returns the rotation matrix that maps the first coordinate axis onto the direction of the given axis.
+
+		The matrix is found from the singular value decomposition of the outer product of the axis direction and the first coordinate axis, as in the Informed RRT* paper (Gammell et al., 2014).
+		"""
+		dim = len(axis)
+		if length == 0:
+			return np.eye(dim)
+
+		u, s, vt = np.linalg.svd(np.outer(axis/length, np.eye(dim)[0]))
+		d = np.ones(dim)
+		d[-1] = np.linalg.det(u)*np.linalg.det(vt)
+		return u @ np.diag(d) @ vt
+
+	def draw_batch(self):
+		""" This function draws a batch of points from the informed set.
+
+		An ellipse is chosen for each point with a probability proportional to its volume, and a uniform point of the unit ball is mapped onto it. Points in the overlap of several ellipses are kept with a probability of one over the number of ellipses containing them, so that the union is sampled uniformly. The points outside of the domain shape are rejected.
+
+		"""
+		volumes = np.prod(self.radii, axis=1)
+		if volumes.sum() > 0:
+			weights = volumes/volumes.sum()
+		else:
+			weights = np.full(len(volumes), 1.0/len(volumes))
+
+		dim = self.shape.dim
+		which = np.random.choice(len(weights), size=self.batch_size, p=weights)
+
+		ball = np.random.normal(size=(self.batch_size, dim))
+		ball /= np.linalg.norm(ball, axis=1)[:,np.newaxis]
+		ball *= np.random.uniform(size=(self.batch_size, 1))**(1.0/dim)
+
+		points = self.centers[which] + np.einsum('nij,nj->ni', self.rotations[which], ball*self.radii[which])
+
+		if len(self.costs) > 1:
+			to_start = np.linalg.norm(points - self.start, axis=1)
+			to_goals = np.linalg.norm(points[:,np.newaxis,:] - self.goals[np.newaxis,:,:], axis=2)
+			n_inside = np.maximum((to_start[:,np.newaxis] + to_goals <= self.costs*(1.0 + 1e-12)).sum(axis=1), 1)
+			points = points[np.random.uniform(size=self.batch_size) < 1.0/n_inside]
+
+		return points[self.shape.points_inside(points)], self.batch_size
+
+	def refill(self):
+		""" This function replaces the current batch with a new batch of points from the informed set, and saves the path costs it was drawn for.
+		"""
+		super().refill()
+		self.batch_costs = self.costs
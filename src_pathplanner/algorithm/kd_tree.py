@@ -0,0 +1,231 @@
+# kd_tree.py
+# Author(s): Edvard Bruun
+
+import numpy as np
+
+class KDTree:
+	""" An incremental, bucketed k-d tree used to answer nearest-vertex queries while the RRT graph grows.
+
+	Vertices are inserted one at a time as they are recorded. Every leaf holds a bucket of up to `leaf_size` vertices and a bucket that overflows is split at the median of its widest coordinate. Since these splits follow the insertion order, the tree is rebuilt (rebalanced) from scratch each time the number of stored vertices doubles, which keeps the amortized cost of an insertion logarithmic.
+
+	"""
+
+	def __init__(self, dim, leaf_size=16):
+		"""Initialize an empty KDTree.
+
+		Parameters:
+			dim (:obj:`int`): Dimensions of the stored points.
+			leaf_size (:obj:`int`): Maximum number of points kept in a leaf bucket before it is split.
+
+		Attributes:
+			dim: see Parameters
+			leaf_size: see Parameters
+
+			points (:obj:`numpy.ndarray` of :obj:`float`):
+				Storage for the coordinates of the inserted points. Grows by doubling, only the first `n_points` rows are in use.
+			ids (:obj:`numpy.ndarray` of :obj:`int`):
+				The user-specified index (e.g. the row in the :obj:`~solver.recorder.Recorder` object) of each stored point.
+			n_points (:obj:`int`):
+				The number of points stored in the tree.
+			n_rebuild (:obj:`int`):
+				The number of points at which the tree is next rebuilt.
+
+		Note:
+			The nodes are stored in parallel lists (`split_dim`, `split_val`, `left`, `right`, `bucket`). For a leaf node `bucket[node]` is the list of storage slots of its points, for an internal node it is :obj:`None`. Node 0 is the root.
+
+		"""
+		self.dim = dim
+		self.leaf_size = leaf_size
+
+		self.points = np.zeros((64, dim), dtype=float)
+		self.ids = np.zeros(64, dtype=int)
+		self.n_points = 0
+		self.n_rebuild = 2*leaf_size
+
+		self.clear_nodes()
+		self.add_leaf([])
+
+	def __len__(self):
+		return self.n_points
+
+	def clear_nodes(self):
+		""" This function removes all nodes of the tree, the stored points are kept.
+		"""
+		self.split_dim = []
+		self.split_val = []
+		self.left = []
+		self.right = []
+		self.bucket = []
+
+	def insert(self, index, point):
+		""" This function adds a new point to the tree.
+
+		The point is routed down to its leaf bucket, which is split if it becomes larger than `leaf_size`. If the number of stored points reaches `n_rebuild` the whole tree is rebuilt instead.
+
+		Parameters:
+			index (:obj:`int`): The index reported back by :meth:`~algorithm.kd_tree.KDTree.nearest()` for this point.
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the point.
+
+		"""
+		slot = self.n_points
+		if slot == self.points.shape[0]:
+			self.points = np.concatenate((self.points, np.zeros_like(self.points)))
+			self.ids = np.concatenate((self.ids, np.zeros_like(self.ids)))
+
+		self.points[slot,:] = point
+		self.ids[slot] = index
+		self.n_points += 1
+
+		if self.n_points >= self.n_rebuild:
+			self.rebuild()
+			return
+
+		node = 0
+		while self.bucket[node] is None:
+			if self.points[slot,self.split_dim[node]] < self.split_val[node]:
+				node = self.left[node]
+			else:
+				node = self.right[node]
+
+		self.bucket[node].append(slot)
+		if len(self.bucket[node]) > self.leaf_size:
+			self.split_leaf(node)
+
+	def split_leaf(self, node):
+		""" This function turns a leaf node into an internal node with two leaf children.
+
+		The bucket is split at the median of the coordinate with the largest spread. Buckets whose points all share the same coordinates cannot be split and are left as they are.
+
+		Parameters:
+			node (:obj:`int`): The index of the leaf node.
+
+		"""
+		slots = np.asarray(self.bucket[node])
+		split = self.find_split(slots)
+		if split is None:
+			return
+
+		d, value = split
+		goes_left = self.points[slots,d] < value
+
+		self.bucket[node] = None
+		self.split_dim[node] = d
+		self.split_val[node] = value
+		self.left[node] = self.add_leaf(slots[goes_left].tolist())
+		self.right[node] = self.add_leaf(slots[~goes_left].tolist())
+
+	def add_leaf(self, slots):
+		""" This function appends a new leaf node holding the given storage slots.
+
+		Returns:
+			node (:obj:`int`): The index of the new node.
+		"""
+		self.bucket.append(slots)
+		self.split_dim.append(-1)
+		self.split_val.append(0.0)
+		self.left.append(-1)
+		self.right.append(-1)
+		return len(self.bucket) - 1
+
+	def find_split(self, slots):
+		""" This function finds the splitting coordinate and value for a set of storage slots.
+
+		Points with a coordinate strictly smaller than the returned value go to the left child, so the value is chosen so that both children are non-empty.
+
+		Returns:
+			split (:obj:`tuple`): The splitting dimension and value, or :obj:`None` if all points coincide.
+		"""
+		points = self.points[slots]
+		d = int(np.argmax(np.ptp(points, axis=0)))
+		values = np.sort(points[:,d])
+
+		value = values[len(values)//2]
+		if values[0] == value:
+			i = np.searchsorted(values, value, side='right')
+			if i == len(values):
+				return None
+			value = values[i]
+
+		return d, float(value)
+
+	def rebuild(self):
+		""" This function rebuilds a balanced tree from all of the stored points.
+
+		The next rebuild is scheduled for when the number of points has doubled.
+		"""
+		self.clear_nodes()
+		self.add_leaf([])
+
+		stack = [(0, np.arange(self.n_points))]
+		while stack:
+			node, slots = stack.pop()
+			split = None
+			if len(slots) > self.leaf_size:
+				split = self.find_split(slots)
+
+			if split is None:
+				self.bucket[node] = slots.tolist()
+				continue
+
+			d, value = split
+			goes_left = self.points[slots,d] < value
+
+			self.bucket[node] = None
+			self.split_dim[node] = d
+			self.split_val[node] = value
+			self.left[node] = self.add_leaf([])
+			self.right[node] = self.add_leaf([])
+
+			stack.append((self.left[node], slots[goes_left]))
+			stack.append((self.right[node], slots[~goes_left]))
+
+		self.n_rebuild = 2*self.n_points
+
+	def nearest(self, point):
+		""" This function finds the stored point closest to the given point.
+
+		The tree is searched depth-first, visiting the side of each split containing the query point first. A subtree is skipped when the distance to its splitting plane is larger than the best distance found so far. When several points are at the same distance, the one with the lowest index is returned.
+
+		Parameters:
+			point (:obj:`numpy.ndarray` of :obj:`float`): The query coordinates.
+
+		Returns:
+			index (:obj:`int`): The index of the closest point.
+
+			distance (:obj:`float`): The distance from the closest point to the query point.
+
+		"""
+		q = np.asarray(point, dtype=float)
+		q_list = q.tolist()
+
+		best_d2 = float('+inf')
+		best_index = -1
+
+		stack = [(0, 0.0)]
+		while stack:
+			node, bound = stack.pop()
+			if bound > best_d2:
+				continue
+
+			slots = self.bucket[node]
+			if slots is not None:
+				if slots:
+					diff = self.points[slots] - q
+					d2 = np.einsum('ij,ij->i', diff, diff)
+					k = np.argmin(d2)
+					index = self.ids[slots[k]]
+					if d2[k] < best_d2 or (d2[k] == best_d2 and index < best_index):
+						best_d2 = d2[k]
+						best_index = index
+				continue
+
+			delta = q_list[self.split_dim[node]] - self.split_val[node]
+			if delta < 0:
+				near, far = self.left[node], self.right[node]
+			else:
+				near, far = self.right[node], self.left[node]
+
+			stack.append((far, delta*delta))
+			stack.append((near, bound))
+
+		return int(best_index), float(np.sqrt(best_d2))
@@ -0,0 +1,266 @@
+# prm.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.rrt.RRT` class
+
+Imports the :class:`~algorithm.roadmap.Roadmap` class
+
+"""
+
+import os
+import numpy as np
+
+from algorithm.rrt import RRT
+from algorithm.roadmap import Roadmap
+
+
+class PRM(RRT):
+	""" A class for the multi-query Probabilistic Roadmap (PRM) algorithm, in its lazy (Lazy-PRM) or standard form, which inherits from the :class:`~algorithm.rrt.RRT` abstract class.
+
+	The roadmap (see :class:`~algorithm.roadmap.Roadmap`) only depends on the domain and its obstacles. It is read from a file keyed by the domain and obstacle information if one exists, and is otherwise built and saved to that file, so that the later runs on the same map only connect the origin and the goals to the roadmap and search the graph.
+
+	The graph is searched with Dijkstra's algorithm from the origin. With the "lazy_prm" method the edges are not collision-checked when the roadmap is built: the shortest path to each goal is found first, only the edges on these paths are checked, and the search is repeated without the blocked edges until all of the paths are free (Bohlin and Kavraki, 2000). With the "prm" method all of the roadmap edges are checked before the first search. The known edge states are saved with the roadmap, so they are never checked again.
+
+	"""
+
+	def __init__(self,domain_object,recorder,params):
+		"""Initializes with abstract base class definition, and loads or builds the roadmap.
+
+		The origin is connected to the roadmap samples within the connection radius. Each goal is reached through the roadmap samples inside it, and if there are none a free sample inside the goal is added to the query and connected to the roadmap in the same way as the origin.
+
+		Attributes:
+			lazy (:obj:`bool`):
+				True for the "lazy_prm" method, False for the "prm" method.
+			roadmap_file (:obj:`str`):
+				The .npz file of the roadmap, in the folder given by the optional "roadmap_folder" parameter ("./cache" by default).
+			roadmap (:obj:`~algorithm.roadmap.Roadmap` object):
+				The roadmap of the domain.
+			loaded (:obj:`bool`):
+				True if the roadmap was read from the file.
+			origin_neighbors, origin_dist (:obj:`numpy.ndarray`):
+				The roadmap samples connected to the origin, and their distance to it.
+			origin_state (:obj:`numpy.ndarray` of :obj:`int`):
+				The collision state of each edge from the origin, see :class:`~algorithm.roadmap.Roadmap`.
+			goal_members (:obj:`list` of :obj:`numpy.ndarray`):
+				The roadmap samples inside each goal.
+			goal_points (:obj:`list`):
+				The free point added inside each goal without roadmap samples, :obj:`None` for the other goals.
+			goal_neighbors, goal_dist, goal_state (:obj:`list`):
+				For each added goal point, the roadmap samples connected to it, their distance to it and the collision state of the edges, :obj:`None` for the other goals.
+			solved (:obj:`bool`):
+				True once the paths to all of the reachable goals are free and have been recorded.
+
+		"""
+		super().__init__(domain_object,recorder,params)
+
+		self.lazy = (self.params.get("method") != "prm")
+		self.roadmap_file = os.path.join(self.params.get("roadmap_folder", "./cache"), "roadmap_{}.npz".format(Roadmap.key(domain_object, self.params)[:16]))
+		self.roadmap = Roadmap.load(self.roadmap_file)
+		self.loaded = self.roadmap is not None
+		if not self.loaded:
+			self.roadmap = self.build_roadmap()
+
+		if not self.lazy:
+			self.roadmap.check_edges(domain_object, np.arange(len(self.roadmap.edge_ends)))
+
+		self.origin_neighbors, self.origin_dist = self.connect_point(domain_object.origin)
+		self.origin_state = np.zeros(len(self.origin_neighbors), dtype=np.int8)
+
+		self.goal_members = []
+		self.goal_points = []
+		self.goal_neighbors = []
+		self.goal_dist = []
+		self.goal_state = []
+		for goal in domain_object.goals:
+			members = np.nonzero(goal.points_inside(self.roadmap.samples))[0]
+			point = Roadmap.sample_free_point(domain_object, goal) if len(members) == 0 else None
+			self.goal_members.append(members)
+			self.goal_points.append(point)
+			if point is None:
+				self.goal_neighbors.append(None)
+				self.goal_dist.append(None)
+				self.goal_state.append(None)
+			else:
+				neighbors, dist = self.connect_point(point)
+				self.goal_neighbors.append(neighbors)
+				self.goal_dist.append(dist)
+				self.goal_state.append(np.zeros(len(neighbors), dtype=np.int8))
+
+		self.solved = False
+
+	def build_roadmap(self):
+		""" This function builds a new roadmap of the domain.
+
+		The number of samples is given by the optional "roadmap_size" parameter (`n_trials` by default). They are drawn with the sampler selected in the input parameters (see :meth:`~algorithm.rrt.RRT.create_sampler()`) and the samples inside an obstacle are discarded. The connection radius is given by the optional "connection_radius" parameter, and otherwise by the PRM* radius of the :meth:`~algorithm.roadmap.Roadmap.optimal_radius()` method, with the tuning factor given by the optional "radius_factor" parameter (0.1 by default).
+
+		Returns:
+			roadmap (:obj:`~algorithm.roadmap.Roadmap` object): The new roadmap.
+		"""
+		n_samples = self.params.get("roadmap_size", self.params["n_trials"])
+		samples = self.sample_buffer.next_batch(n_samples)
+		samples = samples[~self.domain_object.points_blocked(samples)]
+
+		radius = self.params.get("connection_radius")
+		if radius is None:
+			radius = Roadmap.optimal_radius(self.domain_object, n_samples, len(samples), self.params.get("radius_factor", 0.1))
+
+		return Roadmap(samples, radius)
+
+	def save_roadmap(self):
+		""" This function saves the roadmap, with the edge states found so far, to the roadmap file.
+		"""
+		self.roadmap.save(self.roadmap_file)
+
+	def connect_point(self, point):
+		""" This function finds the roadmap samples within the connection radius of a point.
+
+		Returns:
+			neighbors (:obj:`numpy.ndarray` of :obj:`int`): The roadmap samples.
+			dist (:obj:`numpy.ndarray` of :obj:`float`): Their distance to the point.
+		"""
+		dist = np.linalg.norm(self.roadmap.samples - np.asarray(point, dtype=float).ravel(), axis=1)
+		neighbors = np.nonzero(dist <= self.roadmap.radius)[0]
+		return neighbors, dist[neighbors]
+
+	def check_query_edges(self, point, neighbors, state, which):
+		""" This function finds the collision state of some of the edges from a point of the query (the origin or a goal point) to the roadmap, and returns True if any of them is blocked.
+
+		Parameters:
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the query point.
+			neighbors (:obj:`numpy.ndarray` of :obj:`int`): The roadmap samples connected to the point.
+			state (:obj:`numpy.ndarray` of :obj:`int`): The collision state of the edges to the neighbors, updated in place.
+			which (:obj:`numpy.ndarray` of :obj:`int`): The positions in neighbors of the edges to check.
+
+		"""
+		which = np.asarray(which, dtype=int)
+		unknown = which[state[which] == Roadmap.UNKNOWN]
+		if len(unknown) > 0:
+			points = np.repeat(np.asarray(point, dtype=float).reshape(1, -1), len(unknown), axis=0)
+			blocked = self.domain_object.edges_blocked(points, self.roadmap.samples[neighbors[unknown]])
+			state[unknown] = np.where(blocked, Roadmap.BLOCKED, Roadmap.FREE)
+		return np.any(state[which] == Roadmap.BLOCKED)
+
+	def rrt_step(self,trial, print_vertex=True):
+		"""This function performs a single step/iteration of the PRM algorithm, a search of the roadmap.
+
+		Notes::
+
+			Step 1. Find the shortest paths from the origin over the edges not known to be blocked
+
+			Step 2. Find the end of the shortest path to each goal
+
+			Step 3. Collision-check the edges of all of the paths at once
+
+			Step 4. If all of the paths are free, record them and save the roadmap
+
+		Once the paths have been recorded, the step does nothing. In the standard form all of the roadmap edges are checked beforehand, so the search is only repeated when an edge from the origin or a goal point is blocked.
+
+		Note:
+			A step can add several vertices to the recorder, so the row of a vertex is not its iteration. The number of recorded vertices is kept in `recorder.n_vertices`.
+
+		"""
+		if print_vertex == True:
+			print("-- -- Searching Roadmap:", trial+1)
+
+		if self.solved:
+			return
+
+		# Step 1. Find the shortest paths from the origin over the edges not known to be blocked
+		free = self.origin_state != Roadmap.BLOCKED
+		dist, pred, pred_edge = self.roadmap.shortest_paths(self.origin_neighbors[free], self.origin_dist[free])
+
+		# Step 2. Find the end of the shortest path to each goal
+		ends = [self.goal_path_end(g, dist) for g in range(len(self.goal_members))]
+
+		# Step 3. Collision-check the edges of all of the paths at once
+		edges = []
+		origin_edges = []
+		blocked = False
+		for g, (end, goal_edge) in enumerate(ends):
+			if end < 0:
+				continue
+			if goal_edge >= 0:
+				blocked |= self.check_query_edges(self.goal_points[g], self.goal_neighbors[g], self.goal_state[g], [goal_edge])
+			path = self.trace_path(end, pred)
+			edges.extend(pred_edge[path[1:]].tolist())
+			origin_edges.append(int(np.nonzero(self.origin_neighbors == path[0])[0][0]))
+
+		blocked |= self.check_query_edges(self.domain_object.origin, self.origin_neighbors, self.origin_state, origin_edges)
+		if len(edges) > 0:
+			blocked |= np.any(self.roadmap.check_edges(self.domain_object, edges))
+
+		# Step 4. If all of the paths are free, record them and save the roadmap
+		if not blocked:
+			self.record_paths(ends, dist, pred)
+			self.save_roadmap()
+			self.solved = True
+
+	def goal_path_end(self, g, dist):
+		""" This function finds the end of the shortest path to a goal.
+
+		Parameters:
+			g (:obj:`int`): The index of the goal.
+			dist (:obj:`numpy.ndarray` of :obj:`float`): The length of the shortest path to each roadmap sample.
+
+		Returns:
+			end (:obj:`int`): The roadmap sample at the end of the path (inside the goal, or connected to the goal point), -1 if the goal cannot be reached.
+			goal_edge (:obj:`int`): The position in goal_neighbors of the edge from the end sample to the goal point, -1 if the path ends inside the goal.
+		"""
+		if self.goal_points[g] is None:
+			members = self.goal_members[g]
+			if len(members) == 0 or np.isinf(dist[members]).all():
+				return -1, -1
+			return int(members[np.argmin(dist[members])]), -1
+
+		free = np.nonzero(self.goal_state[g] != Roadmap.BLOCKED)[0]
+		totals = dist[self.goal_neighbors[g][free]] + self.goal_dist[g][free]
+		if len(free) == 0 or np.isinf(totals).all():
+			return -1, -1
+		k = free[np.argmin(totals)]
+		return int(self.goal_neighbors[g][k]), int(k)
+
+	@staticmethod
+	def trace_path(end, pred):
+		""" This function returns the roadmap samples of a shortest path, from the sample connected to the origin to the end sample.
+		"""
+		path = [end]
+		while pred[path[-1]] >= 0:
+			path.append(int(pred[path[-1]]))
+		return np.array(path[::-1], dtype=int)
+
+	def record_paths(self, ends, dist, pred):
+		""" This function records the shortest paths to the goals in the :obj:`~solver.recorder.Recorder` object.
+
+		The paths come from the same shortest path tree, so they form a tree rooted at the origin. The roadmap samples on the paths (and the goal points) are recorded in order from the origin, each sample only once, with its parent and the length of its path as cost.
+
+		Parameters:
+			ends (:obj:`list` of :obj:`tuple`): The end of the path to each goal, see :meth:`~algorithm.prm.PRM.goal_path_end()`.
+			dist (:obj:`numpy.ndarray` of :obj:`float`): The length of the shortest path to each roadmap sample.
+			pred (:obj:`numpy.ndarray` of :obj:`int`): The previous sample on the shortest path to each roadmap sample.
+
+		"""
+		rows = {}
+		for g, (end, goal_edge) in enumerate(ends):
+			if end < 0:
+				continue
+
+			parent = 0
+			for sample in self.trace_path(end, pred).tolist():
+				if sample not in rows:
+					rows[sample] = self.add_vertex(self.roadmap.samples[sample], parent, dist[sample])
+				parent = rows[sample]
+
+			if goal_edge >= 0:
+				self.add_vertex(self.goal_points[g], parent, dist[end] + self.goal_dist[g][goal_edge])
+
+	def add_vertex(self, vertex, parent, cost):
+		""" This function records a new vertex and returns its row in the :obj:`~solver.recorder.Recorder` object.
+		"""
+		row = self.recorder.n_vertices
+		self.recorder.reserve(row + 1)
+		self.recorder.vertices[row,:] = vertex
+		self.recorder.parents[row] = parent
+		self.recorder.costs[row] = cost
+		self.recorder.n_vertices = row + 1
+		return row
@@ -0,0 +1,278 @@
+# roadmap.py
+# Author(s): Edvard Bruun
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import zipfile
+import zlib
+import numpy as np
+
+class Roadmap:
+	""" A probabilistic roadmap: a graph of free samples of a domain, connected to all of their neighbors within a radius.
+
+	The roadmap only depends on the domain and its obstacles, so it can be reused by every query (origin and goals) on the same map. The collision state of each edge is only found when it is needed, and is kept in the roadmap so that an edge is never checked twice. The roadmap, including the known edge states, can be saved to a .npz file keyed by a hash of the domain and obstacle information (see :meth:`~algorithm.roadmap.Roadmap.key()`).
+
+	"""
+
+	# The arrays saved in the roadmap files, change the version when the roadmap changes
+	FILE_VERSION = 1
+	FILE_ATTRIBUTES = ['samples', 'radius', 'edge_ends', 'edge_state']
+
+	UNKNOWN = 0
+	FREE = 1
+	BLOCKED = -1
+
+	def __init__(self, samples, radius, edge_state=None):
+		"""Initialize a Roadmap from its samples, with all of the edges within the radius.
+
+		Parameters:
+			samples (:obj:`numpy.ndarray` of :obj:`float`): The free samples, one per row.
+			radius (:obj:`float`): The connection radius.
+			edge_state (:obj:`numpy.ndarray` of :obj:`int`): Optional, the known state of each edge (in the order of `edge_ends`), all unknown by default.
+
+		Attributes:
+			samples: see Parameters
+			radius: see Parameters
+
+			neighbor_start, neighbor_indices, neighbor_dist (:obj:`numpy.ndarray`):
+				The neighbors of every sample, in compressed sparse row format, see :meth:`~algorithm.roadmap.Roadmap.radius_neighbors()`.
+			neighbor_edges (:obj:`numpy.ndarray` of :obj:`int`):
+				The edge of each neighbor entry. Both directions of an edge are stored as neighbors and share the same edge.
+			edge_ends (:obj:`numpy.ndarray` of :obj:`int`):
+				The two samples of each edge, one edge per row with the lowest index first.
+			edge_state (:obj:`numpy.ndarray` of :obj:`int`):
+				The collision state of each edge: UNKNOWN (not checked yet), FREE or BLOCKED.
+			n_checked (:obj:`int`):
+				The number of edges collision-checked since the roadmap was created or loaded.
+
+		"""
+		self.samples = np.asarray(samples, dtype=float)
+		self.radius = float(radius)
+		self.neighbor_start, self.neighbor_indices, self.neighbor_dist = self.radius_neighbors(self.samples, self.radius)
+
+		rows = np.repeat(np.arange(len(self.samples)), np.diff(self.neighbor_start))
+		pair_keys = np.minimum(rows, self.neighbor_indices)*len(self.samples) + np.maximum(rows, self.neighbor_indices)
+		edge_keys, self.neighbor_edges = np.unique(pair_keys, return_inverse=True)
+		self.edge_ends = np.stack([edge_keys//max(len(self.samples), 1), edge_keys % max(len(self.samples), 1)], axis=1).reshape(-1, 2)
+
+		if edge_state is None:
+			self.edge_state = np.zeros(len(self.edge_ends), dtype=np.int8)
+		else:
+			self.edge_state = np.asarray(edge_state, dtype=np.int8)
+		self.n_checked = 0
+
+	@staticmethod
+	def radius_neighbors(points, radius, chunk_size=512):
+		""" This function finds the neighbors of every point within a radius.
+
+		The distances between the points are computed with array operations, for a chunk of points against all of the points at a time, and the pairs closer than the radius are stored in compressed sparse row format.
+
+		Parameters:
+			points (:obj:`numpy.ndarray` of :obj:`float`): The points, one per row.
+			radius (:obj:`float`): The radius.
+			chunk_size (:obj:`int`): The number of points compared to all of the points at a time.
+
+		Returns:
+			start (:obj:`numpy.ndarray` of :obj:`int`): The indices and distances of the neighbors of point `i` are stored from `start[i]` to `start[i+1]`.
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the neighbors, in increasing order for each point.
+			dist (:obj:`numpy.ndarray` of :obj:`float`): The distances to the neighbors.
+		"""
+		n = len(points)
+		rows = [np.zeros(0, dtype=int)]
+		columns = [np.zeros(0, dtype=int)]
+		for start in range(0, n, chunk_size):
+			diff = points[start:start + chunk_size,np.newaxis,:] - points[np.newaxis,:,:]
+			close = np.einsum('ijk,ijk->ij', diff, diff) <= radius**2
+			close[np.arange(close.shape[0]), np.arange(start, start + close.shape[0])] = False
+			row, column = np.nonzero(close)
+			rows.append(row + start)
+			columns.append(column)
+
+		rows = np.concatenate(rows)
+		indices = np.concatenate(columns)
+		dist = np.linalg.norm(points[rows] - points[indices], axis=1)
+		neighbor_start = np.zeros(n + 1, dtype=int)
+		np.cumsum(np.bincount(rows, minlength=n), out=neighbor_start[1:])
+		return neighbor_start, indices, dist
+
+	@staticmethod
+	def optimal_radius(domain_object, n_drawn, n_free, eta=0.1):
+		""" This function returns the connection radius of the asymptotically optimal planners (PRM*, FMT*).
+
+		The radius is `2 (1 + eta) (1/d)^(1/d) (mu_free/zeta_d)^(1/d) (log(n)/n)^(1/d)`, where `d` is the dimension, `mu_free` the free area of the domain, `zeta_d` the volume of the unit ball and `n` the number of samples. The free area is estimated from the area of the domain bounding box, the fraction of its points inside the domain and the fraction of the samples that are free.
+
+		Parameters:
+			domain_object (:obj:`~input.domain_class.Domain` object): The domain.
+			n_drawn (:obj:`int`): The number of samples drawn.
+			n_free (:obj:`int`): The number of samples outside of the obstacles.
+			eta (:obj:`float`): The tuning factor of the radius.
+
+		Returns:
+			radius (:obj:`float`): The connection radius.
+		"""
+		dim = domain_object.dim
+		lower, upper = domain_object.domain.bounding_box()
+		box_points = lower + np.random.rand(4096, dim)*(upper - lower)
+		area = np.prod(upper - lower)*domain_object.domain.points_inside(box_points).mean()
+		mu_free = area*max(n_free, 1)/max(n_drawn, 1)
+		zeta = math.pi**(dim/2.0)/math.gamma(dim/2.0 + 1.0)
+
+		n = max(n_free + 1, 2)
+		return 2.0*(1.0 + eta)*(1.0/dim)**(1.0/dim)*(mu_free/zeta)**(1.0/dim)*(math.log(n)/n)**(1.0/dim)
+
+	@staticmethod
+	def sample_free_point(domain_object, shape, n_tries=16):
+		""" This function returns a free point inside a shape (e.g. a goal) and the domain, used to connect the shape to the samples.
+
+		Parameters:
+			domain_object (:obj:`~input.domain_class.Domain` object): The domain.
+			shape (:obj:`~input.shape.Shape` object): The shape.
+			n_tries (:obj:`int`): The number of points sampled inside the shape.
+
+		Returns:
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the point, or :obj:`None` if none of the n_tries points is free.
+		"""
+		points = shape.sample_random_points(n_tries)
+		free = domain_object.domain.points_inside(points)
+		free[free] = ~domain_object.points_blocked(points[free])
+		if not free.any():
+			return None
+		return points[np.argmax(free)]
+
+	@staticmethod
+	def key(domain_object, params):
+		""" This function returns the key of the roadmap of a domain, a hash of everything the roadmap depends on.
+
+		The hash covers the domain and obstacle information (including the content of the bitmap files of the free form shapes), the number of roadmap samples ("roadmap_size", `n_trials` by default), and the input parameters that change the connection radius or the distribution of the samples: "connection_radius", "radius_factor", "sampler", "goal_bias", "sampler_sigma", "uniform_fraction", "scramble" and "seed". The origin and the goals are not part of the key, since the same roadmap is used for every query.
+
+		Returns:
+			key (:obj:`str`): The hexadecimal digest of the hash.
+		"""
+		digest = hashlib.sha1()
+		for info in [domain_object.domain_info, domain_object.obstacle_info]:
+			digest.update(json.dumps(info, sort_keys=True, default=lambda value: np.asarray(value).tolist()).encode())
+		for shape_info in [domain_object.domain_info] + list(domain_object.obstacle_info.values()):
+			if "bitmap_file" in shape_info:
+				with open(shape_info["bitmap_file"], 'rb') as f:
+					digest.update(f.read())
+		digest.update("roadmap_size={};".format(params.get("roadmap_size", params["n_trials"])).encode())
+		for name in ["connection_radius", "radius_factor", "sampler", "goal_bias", "sampler_sigma", "uniform_fraction", "scramble", "seed"]:
+			digest.update("{}={};".format(name, params.get(name)).encode())
+		digest.update(str(Roadmap.FILE_VERSION).encode())
+		return digest.hexdigest()
+
+	@classmethod
+	def load(cls, file):
+		""" This function reads a roadmap from a .npz file.
+
+		Returns:
+			roadmap (:obj:`~algorithm.roadmap.Roadmap` object): The roadmap, or :obj:`None` if there is no usable file (missing, truncated or not a roadmap file).
+		"""
+		try:
+			with np.load(file) as data:
+				saved = {key: data[key] for key in cls.FILE_ATTRIBUTES}
+		except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile, zlib.error):
+			return None
+
+		roadmap = cls(saved['samples'], saved['radius'].item())
+		if not np.array_equal(roadmap.edge_ends, saved['edge_ends']):
+			return None
+		roadmap.edge_state = saved['edge_state'].astype(np.int8)
+		return roadmap
+
+	def save(self, file):
+		""" This function writes the roadmap, with the known edge states, to a .npz file.
+
+		The file is written under a temporary name and then renamed, so that a partially written file is never read. Failing to write the file (e.g. a read-only folder or a full disk) is not an error, and the partially written temporary file is removed.
+
+		"""
+		temporary_file = '{}.{}.tmp.npz'.format(file[:-4], os.getpid())
+		try:
+			os.makedirs(os.path.dirname(file) or '.', exist_ok=True)
+			np.savez_compressed(temporary_file, **{key: np.asarray(getattr(self, key)) for key in self.FILE_ATTRIBUTES})
+			os.replace(temporary_file, file)
+		except OSError:
+			try:
+				os.remove(temporary_file)
+			except OSError:
+				pass
+
+	def check_edges(self, domain_object, edges):
+		""" This function finds the collision state of a set of edges, and returns which of them are blocked.
+
+		Only the edges of unknown state are checked, all at once with the :meth:`~input.domain_class.Domain.edges_blocked()` method, and their state is saved in the roadmap.
+
+		Parameters:
+			domain_object (:obj:`~input.domain_class.Domain` object): The domain.
+			edges (:obj:`numpy.ndarray` of :obj:`int`): The edges.
+
+		Returns:
+			blocked (:obj:`numpy.ndarray` of :obj:`bool`): True where the edge is blocked.
+		"""
+		edges = np.asarray(edges, dtype=int)
+		unknown = np.unique(edges[self.edge_state[edges] == self.UNKNOWN])
+		if len(unknown) > 0:
+			ends = self.edge_ends[unknown]
+			blocked = domain_object.edges_blocked(self.samples[ends[:,0]], self.samples[ends[:,1]])
+			self.edge_state[unknown] = np.where(blocked, self.BLOCKED, self.FREE)
+			self.n_checked += len(unknown)
+		return self.edge_state[edges] == self.BLOCKED
+
+	def shortest_paths(self, sources, source_dist):
+		""" This function finds the shortest path from a set of source samples to every sample, over the edges that are not known to be blocked.
+
+		Dijkstra's algorithm, with edges of unknown state counted as free. The sources are the samples connected to the start of the query, with their distance to it.
+
+		Parameters:
+			sources (:obj:`numpy.ndarray` of :obj:`int`): The source samples.
+			source_dist (:obj:`numpy.ndarray` of :obj:`float`): The distance of the start of the query to each source.
+
+		Returns:
+			dist (:obj:`numpy.ndarray` of :obj:`float`): The length of the shortest path to each sample, :obj:`numpy.inf` if it cannot be reached.
+			pred (:obj:`numpy.ndarray` of :obj:`int`): The previous sample on the shortest path to each sample, -1 for the sources and the samples that cannot be reached.
+			pred_edge (:obj:`numpy.ndarray` of :obj:`int`): The edge from the previous sample, -1 for the sources and the samples that cannot be reached.
+		"""
+		n = len(self.samples)
+		dist = np.full(n, np.inf)
+		pred = np.full(n, -1, dtype=int)
+		pred_edge = np.full(n, -1, dtype=int)
+
+		start = self.neighbor_start.tolist()
+		indices = self.neighbor_indices.tolist()
+		lengths = self.neighbor_dist.tolist()
+		edges = self.neighbor_edges.tolist()
+		open_edge = (self.edge_state != self.BLOCKED).tolist()
+		dist_list = [math.inf]*n
+		done = [False]*n
+
+		heap = []
+		for source, d in zip(np.asarray(sources).tolist(), np.asarray(source_dist).tolist()):
+			if d < dist_list[source]:
+				dist_list[source] = d
+				heapq.heappush(heap, (d, source))
+
+		pred_list = pred.tolist()
+		pred_edge_list = pred_edge.tolist()
+		while len(heap) > 0:
+			d, u = heapq.heappop(heap)
+			if done[u]:
+				continue
+			done[u] = True
+			for k in range(start[u], start[u + 1]):
+				v = indices[k]
+				if done[v] or not open_edge[edges[k]]:
+					continue
+				new_d = d + lengths[k]
+				if new_d < dist_list[v]:
+					dist_list[v] = new_d
+					pred_list[v] = u
+					pred_edge_list[v] = edges[k]
+					heapq.heappush(heap, (new_d, v))
+
+		dist[:] = dist_list
+		pred[:] = pred_list
+		pred_edge[:] = pred_edge_list
+		return dist, pred, pred_edge
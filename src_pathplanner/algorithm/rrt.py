@@ -4,12 +4,30 @@
 """
 Imports the :class:`~algorithm.vertex.Vertex` class
 
+Imports the :class:`~algorithm.kd_tree.KDTree` class
+
+Imports the :class:`~algorithm.sample_buffer.SampleBuffer` class
+
+Imports the :class:`~algorithm.sampler_goal_bias.GoalBiasSampler` class
+
+Imports the :class:`~algorithm.sampler_gaussian.GaussianSampler` class
+
+Imports the :class:`~algorithm.sampler_bridge.BridgeSampler` class
+
+Imports the :class:`~algorithm.sampler_quasi_random.QuasiRandomSampler` class
+
 """
 
 from abc import ABC, abstractmethod
 import numpy as np
 
 from algorithm.vertex import Vertex
+from algorithm.kd_tree import KDTree
+from algorithm.sample_buffer import SampleBuffer
+from algorithm.sampler_goal_bias import GoalBiasSampler
+from algorithm.sampler_gaussian import GaussianSampler
+from algorithm.sampler_bridge import BridgeSampler
+from algorithm.sampler_quasi_random import QuasiRandomSampler
 
 
 class RRT(ABC):
@@ -19,7 +37,7 @@ class RRT(ABC):
 	def __init__(self,domain_object,recorder,params):
 		"""Initialize the RRT base class.
 
-		The first entries in the :class:`~solver.recorder.Recorder` object are initialized to their starting values (representing the user-specifed origin/starting point of the algorithm).
+		The first entries in the :class:`~solver.recorder.Recorder` object are initialized to their starting values (representing the user-specifed origin/starting point of the algorithm), which makes the origin the only recorded vertex.
 
 		Example::
 
@@ -29,6 +47,10 @@ class RRT(ABC):
 
 			self.recorder.costs[0] = 0
 
+			self.recorder.n_vertices = 1
+
+			self.nearest_index.insert(0, domain_object.origin)
+
 
 		Note:
 			The input parameters dictionary is assigned to an instance attribute with same name. The domain and recorder objects are assigned to instance attributes of the same name to be accessed by the algorithm throughout the iterations.
@@ -54,6 +76,10 @@ class RRT(ABC):
 				A single value representing the parent of the new vertex generated during an iteration. To be saved to the :obj:`~solver.recorder.Recorder` object.
 			new_cost (:obj:`float`):
 				A single value representing the incremental path cost (distance) from the parent to the new vertex generated during an iteration.				
+			nearest_index (:obj:`~algorithm.kd_tree.KDTree` object):
+				Spatial index of the recorded vertices, used to find the vertex closest to a new configuration. Each algorithm inserts its new vertices into the index as they are recorded.
+			sample_buffer (:obj:`~algorithm.sampler.Sampler` object):
+				Buffer of random configurations pre-generated in batches by the sampling strategy selected in the input parameters (see :meth:`~algorithm.rrt.RRT.create_sampler()`).
 
 		"""		
 		self.domain_object = domain_object
@@ -63,6 +89,12 @@ class RRT(ABC):
 		self.recorder.vertices[0,:] = domain_object.origin
 		self.recorder.parents[0] = -1
 		self.recorder.costs[0] = 0
+		self.recorder.n_vertices = 1
+
+		self.nearest_index = KDTree(domain_object.dim)
+		self.nearest_index.insert(0, domain_object.origin)
+
+		self.sample_buffer = self.create_sampler()
 
 		self.new_q = []
 		self.new_v = []
@@ -76,21 +108,61 @@ class RRT(ABC):
 		"""
 		pass
 
+	def create_sampler(self):
+		""" This function creates the sampler of the random configurations selected by the optional "sampler" input parameter.
+
+		The samplers are::
+
+			uniform: (default) uniform configurations from the domain, see :class:`~algorithm.sample_buffer.SampleBuffer`
+
+			goal_bias: a fraction "goal_bias" (0.05 by default) of the configurations drawn inside the goals, see :class:`~algorithm.sampler_goal_bias.GoalBiasSampler`
+
+			gaussian: configurations near the obstacle boundaries, see :class:`~algorithm.sampler_gaussian.GaussianSampler`
+
+			bridge: configurations inside the narrow passages between obstacles, see :class:`~algorithm.sampler_bridge.BridgeSampler`
+
+			halton, sobol: configurations from a low-discrepancy sequence, see :class:`~algorithm.sampler_quasi_random.QuasiRandomSampler`
+
+		The gaussian and bridge samplers use the optional "sampler_sigma" (the step size by default) and "uniform_fraction" (0.5 by default) parameters. The halton and sobol samplers use the optional "scramble" (true by default) and "seed" parameters.
+
+		Note:
+			Raises an exception if the sampler is not implemented.
+
+		Returns:
+			sampler (:obj:`~algorithm.sampler.Sampler` object): The new sampler.
+		"""
+		sampler = self.params.get("sampler", "uniform")
+		sigma = self.params.get("sampler_sigma", self.params.get("step_size"))
+		uniform_fraction = self.params.get("uniform_fraction", 0.5)
+
+		if sampler == "uniform":
+			return SampleBuffer(self.domain_object.domain)
+		elif sampler == "goal_bias":
+			return GoalBiasSampler(self.domain_object.domain, self.domain_object.goals, self.params.get("goal_bias", 0.05))
+		elif sampler == "gaussian":
+			return GaussianSampler(self.domain_object, sigma, uniform_fraction)
+		elif sampler == "bridge":
+			return BridgeSampler(self.domain_object, sigma, uniform_fraction)
+		elif sampler in QuasiRandomSampler.SEQUENCES:
+			return QuasiRandomSampler(self.domain_object.domain, sampler, self.params.get("scramble", True), self.params.get("seed"))
+		else:
+			raise Exception('The sampler is not implemented')
+
 	def new_config(self):
 		""" This function returns a new random configuration point found in the domain area.
 
-		Calls the :meth:`~algorithm.vertex.Vertex.new_config()` method.
+		Calls the :meth:`~algorithm.vertex.Vertex.new_config()` method, drawing the configuration from the `sample_buffer` attribute.
 
 		Returns:
 			new_q (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new random configuration.
 		"""
 
-		return Vertex.new_config(self.domain_object)
+		return Vertex.new_config(self.domain_object, self.sample_buffer)
 
 	def new_vertex(self):
 		""" This function returns a new vertex based on the random configuration generated.
 
-		Calls the :meth:`~algorithm.vertex.Vertex.new_vertex()` method.
+		Calls the :meth:`~algorithm.vertex.Vertex.new_vertex()` method, using the `nearest_index` attribute to find the closest vertex.
 
 		Returns:
 			new_v (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new vertex.
@@ -103,7 +175,8 @@ class RRT(ABC):
 		return Vertex.new_vertex(
 			self.recorder.vertices,
 			self.new_q,
-			self.params["step_size"]
+			self.params["step_size"],
+			self.nearest_index
 		)
 
 	def update_path_cost(self,new_parent,new_cost):
@@ -129,7 +202,7 @@ class RRT(ABC):
 	def is_new_edge_blocked(self,v1,v2):
 		""" This function checks whether a path between two vertices (edge) is blocked by an obstacle.
 		
-		Loops through the number of obstacles specified in the domain and checks whether the specified start and end points of an edge will be blocked. Calls the the :meth:`~input.shape.Shape.is_point_inside()` and :meth:`~input.shape.Shape.is_intersected_by_edge()` methods for the specific obstacle.
+		Calls the :meth:`~input.domain_class.Domain.is_edge_blocked()` method, which only checks the obstacles whose bounding box is touched by the edge. For each of them the :meth:`~input.shape.Shape.is_point_inside()` and :meth:`~input.shape.Shape.is_intersected_by_edge()` methods are called to check whether the specified start and end points of an edge will be blocked.
 
 		Parameters:
 			v1 (:obj:`numpy.ndarray` of :obj:`float`): coordinates of start vertex of a line.
@@ -141,10 +214,5 @@ class RRT(ABC):
 				True -- the edge is blocked
 				False -- the edge is not blocked
 		"""
-		for obstacle in self.domain_object.obstacles:
-			if(obstacle.is_point_inside(v1) or obstacle.is_point_inside(v2)):
-				return True
-			if(obstacle.is_intersected_by_edge(v1,v2)):
-				return True
-		return False
+		return self.domain_object.is_edge_blocked(v1,v2)
 
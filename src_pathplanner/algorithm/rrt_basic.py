@@ -30,7 +30,7 @@ class RRT_Basic(RRT):
 
 			Step 3. Keep sampling new configurations until a new vertex creates a free edge
 			
-			Step 4. Record the iteration data (update: recorder.vertices, recorder.parents, recorder.costs lists)
+			Step 4. Record the iteration data (update: recorder.vertices, recorder.parents, recorder.costs lists and the nearest vertex index)
 
 		"""
 		if print_vertex == True:
@@ -47,8 +47,11 @@ class RRT_Basic(RRT):
 		  self.new_q = self.new_config()
 		  self.new_v, self.new_parent, self.new_cost = self.new_vertex()
 
-		# Step 4. Record the iteration data (update: recorder.vertices, recorder.parents, recorder.costs lists)
+		# Step 4. Record the iteration data (update: recorder.vertices, recorder.parents, recorder.costs lists and the nearest vertex index)
+		self.recorder.reserve(trial + 1)
 		self.recorder.vertices[trial,:] = self.new_v
 		self.recorder.parents[trial] = self.new_parent
 		self.recorder.costs[trial] = self.recorder.costs[self.new_parent] + self.new_cost
+		self.recorder.n_vertices = trial + 1
+		self.nearest_index.insert(trial, self.new_v)
 
@@ -0,0 +1,237 @@
+# rrt_connect.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.rrt.RRT` class
+
+Imports the :class:`~algorithm.vertex.Vertex` class
+
+Imports the :class:`~algorithm.kd_tree.KDTree` class
+
+Imports the :class:`~algorithm.roadmap.Roadmap` class
+
+Imports the :class:`~solver.recorder.Recorder` class
+
+"""
+
+import numpy as np
+
+from algorithm.rrt import RRT
+from algorithm.vertex import Vertex
+from algorithm.kd_tree import KDTree
+from algorithm.roadmap import Roadmap
+from solver.recorder import Recorder
+
+
+class RRT_Connect(RRT):
+	""" A class for the bidirectional RRT-Connect algorithm, which inherits from the :class:`~algorithm.rrt.RRT` abstract class.
+
+	Two trees are grown, the start tree from the origin and the goal tree from a point sampled in the goal region. In each step one tree is extended towards a random configuration and the other tree is then greedily extended towards the new vertex until it reaches it or is blocked. The roles of the two trees are swapped after every step.
+
+	The start tree is stored in the :obj:`~solver.recorder.Recorder` object as for the other algorithms. The goal tree is stored in a second recorder, and once the trees meet the path of the goal tree from the meeting point to its root is copied into the start tree, so that the recorder holds a single tree with a path from the origin into the goal region. After that the algorithm continues as the Basic RRT algorithm.
+
+	"""
+
+	def __init__(self,domain_object,recorder,params):
+		"""Initializes with abstract base class definition.
+
+		Additional variables are initialized for the goal tree. Its root is sampled in the goal selected by the optional "goal_index" parameter (the first goal by default), at a point that is not blocked by an obstacle, with the :meth:`~algorithm.roadmap.Roadmap.sample_free_point()` method. If no free point is found in the goal (e.g. the goal is covered by an obstacle) the goal tree stays empty and the algorithm runs as the Basic RRT algorithm on the start tree from the first step.
+
+		An exception is raised if the domain has no goal with the given index.
+
+		Attributes:
+			goal_recorder (:obj:`~solver.recorder.Recorder` object):
+				Holds the vertices, parents and costs (distance to the root) of the goal tree.
+
+			goal_nearest_index (:obj:`~algorithm.kd_tree.KDTree` object):
+				Spatial index of the vertices of the goal tree.
+
+			trees (:obj:`list` of :obj:`tuple`):
+				The (recorder, spatial index) pairs of the start tree and the goal tree.
+
+			active_tree (:obj:`int`):
+				The index (in trees) of the tree extended towards the random configuration in the next step.
+
+			connected (:obj:`bool`):
+				True once the two trees have met, or from the start if no free goal tree root was found.
+
+			goal_vertex (:obj:`int`):
+				The index in the :obj:`~solver.recorder.Recorder` object of the root of the goal tree after the trees have met, -1 before.
+
+		"""
+		super().__init__(domain_object,recorder,params)
+
+		goal_index = self.params.get("goal_index", 0)
+		if not 0 <= goal_index < len(domain_object.goals):
+			raise Exception('The goal index {} is not a goal of the domain ({} goals)'.format(goal_index, len(domain_object.goals)))
+		goal_root = Roadmap.sample_free_point(domain_object, domain_object.goals[goal_index])
+
+		self.goal_recorder = Recorder(self.params)
+		self.goal_nearest_index = KDTree(domain_object.dim)
+		if goal_root is not None:
+			self.goal_recorder.vertices[0,:] = goal_root
+			self.goal_recorder.parents[0] = -1
+			self.goal_recorder.costs[0] = 0
+			self.goal_recorder.n_vertices = 1
+			self.goal_nearest_index.insert(0, goal_root)
+
+		self.trees = [(self.recorder, self.nearest_index), (self.goal_recorder, self.goal_nearest_index)]
+		self.active_tree = 0
+		self.connected = goal_root is None
+		self.goal_vertex = -1
+
+	def rrt_step(self,trial, print_vertex=True):
+		"""This function performs a single step/iteration using the RRT-Connect algorithm.
+
+		Notes::
+
+			Step 1. Find new configuration
+
+			Step 2. Extend the active tree towards the new configuration
+
+			Step 3. Connect the other tree to the new vertex of the active tree
+
+			Step 4. If the trees met, copy the path of the goal tree into the start tree
+
+			Step 5. Swap the active tree
+
+		Once the trees have met, the step of the Basic RRT algorithm is performed on the start tree instead (see :meth:`~algorithm.rrt_connect.RRT_Connect.basic_step()`).
+
+		Note:
+			A step can add several vertices to the recorder, so the row of a vertex is not its iteration. The number of recorded vertices is kept in `recorder.n_vertices`.
+
+		"""
+		if print_vertex == True:
+			print("-- -- Calculating Vertex:", trial+1)
+
+		if self.connected:
+			self.basic_step()
+			return
+
+		# Step 1. Find new configuration
+		self.new_q = self.new_config()
+
+		# Step 2. Extend the active tree towards the new configuration
+		active = self.trees[self.active_tree]
+		other = self.trees[1 - self.active_tree]
+		status, new_index = self.extend(active, self.new_q)
+
+		if status != "trapped":
+			# Step 3. Connect the other tree to the new vertex of the active tree
+			target = active[0].vertices[new_index].copy()
+			status, other_index = self.connect(other, target)
+
+			# Step 4. If the trees met, copy the path of the goal tree into the start tree
+			if status == "reached":
+				if self.active_tree == 0:
+					self.join(new_index, other_index)
+				else:
+					self.join(other_index, new_index)
+
+		# Step 5. Swap the active tree
+		self.active_tree = 1 - self.active_tree
+
+	def basic_step(self):
+		""" This function extends the start tree as in a step of the Basic RRT algorithm.
+
+		New configurations are sampled until the new vertex creates a free edge, and the vertex is then added to the start tree.
+
+		"""
+		self.new_q = self.new_config()
+		self.new_v, self.new_parent, self.new_cost = self.new_vertex()
+
+		while self.is_new_edge_blocked(self.recorder.vertices[self.new_parent],self.new_v):
+			self.new_q = self.new_config()
+			self.new_v, self.new_parent, self.new_cost = self.new_vertex()
+
+		self.add_vertex(self.trees[0], self.new_v, self.new_parent, self.new_cost)
+
+	def add_vertex(self, tree, vertex, parent, cost):
+		""" This function records a new vertex in a tree.
+
+		Parameters:
+			tree (:obj:`tuple`): The (recorder, spatial index) pair of the tree.
+			vertex (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new vertex.
+			parent (:obj:`int`): The index of the parent of the new vertex in the tree.
+			cost (:obj:`float`): The distance between the parent and the new vertex.
+
+		Returns:
+			index (:obj:`int`): The index of the new vertex in the tree.
+
+		"""
+		recorder, nearest_index = tree
+		index = recorder.n_vertices
+
+		recorder.reserve(index + 1)
+		recorder.vertices[index,:] = vertex
+		recorder.parents[index] = parent
+		recorder.costs[index] = recorder.costs[parent] + cost
+		recorder.n_vertices = index + 1
+		nearest_index.insert(index, vertex)
+
+		return index
+
+	def extend(self, tree, q):
+		""" This function extends a tree by one step towards a configuration.
+
+		The new vertex is created with the :meth:`~algorithm.vertex.Vertex.new_vertex()` method from the closest vertex of the tree, and is only added if the new edge is free.
+
+		Parameters:
+			tree (:obj:`tuple`): The (recorder, spatial index) pair of the tree.
+			q (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the configuration.
+
+		Returns:
+			status (:obj:`str`): "reached" if the configuration was added to the tree, "advanced" if a vertex one step size towards it was added, "trapped" if the edge was blocked.
+
+			index (:obj:`int`): The index of the new vertex in the tree, -1 if trapped.
+
+		"""
+		recorder, nearest_index = tree
+		new_v, parent, cost = Vertex.new_vertex(recorder.vertices, q, self.params["step_size"], nearest_index)
+
+		if self.is_new_edge_blocked(recorder.vertices[parent], new_v):
+			return "trapped", -1
+
+		index = self.add_vertex(tree, new_v, parent, cost)
+		if cost < self.params["step_size"]:
+			return "reached", index
+		return "advanced", index
+
+	def connect(self, tree, q):
+		""" This function greedily extends a tree towards a configuration until it is reached or the tree is blocked.
+
+		Returns:
+			status (:obj:`str`): "reached" or "trapped", see :meth:`~algorithm.rrt_connect.RRT_Connect.extend()`.
+
+			index (:obj:`int`): The index of the last vertex added to the tree, -1 if no vertex was added.
+
+		"""
+		status, index = "advanced", -1
+		while status == "advanced":
+			status, new_index = self.extend(tree, q)
+			if new_index >= 0:
+				index = new_index
+
+		return status, index
+
+	def join(self, start_index, goal_index):
+		""" This function copies the path of the goal tree from the meeting point to its root into the start tree.
+
+		The vertex `goal_index` of the goal tree is at the same position as the vertex `start_index` of the start tree. Its ancestors in the goal tree are added to the start tree one after the other, each with the previous one as parent, so that the root of the goal tree becomes a vertex of the start tree inside the goal.
+
+		Parameters:
+			start_index (:obj:`int`): The index of the meeting vertex in the start tree.
+			goal_index (:obj:`int`): The index of the meeting vertex in the goal tree.
+
+		"""
+		parent = start_index
+		child = goal_index
+		while self.goal_recorder.parents[child] >= 0:
+			next_child = int(self.goal_recorder.parents[child])
+			vertex = self.goal_recorder.vertices[next_child]
+			cost = np.linalg.norm(vertex - self.recorder.vertices[parent])
+			parent = self.add_vertex(self.trees[0], vertex, parent, cost)
+			child = next_child
+
+		self.goal_vertex = parent
+		self.connected = True
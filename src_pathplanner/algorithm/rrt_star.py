@@ -4,14 +4,17 @@
 """
 Imports the :class:`~algorithm.rrt.RRT` class
 
-Imports the :class:`~input.shape_circle.Circle` class
+Imports the :class:`~algorithm.hash_grid.HashGrid` class
+
+Imports the :class:`~algorithm.edge_cache.EdgeCache` class
 
 """
 
 import numpy as np
 
 from algorithm.rrt import RRT
-from input.shape_circle import Circle
+from algorithm.hash_grid import HashGrid
+from algorithm.edge_cache import EdgeCache
 
 
 class RRT_Star(RRT):
@@ -22,29 +25,36 @@ class RRT_Star(RRT):
 	def __init__(self,domain_object,recorder,params):
 		"""Initializes with abstract base class definition.
 		
-		Additional variables are initialized for the RRT Star algorithm. The first entry in any additional :class:`~solver.recorder.Recorder` object attributes are initialized.
+		Additional variables are initialized for the RRT Star algorithm. The origin is added to the neighborhood grid.
 
 		Example::
 
-			self.recorder.parents_history[0,0:2] = -1	
+			self.neighbor_grid.insert(0, domain_object.origin)	
 
 		Attributes:
-			neighbour_offset (:obj:`float`):
-				A 10% increase modifier. Used to define the rectangular extents around a new vertex that will be used to select a subset of vertices to check if they are inside the circular neighborhood.
+			neighbor_grid (:obj:`~algorithm.hash_grid.HashGrid` object):
+				Spatial hash grid of the recorded vertices, with a cell size equal to the neighborhood radius. The new vertex is inserted at the end of each step, once its neighborhood has been processed.
+
+			neighbor_indices (:obj:`numpy.ndarray` of :obj:`int`): 
+				The indices of the vertices that are found in the neighborhood of the newly generated vertex.
 
-			neighbor_indices (:obj:`list` of :obj:`int`): 
-				A list of the indices of the vertices that are found in the neighborhood of the newly generated vertex.
+			neighbor_dist (:obj:`numpy.ndarray` of :obj:`float`): 
+				The incremental path costs from all neighboring vertices to the newly generated vertex.	
 
-			neighbor_dist (:obj:`list` of :obj:`float`): 
-				A list of the incremental path costs from all neighboring vertices to the newly generated vertex.	
+			new_index (:obj:`int`):
+				The index of the newly generated vertex in the :obj:`~solver.recorder.Recorder` object, -1 before the first step.
+
+			edge_cache (:obj:`~algorithm.edge_cache.EdgeCache` object):
+				Cache of the collision results of the edges from the new vertex to its neighbors, shared by the parent selection and the re-wiring steps. Its `hits` and `misses` counters show how many collision checks were saved.
 
 		"""
 		super().__init__(domain_object,recorder,params)
-		self.neighbor_offset = 1.1 #10% larger radius to look in
-		self.neighbor_indices = []
-		self.neighbor_dist = []
-
-		self.recorder.parents_history[0,0:2] = -1
+		self.neighbor_grid = HashGrid(self.params["neighborhood"], domain_object.dim)
+		self.neighbor_grid.insert(0, domain_object.origin)
+		self.neighbor_indices = np.zeros(0, dtype=int)
+		self.neighbor_dist = np.zeros(0, dtype=float)
+		self.new_index = -1
+		self.edge_cache = EdgeCache()
 
 	def rrt_step(self,trial, print_vertex=True):
 		"""This function performs a single step/iteration using the RRT Star algorithm.
@@ -57,17 +67,17 @@ class RRT_Star(RRT):
 
 			Step 3. Keep sampling new configurations until a new vertex creates a free edge
 			
-			Step 4. Record the iteration data (update: recorder.vertices)
+			Step 4. Record the iteration data (update: recorder.vertices list, the nearest vertex index and the edge cache)
 
 			Step 5. Find the neighboring vertices in a radius around the new vertex
 
 			Step 6. Connect the new vertex to a neighboring vertex that will lead to the shortest total path
 
-			Step 7. Record the iteration data (update: recorder.parents, recorder.parents_history, recorder.costs lists)
+			Step 7. Record the iteration data (update: recorder.parents, recorder.costs lists)
 
-			Step 8. Optimize the current solution by rewiring the vertex/edge graph to shorten paths
+			Step 8. Optimize the current solution by rewiring the vertex/edge graph to shorten paths (update: recorder.rewire_events log)
 
-			Step 9. Record the iteration data (update: recorder.parents_history list)
+			Step 9. Record the iteration data (update: the neighborhood grid)
 
 		"""
 		if print_vertex == True:
@@ -84,8 +94,12 @@ class RRT_Star(RRT):
 			self.new_q = self.new_config()
 			self.new_v, self.new_parent, self.new_cost = self.new_vertex()			
 		
-		# Step 4. Record the iteration data (update: recorder.vertices list)
+		# Step 4. Record the iteration data (update: recorder.vertices list, the nearest vertex index and the edge cache)
+		self.recorder.reserve(trial + 1)
 		self.recorder.vertices[trial,:] = self.new_v
+		self.nearest_index.insert(trial, self.new_v)
+		self.new_index = trial
+		self.edge_cache.store(self.new_parent, trial, False)
 
 		# Step 5. Find the neighboring vertices in a radius around the new vertex 
 		self.find_vertices_in_neighborhood()
@@ -93,85 +107,38 @@ class RRT_Star(RRT):
 		# Step 6. Connect the new vertex to a neighboring vertex that will lead to the shortest total path
 		self.new_parent,self.new_cost = self.find_parent_shortest_path()
 
-		# Step 7. Record the iteration data (update: recorder.parents, recorder.parents_history, recorder.costs lists)
+		# Step 7. Record the iteration data (update: recorder.parents, recorder.costs lists)
 		self.recorder.parents[trial] = self.new_parent 
-		self.recorder.parents_history[:,trial*2] = self.recorder.parents
 		self.recorder.costs[trial] = self.update_path_cost(self.new_parent,self.new_cost)
+		self.recorder.n_vertices = trial + 1
 	
 
 
 		# Step 8. Optimize the current solution by rewiring the vertex/edge graph to shorten paths
 		self.rewire(trial)
 
-		# Step 9. Record the iteration data (update: recorder.parents_history list)
-		self.recorder.parents_history[:,(trial*2 + 1)] = self.recorder.parents
+		# Step 9. Record the iteration data (update: the neighborhood grid)
+		self.neighbor_grid.insert(trial, self.new_v)
 
 
 
 	def find_vertices_in_neighborhood(self):
 		""" This function finds the indices and distances to vertices that are found within a radius of the new vertex.
 
-		A :class:`~input.shape_circle.Circle` object is initialized with the neighborhood distance specified by the user as its radius. The :meth:`~input.shape_circle.Circle.is_point_inside()` method is used to check which vertices fall inside this circular neighborhood.
-		
-		To reduce the number of points that need to be checked, the :meth:`~algorithm.rrt_star.RRT_Star.find_indices_in_extents()` is used to a find a subset of vertices.
+		The :meth:`~algorithm.hash_grid.HashGrid.query_radius()` method of the `neighbor_grid` attribute is called with the neighborhood distance specified by the user as its radius. Only the grid cells overlapping the neighborhood are visited and the distances are computed in a single vectorized operation. Vertices on the perimeter of the neighborhood are included.
 
-		Indices of neighboring vertices are appended to the `neighbor_indices` list. Distances from the new vertex to the neighboring vertex are saved the the `neighbor_dist` list.
+		Indices of neighboring vertices are saved to the `neighbor_indices` array. Distances from the new vertex to the neighboring vertex are saved the the `neighbor_dist` array.
 
 		"""
-		del self.neighbor_indices[:]
-		del self.neighbor_dist[:]
-
-		neighbor_circle = Circle({
-			'dim': 2,
-			'shape_type':"circle",
-			'radius':self.params["neighborhood"],
-			'center':self.new_v})
-		
-		indices_in_box = self.find_indices_in_extents()
-	
-		for index in indices_in_box:
-
-			point = self.recorder.vertices[index,:]
-
-			if neighbor_circle.is_point_inside(point):
-
-				dist_new = np.linalg.norm(point - self.new_v)
-
-				self.neighbor_indices.append(index)
-				self.neighbor_dist.append(dist_new)
-
-
-	def find_indices_in_extents(self):
-		""" This function finds a subset of vertex indices in a rectangular domain around the new vertex.
-
-		Leveraging the computational speed of numpy array slicing to select a reduced set of vertices based on rectangular coordinates. As an additional buffer the rectangular extents are modified to be larger than the neighborhood radius by multiplying this value by the `neighbor_offset` variable.
-
-		Returns:
-			indices_in_box (:obj:`list` of :obj:`int`):
-				The indices of vertices found in a rectangular extent around the new vertex.
-
-		"""
-		offset = self.neighbor_offset
-		hx = [(self.new_v[0] - offset*self.params["neighborhood"]), (self.new_v[0] + offset*self.params["neighborhood"])]
-		hy = [(self.new_v[1] - offset*self.params["neighborhood"]), (self.new_v[1] + offset*self.params["neighborhood"])]
-
-		a = self.recorder.vertices[:,0] > hx[0]
-		b = self.recorder.vertices[:,0] < hx[1]
-		c = self.recorder.vertices[:,1] > hy[0]
-		d = self.recorder.vertices[:,1] < hy[1]
-
-		# indices of vertices found in bounding box
-		indices_in_box =  [i for i, x in enumerate(a&b&c&d) if x]
-
-		del indices_in_box[-1] #don't check last item since it's the new point itself
-
-		return indices_in_box
+		self.neighbor_indices, self.neighbor_dist = self.neighbor_grid.query_radius(
+			self.new_v,
+			self.params["neighborhood"])
 
 
 	def find_parent_shortest_path(self):
 		""" This function finds a vertex in the neighborhood that will lead to the lowest total cost to the new vertex.
 
-		Calls the the :meth:`~algorithm.rrt.RRT.update_path_cost()` method to find the new total costs to go from any of the neighboring vertices to the new vertex. The :meth:`~algorithm.rrt.RRT.is_new_edge_blocked()` method is called to determine whether the new edge is unobstructed. 
+		Calls the the :meth:`~algorithm.rrt.RRT.update_path_cost()` method to find the new total costs to go from any of the neighboring vertices to the new vertex. The :meth:`~algorithm.rrt_star.RRT_Star.is_neighbor_edge_blocked()` method is called to determine whether the new edge is unobstructed. 
 
 		The lowest cost neighbor vertex that leads to an unobstructed edge becomes the parent for the new vertex.
 
@@ -190,7 +157,7 @@ class RRT_Star(RRT):
 			if cost > lowest_cost:
 				pass
 			else:
-				if not self.is_new_edge_blocked(self.new_v,self.recorder.vertices[index]):
+				if not self.is_neighbor_edge_blocked(index):
 					lowest_cost = cost
 					new_parent_index = index
 					new_parent_dist = dist
@@ -203,14 +170,37 @@ class RRT_Star(RRT):
 
 		Checks to see if the total path from the new vertex to any of the remaining neighboring vertices leads to a shorter overall path. If it does then the connectivity of that neighboring vertex is changed so that the new vertex overwrites its old parent vertex.
 		
-		If a shorter path is found then the :meth:`~algorithm.rrt.RRT.is_new_edge_blocked()` method is called to determine whether the new edge is unobstructed. The vertex/edge connecticity is only rewired if the new edge is unobstructed.
+		If a shorter path is found then the :meth:`~algorithm.rrt_star.RRT_Star.is_neighbor_edge_blocked()` method is called to determine whether the new edge is unobstructed. The vertex/edge connecticity is only rewired if the new edge is unobstructed. Each change of parent is logged with the :meth:`~solver.recorder.Recorder.record_rewire()` method, and the reduction of the path cost is passed on to the vertices below the re-wired vertex with the :meth:`~solver.recorder.Recorder.propagate_cost()` method.
 
 		"""
 		for index,dist in zip(self.neighbor_indices, self.neighbor_dist):
 
 			if (self.recorder.costs[trial] + dist) < self.recorder.costs[index]:
 
-				if not self.is_new_edge_blocked(self.new_v,self.recorder.vertices[index]):
+				if not self.is_neighbor_edge_blocked(index):
+					old_cost = self.recorder.costs[index]
+					self.recorder.record_rewire(trial, index, self.recorder.parents[index], trial)
 					self.recorder.costs[index] = self.recorder.costs[trial] + dist
 					self.recorder.parents[index] = trial
+					self.recorder.propagate_cost(index, self.recorder.costs[index] - old_cost)
 
+
+	def is_neighbor_edge_blocked(self, index):
+		""" This function checks whether the edge from the new vertex to a neighboring vertex is blocked by an obstacle.
+
+		The result is looked up in the `edge_cache` attribute first, so that an edge checked during the parent selection is not checked again during the re-wiring. Otherwise the :meth:`~algorithm.rrt.RRT.is_new_edge_blocked()` method is called and its result is stored in the cache.
+
+		Parameters:
+			index (:obj:`int`): The index of the neighboring vertex.
+
+		Returns:
+			bool::
+
+				True -- the edge is blocked
+				False -- the edge is not blocked
+		"""
+		blocked = self.edge_cache.lookup(self.new_index, index)
+		if blocked is None:
+			blocked = self.is_new_edge_blocked(self.new_v,self.recorder.vertices[index])
+			self.edge_cache.store(self.new_index, index, blocked)
+		return blocked
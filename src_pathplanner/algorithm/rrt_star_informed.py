@@ -0,0 +1,106 @@
+# rrt_star_informed.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.rrt_star.RRT_Star` class
+
+Imports the :class:`~algorithm.vertex.Vertex` class
+
+Imports the :class:`~algorithm.informed_sampler.InformedSampler` class
+
+Imports the :class:`~solver.goal_tracker.GoalTracker` class
+
+"""
+
+import numpy as np
+
+from algorithm.rrt_star import RRT_Star
+from algorithm.vertex import Vertex
+from algorithm.informed_sampler import InformedSampler
+from solver.goal_tracker import GoalTracker
+
+
+class RRT_Star_Informed(RRT_Star):
+	""" A class for the Informed RRT Star algorithm, which inherits from the :class:`~algorithm.rrt_star.RRT_Star` class.
+
+	The steps of the algorithm are the same as for RRT Star. Once every goal has been reached, the new configurations are no longer drawn from the whole domain but from the informed set, the union of the ellipses of the configurations that could be on a shorter path to a goal (see :class:`~algorithm.informed_sampler.InformedSampler`). The informed set shrinks as the best paths improve.
+
+	The goals are regions, so a shorter path can end anywhere inside a goal, not only at the end vertex of the current best path. The second focus of the ellipse of a goal is therefore the center of a ball containing the goal (the circle itself for a circle goal, the ball around the bounding box for the other shapes), and the cost of the ellipse is the best path cost plus the radius of the ball. A point `x` on a path of cost `c` ending at `y` inside the ball is then in the ellipse, since `|x - x_s| + |x - center| <= |x - x_s| + |x - y| + radius <= c + radius`.
+
+	"""
+
+	def __init__(self,domain_object,recorder,params):
+		"""Initializes with the :class:`~algorithm.rrt_star.RRT_Star` class definition.
+
+		Attributes:
+			goal_tracker (:obj:`~solver.goal_tracker.GoalTracker` object):
+				Tracks the vertices that have reached each goal, to find the current best path to every goal. The :class:`~solver.solution.Solution` class uses this tracker instead of its own, so the vertices are only tested against the goals once.
+
+			informed_sampler (:obj:`~algorithm.informed_sampler.InformedSampler` object):
+				Buffer of random configurations drawn from the informed set, only used once every goal has been reached.
+
+			goal_centers, goal_radii (:obj:`numpy.ndarray` of :obj:`float`):
+				The center and the radius of a ball containing each goal, see :meth:`~algorithm.rrt_star_informed.RRT_Star_Informed.goal_balls()`.
+
+		"""
+		super().__init__(domain_object,recorder,params)
+		self.goal_tracker = GoalTracker(domain_object.goals, recorder)
+		self.informed_sampler = InformedSampler(domain_object.domain, domain_object.origin)
+		self.goal_centers, self.goal_radii = self.goal_balls(domain_object.goals)
+
+	def rrt_step(self,trial, print_vertex=True):
+		"""This function performs a single step/iteration using the RRT Star algorithm, and then updates the informed set with the :meth:`~algorithm.rrt_star_informed.RRT_Star_Informed.update_informed_set()` method.
+
+		"""
+		super().rrt_step(trial, print_vertex)
+		self.update_informed_set()
+
+	@staticmethod
+	def goal_balls(goals):
+		""" This function returns a ball containing each goal, the circle itself for a circle goal and the ball around the bounding box for the other shapes.
+
+		Parameters:
+			goals (:obj:`list` of :obj:`~input.shape.Shape`): The goals of the domain.
+
+		Returns:
+			centers (:obj:`numpy.ndarray` of :obj:`float`): The centers of the balls, one per row.
+			radii (:obj:`numpy.ndarray` of :obj:`float`): The radii of the balls.
+		"""
+		centers = []
+		radii = []
+		for goal in goals:
+			if goal.name == "circle":
+				centers.append(np.asarray(goal.center, dtype=float))
+				radii.append(float(goal.radius))
+			else:
+				lower, upper = goal.bounding_box()
+				centers.append((np.asarray(lower, dtype=float) + upper)/2.0)
+				radii.append(float(np.linalg.norm(np.asarray(upper, dtype=float) - lower))/2.0)
+		return np.array(centers, dtype=float), np.array(radii, dtype=float)
+
+	def update_informed_set(self):
+		""" This function passes the current best path to every goal to the informed sampler.
+
+		The new vertices are first tested against the goals with the :meth:`~solver.goal_tracker.GoalTracker.update()` method. Nothing is done until every goal has been reached. The ellipse of each goal has its second focus at the center of the ball containing the goal, and its cost is the best path cost plus the radius of the ball, so that the paths ending anywhere inside the goal are covered.
+
+		"""
+		self.goal_tracker.update()
+
+		best = [self.goal_tracker.best_vertex(i) for i in range(len(self.goal_tracker.goals))]
+		if len(best) == 0 or np.isnan(best).any():
+			return
+
+		self.informed_sampler.set_solution(self.goal_centers, self.recorder.costs[best] + self.goal_radii)
+
+	def new_config(self):
+		""" This function returns a new random configuration point.
+
+		The configuration is drawn from the informed set once it is known, and from the whole domain area before.
+
+		Returns:
+			new_q (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new random configuration.
+		"""
+		if self.informed_sampler.is_active:
+			return Vertex.new_config(self.domain_object, self.informed_sampler)
+
+		return super().new_config()
@@ -0,0 +1,75 @@
+# rrt_star_lazy.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.rrt_star.RRT_Star` class
+
+"""
+
+import numpy as np
+
+from algorithm.rrt_star import RRT_Star
+
+
+class RRT_Star_Lazy(RRT_Star):
+	""" A class for the RRT Star algorithm with lazy collision checking, which inherits from the :class:`~algorithm.rrt_star.RRT_Star` class.
+
+	The steps of the algorithm are the same as for RRT Star, but the neighbors are ordered by their total path cost before any edge is collision-checked. The parent selection stops at the first unobstructed neighbor and the re-wiring only checks the neighbors whose path would be shortened, so that far fewer edges are checked for each new vertex.
+
+	"""
+
+	def __init__(self,domain_object,recorder,params):
+		"""Initializes with the :class:`~algorithm.rrt_star.RRT_Star` class definition.
+
+		"""
+		super().__init__(domain_object,recorder,params)
+
+	def find_parent_shortest_path(self):
+		""" This function finds a vertex in the neighborhood that will lead to the lowest total cost to the new vertex.
+
+		The total costs to go from all of the neighboring vertices to the new vertex are computed at once and the neighbors are sorted by this cost. The :meth:`~algorithm.rrt_star.RRT_Star.is_neighbor_edge_blocked()` method is then called in that order, and the first neighbor with an unobstructed edge becomes the parent for the new vertex. Neighbors with a higher cost than the parent are never collision-checked.
+
+		If every edge to the neighborhood is obstructed, the nearest vertex found when the new vertex was created (the `new_parent` attribute) is kept as the parent.
+
+		Returns:
+			new_parent_index (:obj:`int`): The index of the vertex in the neighborhood that leads to the lowest cost unobstructed path to the new vertex
+			new_parent_dist (:obj:`float`): The incremental cost (distance) between the parent and new vertex
+
+		"""
+		indices = np.asarray(self.neighbor_indices, dtype=int)
+		dist = np.asarray(self.neighbor_dist, dtype=float)
+		costs = self.recorder.costs[indices] + dist
+
+		for k in np.argsort(costs, kind='stable'):
+			if not self.is_neighbor_edge_blocked(indices[k]):
+				return indices[k], dist[k]
+
+		return self.new_parent, self.new_cost
+
+	def rewire(self,trial):
+		""" This function updates the vertex conectivity in the neighboring area to reduce overall path costs.
+
+		The neighbors whose total path would be shortened by going through the new vertex are found at once. Only the edges to these neighbors are collision-checked with the :meth:`~algorithm.rrt_star.RRT_Star.is_neighbor_edge_blocked()` method, starting with the largest reduction of the path cost, and the connectivity is changed for those that are unobstructed. Each change of parent is logged with the :meth:`~solver.recorder.Recorder.record_rewire()` method and passed on to the subtree of the re-wired vertex with the :meth:`~solver.recorder.Recorder.propagate_cost()` method.
+
+		Since re-wiring a neighbor also lowers the costs of the neighbors below it, the reduction is checked again before each neighbor is re-wired.
+
+		"""
+		indices = np.asarray(self.neighbor_indices, dtype=int)
+		dist = np.asarray(self.neighbor_dist, dtype=float)
+		new_costs = self.recorder.costs[trial] + dist
+		savings = self.recorder.costs[indices] - new_costs
+
+		for k in np.argsort(-savings, kind='stable'):
+			if not savings[k] > 0:
+				break
+
+			index = indices[k]
+			old_cost = self.recorder.costs[index]
+			if not old_cost > new_costs[k]:
+				continue
+
+			if not self.is_neighbor_edge_blocked(index):
+				self.recorder.record_rewire(trial, index, self.recorder.parents[index], trial)
+				self.recorder.costs[index] = new_costs[k]
+				self.recorder.parents[index] = trial
+				self.recorder.propagate_cost(index, new_costs[k] - old_cost)
@@ -0,0 +1,31 @@
+# sample_buffer.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+from algorithm.sampler import Sampler
+
+class SampleBuffer(Sampler):
+	""" A refillable buffer of pre-generated random configurations, drawn uniformly from the domain. This is the "uniform" sampler, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	Drawing one random point at a time from a shape pays the Python and NumPy call overhead for every sample, including the samples that are rejected by the algorithms. The buffer instead draws a whole batch with the :meth:`~input.shape.Shape.sample_random_points()` method and hands the points out one by one, refilling itself when it runs empty.
+
+	"""
+
+	def __init__(self, shape, batch_size=1024):
+		"""Initialize an empty SampleBuffer.
+
+		Parameters:
+			shape (:obj:`~input.shape.Shape` object): The shape the configurations are sampled from (the domain).
+			batch_size (:obj:`int`): The number of points drawn each time the buffer is refilled.
+
+		"""
+		super().__init__(shape, batch_size)
+
+	def draw_batch(self):
+		""" This function draws a batch of points uniformly from the shape. Every point is accepted.
+		"""
+		return self.shape.sample_random_points(self.batch_size), self.batch_size
@@ -0,0 +1,119 @@
+# sampler.py
+# Author(s): Edvard Bruun
+
+from abc import ABC, abstractmethod
+import numpy as np
+
+class Sampler(ABC):
+	""" An abstract base class for the samplers of random configurations. The buffering and the acceptance statistics are shared by all samplers.
+
+	A sampler draws its configurations in batches and hands them out one by one with the :meth:`~algorithm.sampler.Sampler.next()` method, which is the interface used by the :meth:`~algorithm.vertex.Vertex.new_config()` method. Each sampling strategy only defines how a batch is drawn, in the :meth:`~algorithm.sampler.Sampler.draw_batch()` method. The strategies that reject some of their candidate points keep count of the candidates and the accepted points, so that the efficiency of a strategy can be compared on a given domain.
+
+	"""
+
+	@abstractmethod
+	def __init__(self, shape, batch_size=1024):
+		"""Initialize an empty Sampler.
+
+		Parameters:
+			shape (:obj:`~input.shape.Shape` object): The shape the configurations are sampled from (the domain).
+			batch_size (:obj:`int`): The number of candidate points drawn each time the buffer is refilled.
+
+		Attributes:
+			shape: see Parameters
+			batch_size: see Parameters
+
+			points (:obj:`numpy.ndarray` of :obj:`float`):
+				The current batch of sampled points.
+			n_used (:obj:`int`):
+				The number of points of the current batch already handed out.
+			n_candidates (:obj:`int`):
+				The total number of candidate points drawn by the strategy.
+			n_accepted (:obj:`int`):
+				The total number of candidate points accepted into a batch.
+			n_returned (:obj:`int`):
+				The total number of points handed out by the :meth:`~algorithm.sampler.Sampler.next()` method.
+
+		"""
+		self.shape = shape
+		self.batch_size = batch_size
+
+		self.points = np.zeros((0, shape.dim), dtype=float)
+		self.n_used = 0
+
+		self.n_candidates = 0
+		self.n_accepted = 0
+		self.n_returned = 0
+
+	def __len__(self):
+		return self.points.shape[0] - self.n_used
+
+	@property
+	def acceptance_rate(self):
+		""" The fraction of the candidate points accepted into a batch, 1.0 before the first batch.
+		"""
+		if self.n_candidates == 0:
+			return 1.0
+		return self.n_accepted/self.n_candidates
+
+	@abstractmethod
+	def draw_batch(self):
+		""" This function draws a batch of candidate points and returns the accepted ones. Empty placeholder in abstract class definition since each strategy draws its points in a different way.
+
+		Returns:
+			points (:obj:`numpy.ndarray` of :obj:`float`): The accepted points, one per row.
+
+			n_candidates (:obj:`int`): The number of candidate points that were drawn.
+		"""
+		pass
+
+	def refill(self):
+		""" This function replaces the current batch with a new batch of accepted points.
+
+		Batches are drawn with the :meth:`~algorithm.sampler.Sampler.draw_batch()` method until one of them has at least one accepted point.
+
+		"""
+		points = np.zeros((0, self.shape.dim), dtype=float)
+		while len(points) == 0:
+			points, n_candidates = self.draw_batch()
+			self.n_candidates += n_candidates
+			self.n_accepted += len(points)
+
+		self.points = points
+		self.n_used = 0
+
+	def next(self):
+		""" This function returns the next sampled point, refilling the buffer if it is empty.
+
+		Returns:
+			point (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the random configuration. The returned array is a copy and can be modified by the caller.
+		"""
+		if self.n_used == self.points.shape[0]:
+			self.refill()
+
+		point = self.points[self.n_used].copy()
+		self.n_used += 1
+		self.n_returned += 1
+		return point
+
+	def next_batch(self, n):
+		""" This function returns the next n sampled points at once, refilling the buffer as often as needed.
+
+		Parameters:
+			n (:obj:`int`): The number of points.
+
+		Returns:
+			points (:obj:`numpy.ndarray` of :obj:`float`): The (n,dim) coordinates of the random configurations.
+		"""
+		points = []
+		n_left = n
+		while n_left > 0:
+			if self.n_used == self.points.shape[0]:
+				self.refill()
+			count = min(n_left, self.points.shape[0] - self.n_used)
+			points.append(self.points[self.n_used:self.n_used + count])
+			self.n_used += count
+			n_left -= count
+
+		self.n_returned += n
+		return np.concatenate(points + [np.zeros((0, self.shape.dim))]).reshape(n, self.shape.dim)
@@ -0,0 +1,64 @@
+# sampler_bridge.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+import numpy as np
+
+from algorithm.sampler import Sampler
+
+class BridgeSampler(Sampler):
+	""" A sampler that concentrates its configurations inside the narrow passages between obstacles, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	The bridge test (Hsu et al., 2003) draws a uniform point and a second point at a normally distributed offset from it. If both points are inside an obstacle, the midpoint of the "bridge" between them is accepted when it is free. Such midpoints are found in gaps between obstacles that are narrower than the offset, and hardly anywhere else. A fraction of each batch is drawn uniformly from the domain so that the free space is still explored.
+
+	"""
+
+	def __init__(self, domain_object, sigma, uniform_fraction=0.5, batch_size=1024):
+		"""Initialize an empty BridgeSampler.
+
+		Parameters:
+			domain_object (:obj:`~input.domain_class.Domain` object): The domain, its shape and its obstacles.
+			sigma (:obj:`float`): The standard deviation of the offset between the two ends of a bridge.
+			uniform_fraction (:obj:`float`): The fraction of the candidates drawn uniformly from the domain and always accepted.
+			batch_size (:obj:`int`): The number of candidate points (or bridges) drawn each time the buffer is refilled.
+
+		Attributes:
+			domain_object: see Parameters
+			sigma: see Parameters
+			uniform_fraction: see Parameters
+
+		"""
+		super().__init__(domain_object.domain, batch_size)
+		self.domain_object = domain_object
+		self.sigma = sigma
+		self.uniform_fraction = uniform_fraction
+
+	def draw_batch(self):
+		""" This function draws a batch of uniform points and bridges, and keeps the uniform points and the free midpoints of the bridges with both ends blocked.
+
+		The end points of a bridge are only tested against the obstacles, but the midpoints must also be inside the domain. All of the candidates are drawn uniformly if the domain has no obstacles.
+
+		"""
+		if len(self.domain_object.obstacles) == 0:
+			n_uniform = self.batch_size
+		else:
+			n_uniform = np.random.binomial(self.batch_size, self.uniform_fraction)
+		n_bridges = self.batch_size - n_uniform
+
+		points_1 = self.shape.sample_random_points(n_bridges)
+		blocked = self.domain_object.points_blocked(points_1)
+
+		points_2 = points_1[blocked] + np.random.normal(scale=self.sigma, size=points_1[blocked].shape)
+		midpoints = (points_1[blocked] + points_2)/2.0
+		keep = self.domain_object.points_blocked(points_2)
+		keep[keep] = self.shape.points_inside(midpoints[keep])
+		keep[keep] = ~self.domain_object.points_blocked(midpoints[keep])
+
+		points = np.concatenate([
+			self.shape.sample_random_points(n_uniform),
+			midpoints[keep]]).reshape(-1, self.shape.dim)
+		return points[np.random.permutation(len(points))], self.batch_size
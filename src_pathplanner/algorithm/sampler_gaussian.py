@@ -0,0 +1,68 @@
+# sampler_gaussian.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+import numpy as np
+
+from algorithm.sampler import Sampler
+
+class GaussianSampler(Sampler):
+	""" A sampler that concentrates its configurations near the obstacle boundaries, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	Gaussian sampling (Boor et al., 1999) draws a uniform point and a second point at a normally distributed offset from it. The pair is only kept if exactly one of the two points is free, in which case the free point is accepted. The accepted points are therefore close to an obstacle, which is where the narrow passages are. A fraction of each batch is drawn uniformly from the domain so that the free space is still explored.
+
+	"""
+
+	def __init__(self, domain_object, sigma, uniform_fraction=0.5, batch_size=1024):
+		"""Initialize an empty GaussianSampler.
+
+		Parameters:
+			domain_object (:obj:`~input.domain_class.Domain` object): The domain, its shape and its obstacles.
+			sigma (:obj:`float`): The standard deviation of the offset between the two points of a pair.
+			uniform_fraction (:obj:`float`): The fraction of the candidates drawn uniformly from the domain and always accepted.
+			batch_size (:obj:`int`): The number of candidate points (or pairs of points) drawn each time the buffer is refilled.
+
+		Attributes:
+			domain_object: see Parameters
+			sigma: see Parameters
+			uniform_fraction: see Parameters
+
+		"""
+		super().__init__(domain_object.domain, batch_size)
+		self.domain_object = domain_object
+		self.sigma = sigma
+		self.uniform_fraction = uniform_fraction
+
+	def is_free(self, points):
+		""" This function checks which of a batch of points are inside the domain and not blocked by an obstacle.
+		"""
+		free = self.shape.points_inside(points)
+		free[free] = ~self.domain_object.points_blocked(points[free])
+		return free
+
+	def draw_batch(self):
+		""" This function draws a batch of uniform points and Gaussian pairs, and keeps the uniform points and the free point of each pair with exactly one free point.
+
+		All of the candidates are drawn uniformly if the domain has no obstacles.
+
+		"""
+		if len(self.domain_object.obstacles) == 0:
+			n_uniform = self.batch_size
+		else:
+			n_uniform = np.random.binomial(self.batch_size, self.uniform_fraction)
+		n_pairs = self.batch_size - n_uniform
+
+		points_1 = self.shape.sample_random_points(n_pairs)
+		points_2 = points_1 + np.random.normal(scale=self.sigma, size=points_1.shape)
+		free_1 = self.is_free(points_1)
+		free_2 = self.is_free(points_2)
+
+		points = np.concatenate([
+			self.shape.sample_random_points(n_uniform),
+			points_1[free_1 & ~free_2],
+			points_2[free_2 & ~free_1]]).reshape(-1, self.shape.dim)
+		return points[np.random.permutation(len(points))], self.batch_size
@@ -0,0 +1,54 @@
+# sampler_goal_bias.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+import numpy as np
+
+from algorithm.sampler import Sampler
+
+class GoalBiasSampler(Sampler):
+	""" A sampler that draws a fraction of its configurations inside the goals, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	Each configuration is drawn from one of the goal shapes with the probability `goal_bias`, and uniformly from the domain otherwise. The goal is chosen at random for each configuration. Pulling the tree towards the goals shortens the time to the first solution when the space between the origin and the goals is mostly free.
+
+	"""
+
+	def __init__(self, shape, goals, goal_bias=0.05, batch_size=1024):
+		"""Initialize an empty GoalBiasSampler.
+
+		Parameters:
+			shape (:obj:`~input.shape.Shape` object): The shape the configurations are sampled from (the domain).
+			goals (:obj:`list` of :obj:`~input.shape.Shape`): The goals of the domain.
+			goal_bias (:obj:`float`): The probability of drawing a configuration inside a goal.
+			batch_size (:obj:`int`): The number of candidate points drawn each time the buffer is refilled.
+
+		Attributes:
+			goals: see Parameters
+			goal_bias: see Parameters
+
+		"""
+		super().__init__(shape, batch_size)
+		self.goals = goals
+		self.goal_bias = goal_bias
+
+	def draw_batch(self):
+		""" This function draws a batch of points from the domain and the goals.
+
+		The number of goal points in the batch is drawn from a binomial distribution and the points are spread over the goals at random. The goal points outside of the domain shape are rejected, and the batch is shuffled so that the goal points are handed out in random order.
+
+		"""
+		n_goal = np.random.binomial(self.batch_size, self.goal_bias) if len(self.goals) > 0 else 0
+		points = [self.shape.sample_random_points(self.batch_size - n_goal)]
+
+		which = np.random.randint(len(self.goals), size=n_goal) if n_goal > 0 else []
+		for i, count in enumerate(np.bincount(which, minlength=len(self.goals))):
+			if count > 0:
+				goal_points = self.goals[i].sample_random_points(count)
+				points.append(goal_points[self.shape.points_inside(goal_points)])
+
+		points = np.concatenate(points).reshape(-1, self.shape.dim)
+		return points[np.random.permutation(len(points))], self.batch_size
@@ -0,0 +1,132 @@
+# sampler_quasi_random.py
+# Author(s): Edvard Bruun
+
+"""
+Imports the :class:`~algorithm.sampler.Sampler` class
+
+"""
+
+import numpy as np
+
+from algorithm.sampler import Sampler
+
+class QuasiRandomSampler(Sampler):
+	""" A sampler that draws its configurations from a low-discrepancy (quasi-random) sequence, which inherits from the :class:`~algorithm.sampler.Sampler` abstract class.
+
+	Pseudo-random points leave clumps and gaps in the domain, and the gaps take many extra samples to fill. The points of a Halton or Sobol sequence instead fill the unit square evenly at every length of the sequence. They are mapped onto the domain with the :meth:`~input.shape.Shape.map_unit_points()` method of the domain shape, and the points that fall outside of the shape are rejected.
+
+	The sequences are scrambled by default, which removes the regular patterns of the plain sequences while keeping their even spread. The scrambling is drawn from its own random generator, so that a given seed always gives the same sequence.
+
+	"""
+
+	SEQUENCES = ("halton", "sobol")
+	PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29)
+
+	def __init__(self, shape, sequence="halton", scramble=True, seed=None, batch_size=1024):
+		"""Initialize an empty QuasiRandomSampler at the start of the sequence.
+
+		Parameters:
+			shape (:obj:`~input.shape.Shape` object): The shape the configurations are sampled from (the domain).
+			sequence (:obj:`str`): The low-discrepancy sequence, "halton" or "sobol".
+			scramble (:obj:`bool`): True to scramble the sequence, False to use the plain (deterministic) sequence.
+			seed (:obj:`int`): The seed of the scrambling, a random scrambling is used if None.
+			batch_size (:obj:`int`): The number of points of the sequence drawn each time the buffer is refilled.
+
+		Attributes:
+			sequence: see Parameters
+			scramble: see Parameters
+
+			index (:obj:`int`):
+				The index of the next point of the sequence. The first point of the sequence (the origin of the unit square) is skipped.
+			permutations (:obj:`list` of :obj:`numpy.ndarray`):
+				Halton only, for each dimension the permutation of the digits at each position of the radical inverse, one per row.
+			shift (:obj:`numpy.ndarray` of :obj:`int`):
+				Sobol only, the random digital shift of each dimension, as a 32 bit integer.
+
+		"""
+		super().__init__(shape, batch_size)
+		if sequence not in self.SEQUENCES:
+			raise Exception('The quasi-random sequence is not implemented')
+		if sequence == "sobol" and shape.dim != 2:
+			raise Exception('The Sobol sequence is only implemented in two dimensions')
+
+		self.sequence = sequence
+		self.scramble = scramble
+		self.index = 1
+
+		random_state = np.random.RandomState(seed)
+		self.permutations = []
+		for base in self.PRIMES[:shape.dim]:
+			n_digits = int(np.ceil(53*np.log(2)/np.log(base)))
+			if scramble:
+				self.permutations.append(np.array([random_state.permutation(base) for j in range(n_digits)]))
+			else:
+				self.permutations.append(np.tile(np.arange(base), (n_digits, 1)))
+
+		if scramble:
+			self.shift = random_state.randint(0, 2**32, size=shape.dim, dtype=np.uint64)
+		else:
+			self.shift = np.zeros(shape.dim, dtype=np.uint64)
+
+	def halton(self, indices):
+		""" This function returns the points of the Halton sequence with the given indices.
+
+		Each coordinate is the radical inverse of the index in a different prime base: the digits of the index are mirrored around the decimal point. With scrambling (random digit-permutation scrambling), the digits at each position are replaced with their image by a random permutation drawn for that position, which also scrambles the leading zeros of the index.
+
+		Parameters:
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the points in the sequence.
+
+		Returns:
+			points (:obj:`numpy.ndarray` of :obj:`float`): The (n,dim) points of the unit square.
+		"""
+		points = np.zeros((len(indices), self.shape.dim), dtype=float)
+		for d, base in enumerate(self.PRIMES[:self.shape.dim]):
+			remaining = np.array(indices, dtype=np.int64)
+			scale = 1.0/base
+			for permutation in self.permutations[d]:
+				points[:,d] += permutation[remaining % base]*scale
+				remaining //= base
+				scale /= base
+		return points
+
+	def sobol(self, indices):
+		""" This function returns the points of the two dimensional Sobol sequence with the given indices.
+
+		The first coordinate is the radical inverse of the index in base 2, and the second uses the direction numbers of the primitive polynomial x + 1. The points are built from the Gray code of the index. With scrambling, each coordinate is XORed with a random digital shift, which keeps the points a (0,m,2)-net in base 2.
+
+		Parameters:
+			indices (:obj:`numpy.ndarray` of :obj:`int`): The indices of the points in the sequence.
+
+		Returns:
+			points (:obj:`numpy.ndarray` of :obj:`float`): The (n,2) points of the unit square.
+		"""
+		gray = np.array(indices, dtype=np.uint64)
+		gray ^= gray >> np.uint64(1)
+
+		directions = np.zeros((2, 32), dtype=np.uint64)
+		m = 1
+		for k in range(32):
+			directions[0,k] = 1 << (31 - k)
+			directions[1,k] = m << (31 - k)
+			m = (m << 1) ^ m
+
+		points = np.zeros((len(gray), 2), dtype=np.uint64)
+		for k in range(32):
+			bit = ((gray >> np.uint64(k)) & np.uint64(1)).astype(bool)
+			points[bit] ^= directions[:,k]
+		points ^= self.shift
+		return points.astype(float)/2.0**32
+
+	def draw_batch(self):
+		""" This function draws the next batch of points of the sequence and maps them onto the shape. The points outside of the shape are rejected.
+		"""
+		indices = np.arange(self.index, self.index + self.batch_size)
+		self.index += self.batch_size
+
+		if self.sequence == "halton":
+			unit_points = self.halton(indices)
+		else:
+			unit_points = self.sobol(indices)
+
+		points = self.shape.map_unit_points(unit_points)
+		return points[self.shape.points_inside(points)], self.batch_size
@@ -9,26 +9,31 @@ class Vertex():
 	"""
 
 	@classmethod
-	def new_config(cls,domain_object):
+	def new_config(cls,domain_object,sample_buffer=None):
 		""" This function returns a new random configuration (point) found in the domain area.
 
-		Calls The :meth:`~input.shape.Shape.sample_random_point()` method to generate a random configuration within the shape that defines the domain.
+		Calls The :meth:`~input.shape.Shape.sample_random_point()` method to generate a random configuration within the shape that defines the domain. If a sampler of pre-generated configurations is given, its :meth:`~algorithm.sampler.Sampler.next()` method is used instead, which amortizes the sampling overhead over a whole batch.
 
 		Parameters:
 			domain_object (:obj:`~input.domain_class.Domain` object):
 				Object representing the assembled solution domain.
+			sample_buffer (:obj:`~algorithm.sampler.Sampler` object):
+				Optional buffer of random configurations sampled from the domain.
 
 		Returns:
 			new_q (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new random configuration.
 		"""
-		new_q = domain_object.domain.sample_random_point()
+		if sample_buffer is None:
+			new_q = domain_object.domain.sample_random_point()
+		else:
+			new_q = sample_buffer.next()
 		return new_q
 
 	@classmethod
-	def new_vertex(cls, vertices, new_q, step_size):
+	def new_vertex(cls, vertices, new_q, step_size, nearest_index=None):
 		""" This function returns a new vertex in the domain area.
 
-		Calls The :meth:`~algorithm.vertex.Vertex.find_nearest_vertex()` method to find the vertex in the current vertices list in the :obj:`~solver.recorder.Recorder` object that is closest to the randomly generated configuration point.
+		Calls The :meth:`~algorithm.vertex.Vertex.find_nearest_vertex()` method to find the vertex in the current vertices list in the :obj:`~solver.recorder.Recorder` object that is closest to the randomly generated configuration point. If a spatial index of the vertices is given, its :meth:`~algorithm.kd_tree.KDTree.nearest()` method is used instead, which avoids scanning the full vertices list.
 
 		The new vertex is generated along the straight line connecting the closest vertex to the new configuration. The new vertex is at a maximum distance specified in the step size parameter set by the user. If the new configuration falls closer than the step size distance then the configuration is taken as the new vertex.
 
@@ -39,6 +44,8 @@ class Vertex():
 				The coordinates of the newly generated configuration.
 			step_size ( :obj:`float`):
 				The maximum distance between the closest vertex and the new vetex.					
+			nearest_index (:obj:`~algorithm.kd_tree.KDTree` object):
+				Optional spatial index holding the current set of vertices.
 
 		Returns:
 			new_v (:obj:`numpy.ndarray` of :obj:`float`): The coordinates of the new vertex.
@@ -48,7 +55,10 @@ class Vertex():
 			distance (:obj:`int`): The distance between the parent and the new vertex.
 
 		"""
-		index, distance = cls.find_nearest_vertex(vertices, new_q)
+		if nearest_index is None:
+			index, distance = cls.find_nearest_vertex(vertices, new_q)
+		else:
+			index, distance = nearest_index.nearest(new_q)
 		v_near = vertices[index]
 
 		if distance < step_size:
@@ -0,0 +1,202 @@
+# aabb_tree.py
+# Author(s): Vivek Kumar
+
+# Python modules
+import numpy as np
+
+class AABBTree():
+  """A static tree of axis aligned bounding boxes (AABB) used as the broad phase of the obstacle collision checks.
+
+  The tree is built once from the bounding boxes of the obstacles. Every node stores the box enclosing all the boxes below it, so a point or edge query only descends into the nodes whose box it touches and returns the few obstacles that need the exact (narrow phase) test
+  """
+  def __init__(self, lower, upper, leaf_size=2, tolerance=1.0e-9):
+    """Constructor method
+
+    Parameters:
+      lower (:obj:`np.ndarray`):
+        The (N,dim) numpy array of the lower corners of the boxes
+      upper (:obj:`np.ndarray`):
+        The (N,dim) numpy array of the upper corners of the boxes
+      leaf_size (:obj:`int`):
+        The maximum number of boxes in a leaf node
+      tolerance (:obj:`float`):
+        The boxes are enlarged by this value so that points and edges touching a box are always reported
+
+    Attributes:
+      lower, upper:
+        see Parameters, enlarged by the tolerance
+      box_lower, box_upper (:obj:`list`):
+        The lower and upper corners of each box as lists
+      leaf_size:
+        see Parameters
+      n_boxes (:obj:`int`):
+        The number of boxes stored in the tree
+      items (:obj:`np.ndarray`):
+        The indices of the boxes, ordered so that every leaf node holds a contiguous range
+      node_lower (:obj:`list`):
+        The lower corner of the box of each node
+      node_upper (:obj:`list`):
+        The upper corner of the box of each node
+      left (:obj:`list`):
+        The index of the left child of each node, -1 for a leaf node
+      right (:obj:`list`):
+        The index of the right child of each node, -1 for a leaf node
+      start (:obj:`list`):
+        The start of the range of items of each leaf node
+      stop (:obj:`list`):
+        The end of the range of items of each leaf node
+
+    Note:
+      Node 0 is the root. The boxes are stored as lists of floats, which are faster than numpy arrays for the scalar comparisons of a query
+    """
+    lower = np.asarray(lower, dtype=float) - tolerance
+    upper = np.asarray(upper, dtype=float) + tolerance
+
+    self.n_boxes = lower.shape[0]
+    self.leaf_size = leaf_size
+    self.lower = lower
+    self.upper = upper
+    self.box_lower = lower.tolist()
+    self.box_upper = upper.tolist()
+    self.items = np.arange(self.n_boxes)
+
+    self.node_lower = []
+    self.node_upper = []
+    self.left = []
+    self.right = []
+    self.start = []
+    self.stop = []
+
+    if self.n_boxes > 0:
+      self.build()
+
+  def __len__(self):
+    return self.n_boxes
+
+  def add_node(self, start, stop):
+    """Appends a new leaf node holding the items[start:stop] boxes and returns its index
+    """
+    items = self.items[start:stop]
+    self.node_lower.append(self.lower[items].min(axis=0).tolist())
+    self.node_upper.append(self.upper[items].max(axis=0).tolist())
+    self.left.append(-1)
+    self.right.append(-1)
+    self.start.append(start)
+    self.stop.append(stop)
+    return len(self.left) - 1
+
+  def build(self):
+    """Builds the tree top down
+
+    The boxes of a node are sorted along the axis with the largest spread of their centers and split in two halves, until a node holds at most leaf_size boxes
+    """
+    centers = 0.5*(self.lower + self.upper)
+    stack = [self.add_node(0, self.n_boxes)]
+    while stack:
+      node = stack.pop()
+      start = self.start[node]
+      stop = self.stop[node]
+      if stop - start <= self.leaf_size:
+        continue
+
+      items = self.items[start:stop]
+      axis = int(np.argmax(np.ptp(centers[items], axis=0)))
+      self.items[start:stop] = items[np.argsort(centers[items, axis], kind='stable')]
+
+      middle = (start + stop)//2
+      self.left[node] = self.add_node(start, middle)
+      self.right[node] = self.add_node(middle, stop)
+      stack.append(self.left[node])
+      stack.append(self.right[node])
+
+  @staticmethod
+  def is_point_in_box(lower, upper, point):
+    """Checks if a point is inside a box (boundary included)
+    """
+    for low, high, x in zip(lower, upper, point):
+      if(x < low or x > high):
+        return False
+    return True
+
+  @staticmethod
+  def is_edge_in_box(lower, upper, point_1, point_2):
+    """Checks if the line segment connecting two points touches a box (boundary included)
+
+    Uses the slab method: the segment parameter range [0,1] is clipped against the pair of planes bounding the box along each axis
+    """
+    t_min = 0.0
+    t_max = 1.0
+    for low, high, x_1, x_2 in zip(lower, upper, point_1, point_2):
+      delta = x_2 - x_1
+      if(delta == 0):
+        if(x_1 < low or x_1 > high):
+          return False
+        continue
+      t_low = (low - x_1)/delta
+      t_high = (high - x_1)/delta
+      if(t_low > t_high):
+        t_low, t_high = t_high, t_low
+      t_min = max(t_min, t_low)
+      t_max = min(t_max, t_high)
+      if(t_min > t_max):
+        return False
+    return True
+
+  def query(self, overlaps):
+    """Collects the indices of the boxes accepted by the overlaps(lower, upper) test
+
+    A node is only visited if its box is accepted, and the boxes of the items of a visited leaf node are tested individually
+
+    Returns:
+      indices (:obj:`list` of :obj:`int`):
+        The indices of the candidate boxes, in increasing order
+    """
+    if self.n_boxes == 0:
+      return []
+
+    found = []
+    stack = [0]
+    while stack:
+      node = stack.pop()
+      if not overlaps(self.node_lower[node], self.node_upper[node]):
+        continue
+      if self.left[node] == -1:
+        for item in self.items[self.start[node]:self.stop[node]].tolist():
+          if overlaps(self.box_lower[item], self.box_upper[item]):
+            found.append(item)
+      else:
+        stack.append(self.left[node])
+        stack.append(self.right[node])
+    found.sort()
+    return found
+
+  def query_point(self, point):
+    """Finds the boxes containing a point
+
+    Parameters:
+      point (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the point
+
+    Returns:
+      indices (:obj:`list` of :obj:`int`):
+        The indices of the boxes containing the point, in increasing order
+    """
+    point = np.asarray(point, dtype=float).ravel().tolist()
+    return self.query(lambda lower, upper: self.is_point_in_box(lower, upper, point))
+
+  def query_edge(self, point_1, point_2):
+    """Finds the boxes touched by the line segment connecting two points
+
+    Parameters:
+      point_1 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining one end of the edge
+      point_2 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the other end of the edge
+
+    Returns:
+      indices (:obj:`list` of :obj:`int`):
+        The indices of the boxes touched by the edge, in increasing order
+    """
+    point_1 = np.asarray(point_1, dtype=float).ravel().tolist()
+    point_2 = np.asarray(point_2, dtype=float).ravel().tolist()
+    return self.query(lambda lower, upper: self.is_edge_in_box(lower, upper, point_1, point_2))
@@ -8,6 +8,7 @@ from input.shape_circle import Circle
 from input.shape_rectangle import Rectangle
 from input.shape_free_form import FreeForm2D
 from input.obstacles_class import Obstacle
+from input.aabb_tree import AABBTree
 from input.parse_data_class import ParseDataJSON
 
 class Domain():
@@ -15,6 +16,13 @@ class Domain():
 
   Domain represents the spatial expanse in which the RRT algorithms looks for paths to reach the goal from the starting point (origin)
   """
+  # The rectangle and circle obstacles are only tested with the vectorized kernels when there are at least this many of the same shape.
+  # For fewer obstacles the overhead of the numpy calls is larger than the scalar tests of the candidates found by the AABB tree
+  PACKED_MIN_OBSTACLES = 32
+
+  # The collision modes of is_edge_blocked, see set_collision_mode
+  COLLISION_MODES = ("validated", "fast")
+
   def __init__(self, domain_info, obstacle_info, origin_goal_info):
     """Constructor method
 
@@ -41,6 +49,8 @@ class Domain():
         The point from where the rrt algorithm begins
       goal_info:
         The separated goal information
+      collision_mode:
+        The collision mode of is_edge_blocked, "validated" until changed with set_collision_mode
 
     """
     self.domain_info = domain_info
@@ -51,6 +61,7 @@ class Domain():
 
     self.origin = np.asarray(self.origin_goal_info["origin"])
     self.goal_info = self.origin_goal_info["goals"]
+    self.set_collision_mode("validated")
 
     self.create_domain()
     self.create_obstacles()
@@ -80,6 +91,311 @@ class Domain():
     self.obstacles = [Obstacle(self.obstacle_info[key], self.origin_goal_info).obstacle for key in self.obstacle_info]
     for obstacle in self.obstacles:
       assert(self.is_obstacle_inside(obstacle)==True)
+    self.create_rectangle_arrays()
+    self.create_circle_arrays()
+    self.create_obstacle_tree()
+
+  def create_rectangle_arrays(self):
+    """Packs the rectangle obstacles into arrays of their corners, so that they can all be tested in a single vectorized operation
+
+    Attributes:
+      rectangle_obstacles (:obj:`np.ndarray`):
+        The indices (in self.obstacles) of the rectangle obstacles
+      rectangle_lower (:obj:`np.ndarray`):
+        The (K,dim) numpy array of the lower left corners of the rectangle obstacles
+      rectangle_upper (:obj:`np.ndarray`):
+        The (K,dim) numpy array of the upper right corners of the rectangle obstacles
+      use_rectangle_arrays (:obj:`bool`):
+        True if the rectangle obstacles are tested with the arrays instead of the AABB tree (see PACKED_MIN_OBSTACLES)
+    """
+    self.rectangle_obstacles = np.array([i for i, obstacle in enumerate(self.obstacles) if obstacle.name=="rectangle"], dtype=int)
+    self.rectangle_lower = np.array([self.obstacles[i].bounding_box()[0] for i in self.rectangle_obstacles], dtype=float).reshape(-1, self.dim)
+    self.rectangle_upper = np.array([self.obstacles[i].bounding_box()[1] for i in self.rectangle_obstacles], dtype=float).reshape(-1, self.dim)
+    self.use_rectangle_arrays = len(self.rectangle_obstacles) >= self.PACKED_MIN_OBSTACLES
+
+  def create_circle_arrays(self):
+    """Packs the circle obstacles into arrays of their centers and radii, so that they can all be tested in a single vectorized operation
+
+    Attributes:
+      circle_obstacles (:obj:`np.ndarray`):
+        The indices (in self.obstacles) of the circle obstacles
+      circle_centers (:obj:`np.ndarray`):
+        The (K,dim) numpy array of the centers of the circle obstacles
+      circle_radii (:obj:`np.ndarray`):
+        The (K,) numpy array of the radii of the circle obstacles
+      use_circle_arrays (:obj:`bool`):
+        True if the circle obstacles are tested with the arrays instead of the AABB tree (see PACKED_MIN_OBSTACLES)
+    """
+    self.circle_obstacles = np.array([i for i, obstacle in enumerate(self.obstacles) if obstacle.name=="circle"], dtype=int)
+    self.circle_centers = np.array([self.obstacles[i].center for i in self.circle_obstacles], dtype=float).reshape(-1, self.dim)
+    self.circle_radii = np.array([self.obstacles[i].radius for i in self.circle_obstacles], dtype=float)
+    self.use_circle_arrays = len(self.circle_obstacles) >= self.PACKED_MIN_OBSTACLES
+
+  def create_obstacle_tree(self):
+    """Creates the broad phase acceleration structure over the bounding boxes of the obstacles that are not tested with the packed arrays
+
+    Attributes:
+      tree_obstacles (:obj:`np.ndarray`):
+        The indices (in self.obstacles) of the obstacles stored in the tree
+      obstacle_tree (:obj:`input.aabb_tree.AABBTree`):
+        The static tree of the obstacle bounding boxes, the box with index i belongs to self.obstacles[self.tree_obstacles[i]]
+    """
+    packed = set()
+    if(self.use_rectangle_arrays):
+      packed |= set(self.rectangle_obstacles.tolist())
+    if(self.use_circle_arrays):
+      packed |= set(self.circle_obstacles.tolist())
+    self.tree_obstacles = np.array([i for i in range(len(self.obstacles)) if i not in packed], dtype=int)
+    boxes = [self.obstacles[i].bounding_box() for i in self.tree_obstacles]
+    lower = np.array([box[0] for box in boxes], dtype=float).reshape(len(boxes), self.dim)
+    upper = np.array([box[1] for box in boxes], dtype=float).reshape(len(boxes), self.dim)
+    self.obstacle_tree = AABBTree(lower, upper)
+
+  def rectangles_containing_point(self, point):
+    """Checks which of the rectangle obstacles contain a point (boundary included)
+
+    Parameters:
+      point (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the point to be tested
+
+    Returns:
+      inside (:obj:`np.ndarray` of :obj:`bool`):
+        The (K,) mask over the rectangle obstacles
+    """
+    point = np.asarray(point, dtype=float).ravel()
+    return np.all((self.rectangle_lower <= point) & (point <= self.rectangle_upper), axis=1)
+
+  def rectangles_hit_by_edge(self, point_1, point_2):
+    """Checks which of the rectangle obstacles are hit by the edge connecting two points
+
+    Liang-Barsky slab test of the edge against all the rectangles at once: the range [0,1] of the edge parameter is clipped against the pair of lines bounding the rectangles along each axis, and a rectangle is hit if the clipped range is not empty. The rectangles are closed, so an edge touching a rectangle or with an end point inside it hits it
+
+    Parameters:
+      point_1 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining one end of the edge
+      point_2 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the other end of the edge
+
+    Returns:
+      hit (:obj:`np.ndarray` of :obj:`bool`):
+        The (K,) mask over the rectangle obstacles
+    """
+    point_1 = np.asarray(point_1, dtype=float).ravel()
+    delta = np.asarray(point_2, dtype=float).ravel() - point_1
+    if(np.all(delta != 0)):
+      # Entry and exit parameters of all the slabs at once
+      t_low = (self.rectangle_lower - point_1)/delta
+      t_high = (self.rectangle_upper - point_1)/delta
+      t_enter = np.minimum(t_low, t_high).max(axis=1)
+      t_exit = np.maximum(t_low, t_high).min(axis=1)
+      return (t_enter <= t_exit) & (t_enter <= 1.0) & (t_exit >= 0.0)
+
+    t_enter = np.zeros(len(self.rectangle_obstacles))
+    t_exit = np.ones(len(self.rectangle_obstacles))
+    hit = np.ones(len(self.rectangle_obstacles), dtype=bool)
+    for axis in range(self.dim):
+      low = self.rectangle_lower[:,axis]
+      high = self.rectangle_upper[:,axis]
+      if(delta[axis] == 0):
+        # Parallel to the slab, the edge must be between the lines
+        hit &= (low <= point_1[axis]) & (point_1[axis] <= high)
+      else:
+        t_low = (low - point_1[axis])/delta[axis]
+        t_high = (high - point_1[axis])/delta[axis]
+        t_enter = np.maximum(t_enter, np.minimum(t_low, t_high))
+        t_exit = np.minimum(t_exit, np.maximum(t_low, t_high))
+    return hit & (t_enter <= t_exit)
+
+  def circles_containing_point(self, point):
+    """Checks which of the circle obstacles contain a point (perimeter included)
+
+    Parameters:
+      point (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the point to be tested
+
+    Returns:
+      inside (:obj:`np.ndarray` of :obj:`bool`):
+        The (K,) mask over the circle obstacles
+    """
+    relative = self.circle_centers - np.asarray(point, dtype=float).ravel()
+    return np.einsum('ij,ij->i', relative, relative) <= self.circle_radii**2
+
+  def circles_hit_by_edge(self, point_1, point_2):
+    """Checks which of the circle obstacles are hit by the edge connecting two points
+
+    The closest point of the edge to every circle center is found at once, by projecting the centers on the edge and clamping the projection to the end points. A circle is hit if its closest point is within the radius, which covers an end point inside the circle, an edge crossing the circle and a tangent edge
+
+    Parameters:
+      point_1 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining one end of the edge
+      point_2 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the other end of the edge
+
+    Returns:
+      hit (:obj:`np.ndarray` of :obj:`bool`):
+        The (K,) mask over the circle obstacles
+    """
+    point_1 = np.asarray(point_1, dtype=float).ravel()
+    delta = np.asarray(point_2, dtype=float).ravel() - point_1
+    relative = self.circle_centers - point_1
+
+    length_squared = delta.dot(delta)
+    if(length_squared > 0):
+      t = relative.dot(delta)/length_squared
+      np.clip(t, 0.0, 1.0, out=t)
+      relative -= t[:,np.newaxis]*delta
+    relative *= relative
+    return relative.sum(axis=1) <= self.circle_radii**2
+
+  def set_collision_mode(self, collision_mode):
+    """Sets how much validation is done when checking the edges against the obstacles
+
+    In "validated" mode the is_intersected_by_edge method of every candidate obstacle asserts again that the end points are outside the obstacle. In "fast" mode these repeated tests are skipped, as is_edge_blocked has just tested the end points against the same obstacle. The result is the same in both modes, "fast" only drops the redundant work, which for the free form shapes is the most expensive part of the edge test
+
+    Parameters:
+      collision_mode (:obj:`str`):
+        One of COLLISION_MODES ("validated" or "fast")
+
+    Attributes:
+      collision_mode:
+        see Parameters
+      validate_edges (:obj:`bool`):
+        True in "validated" mode
+    """
+    if(collision_mode not in self.COLLISION_MODES):
+      raise Exception('The collision mode is not implemented')
+    self.collision_mode = collision_mode
+    self.validate_edges = (collision_mode=="validated")
+
+  def is_point_blocked(self, point):
+    """Checks if a point is inside any of the obstacles
+
+    The rectangle and circle obstacles are tested all at once if there are enough of them (see PACKED_MIN_OBSTACLES), and of the other obstacles only those whose bounding box contains the point are tested
+
+    Parameters:
+      point (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the point to be tested
+
+    Returns:
+        bool::
+
+        True -- The point is inside an obstacle
+        False -- The point is free
+    """
+    if(self.use_rectangle_arrays and self.rectangles_containing_point(point).any()):
+      return True
+    if(self.use_circle_arrays and self.circles_containing_point(point).any()):
+      return True
+    for index in self.obstacle_tree.query_point(point):
+      if(self.obstacles[self.tree_obstacles[index]].is_point_inside(point)):
+        return True
+    return False
+
+  def points_blocked(self, points):
+    """Checks which of a batch of points are inside any of the obstacles
+
+    The rectangle and circle obstacles with packed arrays are tested against all the points at once. Each of the other obstacles is only tested, with its points_inside method, against the points inside its bounding box
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the points to be tested
+
+    Returns:
+      blocked (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the point is inside an obstacle
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, self.dim)
+    blocked = np.zeros(len(points), dtype=bool)
+    if(self.use_rectangle_arrays):
+      inside = (self.rectangle_lower[np.newaxis,:,:] <= points[:,np.newaxis,:]) & (points[:,np.newaxis,:] <= self.rectangle_upper[np.newaxis,:,:])
+      blocked |= np.all(inside, axis=2).any(axis=1)
+    if(self.use_circle_arrays):
+      relative = points[:,np.newaxis,:] - self.circle_centers[np.newaxis,:,:]
+      blocked |= (np.einsum('ijk,ijk->ij', relative, relative) <= self.circle_radii**2).any(axis=1)
+    for index in range(self.obstacle_tree.n_boxes):
+      in_box = np.all((self.obstacle_tree.lower[index] <= points) & (points <= self.obstacle_tree.upper[index]), axis=1) & ~blocked
+      if(in_box.any()):
+        candidates = np.nonzero(in_box)[0]
+        blocked[candidates] = self.obstacles[self.tree_obstacles[index]].points_inside(points[candidates])
+    return blocked
+
+  def is_edge_blocked(self, point_1, point_2):
+    """Checks if the edge connecting two points is blocked by any of the obstacles
+
+    If there are enough of them (see PACKED_MIN_OBSTACLES), the rectangle obstacles and then the circle obstacles are tested first, all at once, returning on any hit. Of the other obstacles only those whose bounding box is touched by the edge are tested, in the order they were created. An obstacle blocks the edge if it contains one of the end points or if it is intersected by the edge. The end points are only tested again inside is_intersected_by_edge in "validated" mode (see set_collision_mode)
+
+    Parameters:
+      point_1 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining one end of the edge
+      point_2 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the other end of the edge
+
+    Returns:
+        bool::
+
+        True -- The edge is blocked
+        False -- The edge is free
+    """
+    if(self.use_rectangle_arrays and self.rectangles_hit_by_edge(point_1, point_2).any()):
+      return True
+    if(self.use_circle_arrays and self.circles_hit_by_edge(point_1, point_2).any()):
+      return True
+    for index in self.obstacle_tree.query_edge(point_1, point_2):
+      obstacle = self.obstacles[self.tree_obstacles[index]]
+      if(obstacle.is_point_inside(point_1) or obstacle.is_point_inside(point_2)):
+        return True
+      if(obstacle.is_intersected_by_edge(point_1, point_2, validate=self.validate_edges)):
+        return True
+    return False
+
+  def edges_blocked(self, points_1, points_2):
+    """Checks which of a batch of edges are blocked by any of the obstacles
+
+    Batch version of is_edge_blocked. The rectangle and circle obstacles with packed arrays are tested against all the edges at once, with the same slab and closest point tests. Each of the other obstacles is only tested, with its points_inside and edges_intersected methods, against the edges whose bounding box overlaps its bounding box
+
+    Parameters:
+      points_1 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      blocked (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the edge is blocked
+    """
+    points_1 = np.asarray(points_1, dtype=float).reshape(-1, self.dim)
+    points_2 = np.asarray(points_2, dtype=float).reshape(-1, self.dim)
+    delta = points_2 - points_1
+    blocked = np.zeros(len(points_1), dtype=bool)
+    if(self.use_rectangle_arrays):
+      start = points_1[:,np.newaxis,:]
+      step = delta[:,np.newaxis,:]
+      parallel = (step == 0)
+      in_slab = (self.rectangle_lower <= start) & (start <= self.rectangle_upper)
+      with np.errstate(divide='ignore', invalid='ignore'):
+        t_low = (self.rectangle_lower - start)/step
+        t_high = (self.rectangle_upper - start)/step
+      # Parallel to a slab, the edge is either always or never between its lines
+      t_enter = np.where(parallel, np.where(in_slab, -np.inf, np.inf), np.minimum(t_low, t_high)).max(axis=2)
+      t_exit = np.where(parallel, np.where(in_slab, np.inf, -np.inf), np.maximum(t_low, t_high)).min(axis=2)
+      blocked |= ((np.maximum(t_enter, 0.0) <= np.minimum(t_exit, 1.0))).any(axis=1)
+    if(self.use_circle_arrays):
+      relative = self.circle_centers[np.newaxis,:,:] - points_1[:,np.newaxis,:]
+      length_squared = np.einsum('ij,ij->i', delta, delta)
+      with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.einsum('ijk,ik->ij', relative, delta)/length_squared[:,np.newaxis]
+      t = np.clip(np.nan_to_num(t), 0.0, 1.0)
+      relative -= t[:,:,np.newaxis]*delta[:,np.newaxis,:]
+      blocked |= (np.einsum('ijk,ijk->ij', relative, relative) <= self.circle_radii**2).any(axis=1)
+    edge_lower = np.minimum(points_1, points_2)
+    edge_upper = np.maximum(points_1, points_2)
+    for index in range(self.obstacle_tree.n_boxes):
+      overlap = np.all((edge_lower <= self.obstacle_tree.upper[index]) & (self.obstacle_tree.lower[index] <= edge_upper), axis=1) & ~blocked
+      if(overlap.any()):
+        candidates = np.nonzero(overlap)[0]
+        obstacle = self.obstacles[self.tree_obstacles[index]]
+        blocked[candidates] = obstacle.points_inside(points_1[candidates]) | obstacle.points_inside(points_2[candidates]) | obstacle.edges_intersected(points_1[candidates], points_2[candidates])
+    return blocked
 
   def create_goals(self):
     """Creates the goals based on the shape and geometrical information provided in the origin-goal information list
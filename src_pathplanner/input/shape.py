@@ -50,6 +50,8 @@ class Shape(ABC):
         The (1,dim) numpy array defining one end of the edge
       point_2 (:obj:`np.ndarray`):
         The (1,dim) numpy array defining the other end of the edge
+      validate (:obj:`bool`):
+        If True (default) the end points are asserted to be outside the shape, if False this repeated test is skipped
     
     Returns:
         bool::
@@ -59,6 +61,50 @@ class Shape(ABC):
     """
     pass
 
+  def points_inside(self, points):
+    """ Checks which of a batch of points fall inside a shape.
+
+    The default implementation calls is_point_inside for every point. Shapes override it with a vectorized version.
+
+    Parameters:
+      points (:obj:`numpy.ndarray`):
+        The (M,dim) numpy array defining the points to be tested
+
+    Returns:
+      inside (:obj:`numpy.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the point is inside the shape
+    """
+    return np.array([self.is_point_inside(point) for point in points], dtype=bool)
+
+  def edges_intersected(self, points_1, points_2):
+    """ Checks which of a batch of edges are intersected by a shape.
+
+    The default implementation calls is_intersected_by_edge for every edge. Shapes override it with a vectorized version.
+
+    Parameters:
+      points_1 (:obj:`numpy.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`numpy.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      intersected (:obj:`numpy.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the edge intersects the shape
+    """
+    return np.array([self.is_intersected_by_edge(point_1, point_2) for point_1, point_2 in zip(points_1, points_2)], dtype=bool)
+
+  @abstractmethod
+  def bounding_box(self):
+    """ Abstract method for computing the axis aligned bounding box of a shape.
+
+    Returns:
+      lower (:obj:`np.ndarray`):
+        The lower corner of the box
+      upper (:obj:`np.ndarray`):
+        The upper corner of the box
+    """
+    pass
+
   @abstractmethod
   def sample_random_point(self):
     """ Abstract method for generating a random new point inside a shape.
@@ -67,4 +113,35 @@ class Shape(ABC):
       point (:obj:`np.ndarray`):
         A new point in the shape
     """
-    pass
\ No newline at end of file
+    pass
+
+  def sample_random_points(self, n):
+    """ Generates a batch of random new points inside a shape.
+
+    The default implementation calls sample_random_point n times. Shapes override it with a vectorized version.
+
+    Parameters:
+      n (:obj:`int`):
+        The number of points to generate
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of new points in the shape
+    """
+    return np.asarray([self.sample_random_point() for i in range(n)], dtype=float).reshape(n, self.dim)
+
+  def map_unit_points(self, points):
+    """ Maps a batch of points of the unit square onto the shape.
+
+    Used to turn a quasi-random sequence in the unit square into points in the shape. The default implementation maps the unit square onto the bounding box of the shape, so some of the points may fall outside of the shape. Shapes override it with a map onto the shape itself.
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of points with coordinates in [0,1)
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of mapped points
+    """
+    lower, upper = self.bounding_box()
+    return lower + np.asarray(points, dtype=float)*(upper - lower)
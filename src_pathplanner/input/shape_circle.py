@@ -53,7 +53,7 @@ class Circle(Shape):
     else:
       return False
 
-  def is_intersected_by_edge(self, point_1 , point_2):
+  def is_intersected_by_edge(self, point_1 , point_2, validate=True):
     """Checks if the line segment connecting two points intersects the circle
     
     The method is adopted from https://math.stackexchange.com/a/275537.
@@ -66,6 +66,8 @@ class Circle(Shape):
         The (1,dim) numpy array defining one end of the edge
       point_2 (:obj:`np.ndarray`):
         The (1,dim) numpy array defining the other end of the edge
+      validate (:obj:`bool`):
+        If True the end points are asserted to be outside the circle. Callers that have already tested the end points (see :meth:`~input.domain_class.Domain.is_edge_blocked()`) pass False to skip the repeated tests
 
     Returns:
       bool::
@@ -74,9 +76,9 @@ class Circle(Shape):
         False -- The edge does not intersect the circle
         
     """
-    
-    assert self.is_point_inside(point_1)==False
-    assert self.is_point_inside(point_2)==False
+    if(validate):
+      assert self.is_point_inside(point_1)==False
+      assert self.is_point_inside(point_2)==False
     
     # Create temporary variables to prevent mutation of original points
     tmp_point_1 = point_1.copy()
@@ -113,6 +115,70 @@ class Circle(Shape):
 
     return False
 
+  def points_inside(self, points):
+    """Checks which of a batch of points are inside the circle
+
+    Vectorized version of is_point_inside. A point on the perimeter is considered as inside
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the points to be tested
+
+    Returns:
+      inside (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the point is inside
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    return np.linalg.norm(self.center-points, axis=1) <= self.radius
+
+  def edges_intersected(self, points_1, points_2):
+    """Checks which of a batch of line segments intersect the circle
+
+    Vectorized version of is_intersected_by_edge, solving the quadratic system of all the segments at once. A tangent segment is considered as intersecting
+
+    Note:
+      As for is_intersected_by_edge, the end points of the segments are expected to be outside the circle. This is not asserted.
+
+    Parameters:
+      points_1 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      intersected (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the edge intersects or is tangent to the circle
+    """
+    # Move the coordinate system so that the center is at (0,0)
+    tmp_points_1 = np.asarray(points_1, dtype=float).reshape(-1, 2) - self.center[0:2]
+    tmp_points_2 = np.asarray(points_2, dtype=float).reshape(-1, 2) - self.center[0:2]
+    delta = tmp_points_2 - tmp_points_1
+
+    # Create the quadratic systems
+    a = delta[:,0]**2 + delta[:,1]**2
+    b = 2.0*(tmp_points_1[:,0]*delta[:,0]+tmp_points_1[:,1]*delta[:,1])
+    c = tmp_points_1[:,0]**2 + tmp_points_1[:,1]**2 - self.radius**2
+    discriminant = b**2 - 4.0*a*c
+
+    # Both points of intersection must be within the line segment (they coincide for a tangent)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      root = np.sqrt(np.where(discriminant < 0, 0.0, discriminant))
+      t_1 = (-b + root)/(2.0*a)
+      t_2 = (-b - root)/(2.0*a)
+
+    return (discriminant >= 0) & (0 <= t_1) & (t_1 <= 1) & (0 <= t_2) & (t_2 <= 1)
+
+  def bounding_box(self):
+    """Computes the axis aligned bounding box of the circle
+
+    Returns:
+      lower (:obj:`np.ndarray`):
+        The lower corner of the box
+      upper (:obj:`np.ndarray`):
+        The upper corner of the box
+    """
+    return self.center-self.radius, self.center+self.radius
+
   def sample_random_point(self):
     """Generates a random point in the circle
 
@@ -124,4 +190,50 @@ class Circle(Shape):
     r = self.radius*math.sqrt(random.random())
     theta = random.random()*2.0*math.pi
     new_random_point = np.asarray([[self.center[0]+r*math.cos(theta), self.center[1]+r*math.sin(theta)]]).flatten()
-    return new_random_point
\ No newline at end of file
+    return new_random_point
+
+  def sample_random_points(self, n):
+    """Generates a batch of random points in the circle
+
+    Vectorized version of sample_random_point, with the same uniform distribution of points
+
+    Parameters:
+      n (:obj:`int`):
+        The number of points to generate
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of new points
+    """
+    r = self.radius*np.sqrt(np.random.rand(n))
+    theta = np.random.rand(n)*2.0*math.pi
+    new_random_points = np.empty((n, 2), dtype=float)
+    new_random_points[:,0] = self.center[0]+r*np.cos(theta)
+    new_random_points[:,1] = self.center[1]+r*np.sin(theta)
+    return new_random_points
+
+  def map_unit_points(self, points):
+    """Maps a batch of points of the unit square onto the circle
+
+    Uses the concentric map of Shirley and Chiu (1997), which maps the squares around the center of the unit square onto circles around the center of the circle. The map preserves areas, so uniform points stay uniform, and it distorts the square much less than the polar map used by sample_random_points, so the even spread of a quasi-random sequence is kept
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of points with coordinates in [0,1)
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of points in the circle
+    """
+    square = 2.0*np.asarray(points, dtype=float).reshape(-1, 2)-1.0
+    a = square[:,0]
+    b = square[:,1]
+    horizontal = np.abs(a) > np.abs(b)
+    r = np.where(horizontal, a, b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      theta = np.where(horizontal, (math.pi/4.0)*b/a, math.pi/2.0-(math.pi/4.0)*a/b)
+    theta[r == 0] = 0.0
+    new_points = np.empty((len(square), 2), dtype=float)
+    new_points[:,0] = self.center[0]+self.radius*r*np.cos(theta)
+    new_points[:,1] = self.center[1]+self.radius*r*np.sin(theta)
+    return new_points
@@ -7,6 +7,10 @@ import numpy as np
 import sys
 import math
 import random
+import os
+import hashlib
+import zipfile
+import zlib
 # Thir party modules
 import cv2
 # Package modules
@@ -17,6 +21,15 @@ class FreeForm2D(Shape):
 
   The class generates 2D free form shapes using ASCII bitmap files.
   """
+  # Classification of the cells of the occupancy grid
+  OUTSIDE = 0
+  INSIDE = 1
+  BOUNDARY = 2
+
+  # The processed geometry saved in the cache files, change the version when the processing changes
+  CACHE_VERSION = 1
+  CACHE_ATTRIBUTES = ['hx', 'hy', 'all_points_array', 'x_min_val', 'x_max_val', 'y_min_val', 'y_max_val', 'centroid', 'lattice_shape', 'window', 'pixel_index', 'cell_state']
+
   def __init__(self, shape_info):
     """Constructor method
 
@@ -31,6 +44,8 @@ class FreeForm2D(Shape):
         The lower left corner of the bounding box of the free form
       bb_upper_right (:obj: `np.ndarray`)
         The upper right corner of the bounding box of the free form
+      use_cache (:obj: `bool`)
+        If True (default) the processed geometry is read from, or written to, a cache file next to the bitmap file
 
     """
     super().__init__(shape_info)
@@ -40,7 +55,75 @@ class FreeForm2D(Shape):
     self.file = shape_info['bitmap_file']
     self.bb_lower_left = shape_info['bb_lower_left'] # The lower left location of the bounding box
     self.bb_upper_right = shape_info['bb_upper_right'] # The upper right location of the bounding box
+    self.use_cache = shape_info.get('use_cache', True)
+
+    if(self.use_cache and self.load_cache()):
+      return
     self.obtain_geometric_info()
+    self.create_occupancy_grid()
+    if(self.use_cache):
+      self.save_cache()
+
+  def cache_file(self):
+    """Computes the name of the cache file of the free form
+
+    The processed geometry depends on the content of the bitmap file and on the bounding box, so the name of the cache file contains a hash of both. The cache files are kept in a cache folder next to the bitmap file
+
+    Returns:
+      file (:obj:`str`):
+        The path of the .npz cache file
+    """
+    digest = hashlib.sha1()
+    with open(self.file, 'rb') as f:
+      digest.update(f.read())
+    digest.update(np.asarray(self.bb_lower_left, dtype=float).tobytes())
+    digest.update(np.asarray(self.bb_upper_right, dtype=float).tobytes())
+    digest.update(str(self.CACHE_VERSION).encode())
+
+    name = os.path.splitext(os.path.basename(self.file))[0]
+    return os.path.join(os.path.dirname(self.file), 'cache', '{}_{}.npz'.format(name, digest.hexdigest()[:16]))
+
+  def load_cache(self):
+    """Reads the processed geometry from the cache file, if it exists
+
+    A cache file that cannot be read (missing, truncated or corrupt) is treated as a cache miss
+
+    Returns:
+      bool::
+
+        True -- The geometry was read from the cache
+        False -- There is no usable cache file
+    """
+    try:
+      with np.load(self.cache_file()) as data:
+        cached = {key: data[key] for key in self.CACHE_ATTRIBUTES}
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile, zlib.error):
+      return False
+
+    for key, value in cached.items():
+      if(value.ndim == 0):
+        value = value.item()
+      elif(key in ['lattice_shape', 'window']):
+        value = tuple(value.tolist())
+      setattr(self, key, value)
+    return True
+
+  def save_cache(self):
+    """Writes the processed geometry to the cache file
+
+    The file is written under a temporary name and then renamed, so that a partially written file is never read. Failing to write the cache (e.g. a read-only folder or a full disk) is not an error, and the partially written temporary file is removed
+    """
+    file = self.cache_file()
+    temporary_file = '{}.{}.tmp.npz'.format(file[:-4], os.getpid())
+    try:
+      os.makedirs(os.path.dirname(file), exist_ok=True)
+      np.savez_compressed(temporary_file, **{key: np.asarray(getattr(self, key)) for key in self.CACHE_ATTRIBUTES})
+      os.replace(temporary_file, file)
+    except OSError:
+      try:
+        os.remove(temporary_file)
+      except OSError:
+        pass
 
 
   def obtain_geometric_info(self):
@@ -78,60 +161,156 @@ class FreeForm2D(Shape):
     n_columns = self.img.shape[1]
     self.hx = 1./(n_rows-1) # This makes sure that the x-values are b/w 0-1
     self.hy = (1./(n_columns-1)) *((n_rows-1)/(n_columns-1))
-    
-    self.all_points_array = np.asarray([[j*self.hx, 1.0-i*self.hy] for i in range(n_rows) for j in range(n_columns) if self.img[i,j]==0])
 
-    # The left most corner 
-    self.x_min_val = np.min(self.all_points_array[:,0])
-    self.y_min_val = np.min(self.all_points_array[:,1])
-    
+    # The black pixels, in row major order
+    i, j = np.nonzero(self.img==0)
+    self.all_points_array = np.empty((len(i), 2), dtype=float)
+    self.all_points_array[:,0] = j*self.hx
+    self.all_points_array[:,1] = 1.0-i*self.hy
 
-    # Traslate the coordinates
-    self.all_points_array[:,0] = self.all_points_array[:,0]-self.x_min_val
-    self.all_points_array[:,1] = self.all_points_array[:,1]-self.y_min_val
-    
-    # The original bounding box
-    self.x_min_val = np.min(self.all_points_array[:,0])
-    self.y_min_val = np.min(self.all_points_array[:,1])
-    self.x_max_val = np.max(self.all_points_array[:,0])
-    self.y_max_val = np.max(self.all_points_array[:,1])
-    
-    original_bb_width = self.x_max_val - self.x_min_val
-    original_bb_height = self.y_max_val - self.y_min_val
+    # Traslate the coordinates so that the left most corner is at (0,0), this is the original bounding box
+    self.all_points_array -= np.min(self.all_points_array, axis=0)
+    original_bb_size = np.max(self.all_points_array, axis=0)
 
-    new_bb_width = self.bb_upper_right[0] - self.bb_lower_left[0]
-    new_bb_height = self.bb_upper_right[1] - self.bb_lower_left[1]
+    # Scale and translate the coordinates to fit the new bounding box
+    new_bb_size = np.array([self.bb_upper_right[0] - self.bb_lower_left[0], self.bb_upper_right[1] - self.bb_lower_left[1]])
+    scale = new_bb_size/original_bb_size
+    self.all_points_array *= scale
+    self.all_points_array += np.array([self.bb_lower_left[0], self.bb_lower_left[1]])
 
-    x_scale = new_bb_width/original_bb_width
-    y_scale = new_bb_height/original_bb_height
+    self.x_min_val, self.y_min_val = np.min(self.all_points_array, axis=0)
+    self.x_max_val, self.y_max_val = np.max(self.all_points_array, axis=0)
 
-    self.all_points_array[:,0] = self.all_points_array[:,0]*x_scale
-    self.all_points_array[:,1] = self.all_points_array[:,1]*y_scale
+    self.hx = self.hx*scale[0]
+    self.hy = self.hy*scale[1]
+    # Compute the centroid of the shape
+    self.centroid = np.mean(self.all_points_array, axis=0)
 
-    self.all_points_array[:,0] = self.all_points_array[:,0]+self.bb_lower_left[0]
-    self.all_points_array[:,1] = self.all_points_array[:,1]+self.bb_lower_left[1]
+  def create_occupancy_grid(self):
+    """Rasterizes the free form into a grid with one cell per bitmap pixel
 
-    self.x_min_val = np.min(self.all_points_array[:,0])
-    self.y_min_val = np.min(self.all_points_array[:,1])
-    self.x_max_val = np.max(self.all_points_array[:,0])
-    self.y_max_val = np.max(self.all_points_array[:,1])
+    A point is inside the free form if a point of the free form lies within the tolerance radius, max(hx,hy)*2.1, and within the y band, 2.1*hy, around it. This is precomputed for every cell of the pixel lattice, so that a point query becomes an index computation plus an array lookup.
 
-    self.hx = self.hx*x_scale
-    self.hy = self.hy*y_scale
-    # Compute the centroid of the shape
-    self.centroid = np.mean(self.all_points_array, axis=0)
+    The following steps are performed::
+      Step 1. Store the index (in all_points_array) of the point of the free form at each node of the pixel lattice
+
+      Step 2. For every offset within the search window, compare the cells with the point of the free form at that offset
+
+      Step 3. Classify a cell as inside if one point of the free form covers the whole cell, as outside if no point of the free form covers any part of it, and as boundary otherwise
+
+    Attributes:
+      lattice_shape (:obj: `tuple`)
+        The number of lattice nodes along the x and y directions
+      window (:obj: `tuple`)
+        The number of lattice nodes, along the x and y directions, within which a point of the free form can reach a query point
+      pixel_index (:obj: `np.ndarray`)
+        The index of the point of the free form at each lattice node, -1 if the pixel is empty. Padded with the window size on each side
+      cell_state (:obj: `np.ndarray`)
+        The classification of each cell, OUTSIDE, INSIDE or BOUNDARY. Boundary cells are resolved with the exact test in check_point_near_pixels
+
+    """
+    y_band = 2.1*self.hy
+    test_radius = max(self.hx,self.hy)*(2.+1.0e-1)
+    margin = 1.0e-6*min(self.hx,self.hy)
+
+    # Step 1. Lattice coordinates of the points of the free form
+    lattice_x = np.rint((self.all_points_array[:,0]-self.x_min_val)/self.hx).astype(int)
+    lattice_y = np.rint((self.all_points_array[:,1]-self.y_min_val)/self.hy).astype(int)
+    self.lattice_shape = (int(lattice_x.max())+1, int(lattice_y.max())+1)
+    self.window = (int(math.ceil(test_radius/self.hx))+1, int(math.ceil(min(test_radius, y_band)/self.hy))+1)
+
+    wx, wy = self.window
+    self.pixel_index = np.full((self.lattice_shape[0]+2*wx, self.lattice_shape[1]+2*wy), -1, dtype=np.int32)
+    self.pixel_index[lattice_x+wx, lattice_y+wy] = np.arange(self.all_points_array.shape[0])
+
+    # Only the offsets whose lattice node can reach some part of a cell are compared
+    offsets = [(dx, dy) for dx in range(-wx, wx+1) for dy in range(-wy, wy+1)
+      if math.hypot(max(abs(dx)-1, 0)*self.hx, max(abs(dy)-1, 0)*self.hy) < test_radius+margin and max(abs(dy)-1, 0)*self.hy < y_band+margin]
+
+    # Step 2. Compare the cells with the points of the free form in the window, a few rows at a time
+    self.cell_state = np.zeros(self.lattice_shape, dtype=np.int8)
+    cell_y_low = self.y_min_val + np.arange(self.lattice_shape[1])*self.hy
+    cell_y_high = cell_y_low + self.hy
+    chunk = max(1, 1000000//self.lattice_shape[1])
+    for row_start in range(0, self.lattice_shape[0], chunk):
+      rows = np.arange(row_start, min(row_start+chunk, self.lattice_shape[0]))
+      cell_x_low = (self.x_min_val + rows*self.hx)[:,np.newaxis]
+      cell_x_high = cell_x_low + self.hx
+      inside = np.zeros((len(rows), self.lattice_shape[1]), dtype=bool)
+      touched = np.zeros((len(rows), self.lattice_shape[1]), dtype=bool)
+      for dx, dy in offsets:
+        index = self.pixel_index[rows[0]+dx+wx:rows[-1]+dx+wx+1, dy+wy:dy+wy+self.lattice_shape[1]]
+        occupied = index >= 0
+        if not occupied.any():
+          continue
+        shape_x = self.all_points_array[index,0]
+        shape_y = self.all_points_array[index,1]
+        # The largest and smallest x and y distances from a point of the free form to the cell
+        far_x = np.maximum(np.abs(shape_x-cell_x_low), np.abs(shape_x-cell_x_high))
+        far_y = np.maximum(np.abs(shape_y-cell_y_low), np.abs(shape_y-cell_y_high))
+        near_x = np.where((shape_x >= cell_x_low) & (shape_x <= cell_x_high), 0.0, np.minimum(np.abs(shape_x-cell_x_low), np.abs(shape_x-cell_x_high)))
+        near_y = np.where((shape_y >= cell_y_low) & (shape_y <= cell_y_high), 0.0, np.minimum(np.abs(shape_y-cell_y_low), np.abs(shape_y-cell_y_high)))
+        inside |= occupied & (np.sqrt(far_x**2+far_y**2) < test_radius-margin) & (far_y < y_band-margin)
+        touched |= occupied & (np.sqrt(near_x**2+near_y**2) < test_radius+margin) & (near_y < y_band+margin)
+
+      # Step 3. Classify the cells
+      self.cell_state[rows] = np.where(inside, self.INSIDE, np.where(touched, self.BOUNDARY, self.OUTSIDE))
+
+  def lattice_cell(self, points):
+    """Computes the lattice cell containing each of a batch of points
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (M,dim) numpy array of points, inside the bounding box of the free form
+
+    Returns:
+      cell_x, cell_y (:obj:`np.ndarray`):
+        The cell indices along the x and y directions
+    """
+    cell_x = np.clip(np.floor((points[:,0]-self.x_min_val)/self.hx).astype(int), 0, self.lattice_shape[0]-1)
+    cell_y = np.clip(np.floor((points[:,1]-self.y_min_val)/self.hy).astype(int), 0, self.lattice_shape[1]-1)
+    return cell_x, cell_y
+
+  def check_point_near_pixels(self, point, cell_x, cell_y):
+    """Checks if a point of the free form lies within the tolerance radius and the y band around a given point
+
+    This is the exact test of the original implementation, restricted to the points of the free form in the search window around the cell of the point
+
+    Parameters:
+      point (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the point to be tested
+      cell_x, cell_y (:obj:`int`):
+        The lattice cell containing the point
+
+    Returns:
+      bool::
+
+        True -- Point is inside
+        False -- Point is not inside
+    """
+    wx, wy = self.window
+    index = self.pixel_index[cell_x:cell_x+2*wx+1, cell_y:cell_y+2*wy+1]
+    shape_points = self.all_points_array[index[index >= 0]]
+
+    y_band = 2.1*self.hy
+    shape_points = shape_points[shape_points[:,1] < point[1]+y_band]
+    shape_points = shape_points[shape_points[:,1] > point[1] -y_band]
+    if(shape_points.shape[0] == 0):
+      return False
+    _eps = 1.0e-1
+    relative_distance_array = np.linalg.norm(shape_points-point, axis = 1)
+    test_radius = max(self.hx,self.hy)*(2.+_eps)
+    return bool(np.min(relative_distance_array) < test_radius)
 
-  # Check if a new point is inside the shape
-  # This is slow!!!
   def is_point_inside(self, point):
     """Checks if a given point is inside the free form shape
 
     The following steps are performed::
       Step 1. Checks if the point is inside the bounding box of the shape
 
-      Step 2. If the point is inside the bounding box, find the points in the free form which are within a certain y  values
+      Step 2. If the point is inside the bounding box, look up the classification of its cell in the occupancy grid
 
-      Step 3. Establish the radius in which to look for points of the free form and check if such a point exist
+      Step 3. For a boundary cell, check if a point of the free form exists within the y band and the tolerance radius
     
     Parameters:
       point (:obj:`np.ndarray`):
@@ -147,39 +326,117 @@ class FreeForm2D(Shape):
     # If inside_bounding box
     if(point[0] < self.x_min_val or point[0] > self.x_max_val or point[1] < self.y_min_val or point[1] > self.y_max_val):
       return False
-    else:
 
-      # Select all the points whose y values are within +/- y_band
-      y_band = 2.1*self.hy
-      shape_points = self.all_points_array[self.all_points_array[:,1] < point[1]+y_band]
-      shape_points = shape_points[shape_points[:,1] > point[1] -y_band]
-      _eps = 1.0e-1
-      relative_distance_array = np.linalg.norm(shape_points-point, axis = 1)
-      test_radius = max(self.hx,self.hy)*(2.+_eps)
-      if(relative_distance_array[np.argmin(relative_distance_array)] < test_radius):
-        return True
+    cell_x = min(max(int(math.floor((point[0]-self.x_min_val)/self.hx)), 0), self.lattice_shape[0]-1)
+    cell_y = min(max(int(math.floor((point[1]-self.y_min_val)/self.hy)), 0), self.lattice_shape[1]-1)
+    state = self.cell_state[cell_x, cell_y]
+    if(state == self.INSIDE):
+      return True
+    if(state == self.OUTSIDE):
       return False
+    return self.check_point_near_pixels(np.asarray(point, dtype=float), cell_x, cell_y)
+
+  def clip_edges_to_box(self, points_1, points_2):
+    """Clips a batch of line segments to the bounding box of the free form
+
+    Parameters:
+      points_1 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      t_low, t_high (:obj:`np.ndarray`):
+        The range of the segment parameter, point_1 + t*(point_2-point_1), inside the bounding box. The segment misses the box if t_low > t_high
+    """
+    t_low = np.zeros(points_1.shape[0])
+    t_high = np.ones(points_1.shape[0])
+    delta = points_2 - points_1
+    with np.errstate(divide='ignore', invalid='ignore'):
+      for axis, low, high in [(0, self.x_min_val, self.x_max_val), (1, self.y_min_val, self.y_max_val)]:
+        t_1 = (low - points_1[:,axis])/delta[:,axis]
+        t_2 = (high - points_1[:,axis])/delta[:,axis]
+        parallel = delta[:,axis] == 0
+        outside = parallel & ((points_1[:,axis] < low) | (points_1[:,axis] > high))
+        t_low = np.where(parallel, t_low, np.maximum(t_low, np.minimum(t_1, t_2)))
+        t_high = np.where(parallel, t_high, np.minimum(t_high, np.maximum(t_1, t_2)))
+        t_high = np.where(outside, -1.0, t_high)
+    return t_low, t_high
+
+  def check_edges_near_pixels(self, points_1, points_2, t_low, t_high, index):
+    """Checks if line segments pass within the tolerance radius and the y band of points of the free form
+
+    This is the exact continuous version of the point test: the part of the segment in the y band of the point of the free form is intersected with the part within the tolerance radius. The arrays are aligned, each entry is a (segment, point of the free form) pair
 
-  def is_intersected_by_edge(self, point_1, point_2):
-    """Checks if the line segment connecting two points intersects the free
+    Parameters:
+      points_1, points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy arrays defining the ends of the segments
+      t_low, t_high (:obj:`np.ndarray`):
+        The (M,) range of the segment parameter to be tested
+      index (:obj:`np.ndarray`):
+        The (M,) indices of the points of the free form, in all_points_array
+
+    Returns:
+      near (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the segment enters the region around the point of the free form
+    """
+    y_band = 2.1*self.hy
+    test_radius = max(self.hx,self.hy)*(2.+1.0e-1)
+    shape_points = self.all_points_array[index]
+    delta = points_2 - points_1
+    relative = points_1 - shape_points
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      # The y band, open interval
+      band_1 = (shape_points[:,1] - y_band - points_1[:,1])/delta[:,1]
+      band_2 = (shape_points[:,1] + y_band - points_1[:,1])/delta[:,1]
+      in_band = (shape_points[:,1] < points_1[:,1]+y_band) & (shape_points[:,1] > points_1[:,1]-y_band)
+      parallel = delta[:,1] == 0
+      band_low = np.where(parallel, np.where(in_band, -np.inf, np.inf), np.minimum(band_1, band_2))
+      band_high = np.where(parallel, np.where(in_band, np.inf, -np.inf), np.maximum(band_1, band_2))
+
+      # The tolerance radius, open interval
+      a = delta[:,0]**2 + delta[:,1]**2
+      b = 2.0*(relative[:,0]*delta[:,0] + relative[:,1]*delta[:,1])
+      c = relative[:,0]**2 + relative[:,1]**2 - test_radius**2
+      discriminant = b**2 - 4.0*a*c
+      root = np.sqrt(np.where(discriminant > 0, discriminant, 0.0))
+      radius_low = (-b - root)/(2.0*a)
+      radius_high = (-b + root)/(2.0*a)
+
+    low = np.maximum(np.maximum(t_low, band_low), radius_low)
+    high = np.minimum(np.minimum(t_high, band_high), radius_high)
+    return (discriminant > 0) & (low < high)
+
+  def window_pixels(self, cell_x, cell_y):
+    """Returns the indices of the points of the free form in the search window of a cell
+    """
+    wx, wy = self.window
+    index = self.pixel_index[cell_x:cell_x+2*wx+1, cell_y:cell_y+2*wy+1]
+    return index[index >= 0]
+
+  def is_intersected_by_edge(self, point_1, point_2, validate=True):
+    """Checks if the line segment connecting two points intersects the free form
     
-    Here the intersection of the line segment defined by the points (point_1 and point_2) is tested 
+    Here the cells of the occupancy grid crossed by the line segment defined by the points (point_1 and point_2) are visited in order (Amanatides-Woo traversal) until an occupied cell is found
 
     Note:
       The method assumes/asserts that the two points are outside the free form
     
     The following steps are performed:
-      Step 1. Compute the length of the segment and compute the number of points to be chosen between the point_1 and point_2
+      Step 1. Clip the segment to the bounding box of the free form
 
-      Step 2. Divide the line segment into appropriate number of points to test
+      Step 2. Walk the cells crossed by the segment, stepping to the cell whose boundary (vertical or horizontal grid line) is crossed next
 
-      Step 3. Check if any of the points is inside the shape
+      Step 3. Stop at the first inside cell, or at the first boundary cell where the segment passes within the tolerance radius and the y band of a point of the free form
 
     Parameters:
       point_1 (:obj:`np.ndarray`):
         The (1,dim) numpy array defining one end of the edge
       point_2 (:obj:`np.ndarray`):
         The (1,dim) numpy array defining the other end of the edge
+      validate (:obj:`bool`):
+        If True the end points are asserted to be outside the free form. Callers that have already tested the end points (see :meth:`~input.domain_class.Domain.is_edge_blocked()`) pass False to skip the repeated tests
 
     Returns:
       bool::
@@ -188,24 +445,191 @@ class FreeForm2D(Shape):
         False -- The edge does not intersect
         
     """
-    assert self.is_point_inside(point_1)==False
-    assert self.is_point_inside(point_2)==False
-    
-    # Compute the number of points based on the hx value
-    length_of_edge = np.linalg.norm(point_1-point_2)
-    # Divide the edge into appropriate number of segments
-    n_divisions = math.ceil(length_of_edge*(1./self.hx))
-    if point_1[0] == point_2[0]:
-      points_to_test = [[point_1[0], point_1[1]+(i+1)*((point_2[1]-point_1[1])/n_divisions)] for i in range(n_divisions-1)]
+    if(validate):
+      assert self.is_point_inside(point_1)==False
+      assert self.is_point_inside(point_2)==False
+
+    point_1 = np.asarray(point_1, dtype=float).reshape(1, 2)
+    point_2 = np.asarray(point_2, dtype=float).reshape(1, 2)
+
+    # Step 1. Clip the segment to the bounding box
+    t_low, t_high = self.clip_edges_to_box(point_1, point_2)
+    t_low = float(t_low[0])
+    t_high = float(t_high[0])
+    if(t_low > t_high):
+      return False
+
+    # Step 2. Set up the traversal from the cell of the first point in the box
+    x_1, y_1 = point_1[0].tolist()
+    dx, dy = (point_2[0]-point_1[0]).tolist()
+    start = point_1[0] + t_low*(point_2[0]-point_1[0])
+    cell_x = min(max(int(math.floor((start[0]-self.x_min_val)/self.hx)), 0), self.lattice_shape[0]-1)
+    cell_y = min(max(int(math.floor((start[1]-self.y_min_val)/self.hy)), 0), self.lattice_shape[1]-1)
+
+    if(dx > 0):
+      step_x, t_next_x, t_delta_x = 1, (self.x_min_val+(cell_x+1)*self.hx-x_1)/dx, self.hx/dx
+    elif(dx < 0):
+      step_x, t_next_x, t_delta_x = -1, (self.x_min_val+cell_x*self.hx-x_1)/dx, -self.hx/dx
+    else:
+      step_x, t_next_x, t_delta_x = 0, math.inf, math.inf
+    if(dy > 0):
+      step_y, t_next_y, t_delta_y = 1, (self.y_min_val+(cell_y+1)*self.hy-y_1)/dy, self.hy/dy
+    elif(dy < 0):
+      step_y, t_next_y, t_delta_y = -1, (self.y_min_val+cell_y*self.hy-y_1)/dy, -self.hy/dy
     else:
-      line_slope = (point_2[1]-point_1[1])/(point_2[0]-point_1[0])
-      points_to_test = [[point_1[0]+(i+1)*(point_2[0]-point_1[0])/(n_divisions), line_slope*(point_1[0]+(i+1)*(point_2[0]-point_1[0])/(n_divisions) - point_1[0])+ point_1[1]] for i in range(n_divisions-1)]
+      step_y, t_next_y, t_delta_y = 0, math.inf, math.inf
 
-    for point in points_to_test:
-      if(self.is_point_inside(point)):
+    t_range = (np.array([t_low]), np.array([t_high]))
+    while(0 <= cell_x < self.lattice_shape[0] and 0 <= cell_y < self.lattice_shape[1]):
+      # Step 3. Check the current cell
+      state = self.cell_state[cell_x, cell_y]
+      if(state == self.INSIDE):
         return True
+      if(state == self.BOUNDARY):
+        index = self.window_pixels(cell_x, cell_y)
+        if(len(index) > 0 and self.check_edges_near_pixels(np.repeat(point_1, len(index), axis=0), np.repeat(point_2, len(index), axis=0), t_range[0], t_range[1], index).any()):
+          return True
+
+      # Move to the next cell
+      if(t_next_x < t_next_y):
+        if(t_next_x > t_high):
+          break
+        cell_x += step_x
+        t_next_x += t_delta_x
+      else:
+        if(t_next_y > t_high):
+          break
+        cell_y += step_y
+        t_next_y += t_delta_y
+
     return False
 
+  def points_inside(self, points):
+    """Checks which of a batch of points are inside the free form shape
+
+    Vectorized version of is_point_inside. The boundary cells are resolved by gathering the points of the free form in the search window of every point at once
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the points to be tested
+
+    Returns:
+      inside (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the point is inside
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    inside = np.zeros(points.shape[0], dtype=bool)
+
+    # Step 1. Only the points inside the bounding box are tested further
+    in_box = np.flatnonzero((points[:,0] >= self.x_min_val) & (points[:,0] <= self.x_max_val) & (points[:,1] >= self.y_min_val) & (points[:,1] <= self.y_max_val))
+
+    # Step 2. Look up the classification of the cells
+    cell_x, cell_y = self.lattice_cell(points[in_box])
+    state = self.cell_state[cell_x, cell_y]
+    inside[in_box] = state == self.INSIDE
+
+    # Step 3. Resolve the boundary cells with the points of the free form in the search window
+    boundary = state == self.BOUNDARY
+    if boundary.any():
+      wx, wy = self.window
+      offset_x, offset_y = np.meshgrid(np.arange(2*wx+1), np.arange(2*wy+1), indexing='ij')
+      index = self.pixel_index[cell_x[boundary][:,np.newaxis]+offset_x.ravel(), cell_y[boundary][:,np.newaxis]+offset_y.ravel()]
+      point_x = points[in_box[boundary],0][:,np.newaxis]
+      point_y = points[in_box[boundary],1][:,np.newaxis]
+      shape_x = self.all_points_array[index,0]
+      shape_y = self.all_points_array[index,1]
+
+      y_band = 2.1*self.hy
+      test_radius = max(self.hx,self.hy)*(2.+1.0e-1)
+      valid = (index >= 0) & (shape_y < point_y+y_band) & (shape_y > point_y-y_band)
+      distance = np.where(valid, np.sqrt((shape_x-point_x)**2 + (shape_y-point_y)**2), np.inf)
+      inside[in_box[boundary]] = np.min(distance, axis=1) < test_radius
+
+    return inside
+
+  def edges_intersected(self, points_1, points_2):
+    """Checks which of a batch of line segments intersect the free form
+
+    Vectorized version of is_intersected_by_edge. Instead of stepping cell by cell, the parameters at which every segment crosses the vertical and horizontal grid lines are generated at once. The cells crossed by the segments are the cells containing the midpoints between consecutive crossings
+
+    Note:
+      As for is_intersected_by_edge, the end points of the segments are expected to be outside the free form. This is not asserted.
+
+    Parameters:
+      points_1 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      intersected (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the edge intersects
+    """
+    points_1 = np.asarray(points_1, dtype=float).reshape(-1, 2)
+    points_2 = np.asarray(points_2, dtype=float).reshape(-1, 2)
+    intersected = np.zeros(points_1.shape[0], dtype=bool)
+
+    # Step 1. Clip the segments to the bounding box
+    clip_low, clip_high = self.clip_edges_to_box(points_1, points_2)
+    edges = np.flatnonzero(clip_low <= clip_high)
+    if len(edges) == 0:
+      return intersected
+    p_1 = points_1[edges]
+    delta = points_2[edges] - p_1
+    t_low = clip_low[edges]
+    t_high = clip_high[edges]
+
+    # Step 2. Parameters of the grid line crossings, together with the ends of the clipped segments
+    crossings = [np.concatenate((t_low, t_high))]
+    owners = [np.concatenate((edges, edges))]
+    for axis, origin, spacing in [(0, self.x_min_val, self.hx), (1, self.y_min_val, self.hy)]:
+      cell_low = np.floor((p_1[:,axis] + t_low*delta[:,axis] - origin)/spacing).astype(int)
+      cell_high = np.floor((p_1[:,axis] + t_high*delta[:,axis] - origin)/spacing).astype(int)
+      first_line = np.minimum(cell_low, cell_high) + 1
+      n_lines = np.abs(cell_high - cell_low)
+      owner = np.repeat(np.arange(len(edges)), n_lines)
+      line = np.arange(n_lines.sum()) - np.repeat(np.cumsum(n_lines)-n_lines, n_lines) + first_line[owner]
+      crossings.append((origin + line*spacing - p_1[owner,axis])/delta[owner,axis])
+      owners.append(edges[owner])
+    crossings = np.concatenate(crossings)
+    owners = np.concatenate(owners)
+    order = np.lexsort((crossings, owners))
+    crossings = crossings[order]
+    owners = owners[order]
+
+    # Step 3. The cells containing the midpoints between consecutive crossings of the same segment
+    same = (owners[1:] == owners[:-1]) & (crossings[1:] > crossings[:-1])
+    owner = owners[:-1][same]
+    t_middle = 0.5*(crossings[:-1][same] + crossings[1:][same])
+    middle = points_1[owner] + t_middle[:,np.newaxis]*(points_2[owner] - points_1[owner])
+    cell_x, cell_y = self.lattice_cell(middle)
+    state = self.cell_state[cell_x, cell_y]
+    intersected[owner[state == self.INSIDE]] = True
+
+    # Step 4. Exact test of the boundary cells of the segments not yet found intersected
+    boundary = (state == self.BOUNDARY) & ~intersected[owner]
+    if boundary.any():
+      wx, wy = self.window
+      offset_x, offset_y = np.meshgrid(np.arange(2*wx+1), np.arange(2*wy+1), indexing='ij')
+      index = self.pixel_index[cell_x[boundary][:,np.newaxis]+offset_x.ravel(), cell_y[boundary][:,np.newaxis]+offset_y.ravel()]
+      owner = np.broadcast_to(owner[boundary][:,np.newaxis], index.shape)
+      pairs = np.unique(np.stack((owner[index >= 0], index[index >= 0])), axis=1)
+      near = self.check_edges_near_pixels(points_1[pairs[0]], points_2[pairs[0]], clip_low[pairs[0]], clip_high[pairs[0]], pairs[1])
+      intersected[pairs[0][near]] = True
+
+    return intersected
+
+  def bounding_box(self):
+    """Computes the axis aligned bounding box of the free form
+
+    Returns:
+      lower (:obj:`np.ndarray`):
+        The lower corner of the box
+      upper (:obj:`np.ndarray`):
+        The upper corner of the box
+    """
+    return np.array([self.x_min_val, self.y_min_val]), np.array([self.x_max_val, self.y_max_val])
+
   def sample_random_point(self):
     """Generates a random point in the shape free form
 
@@ -230,3 +654,26 @@ class FreeForm2D(Shape):
       random_point = (self.all_points_array[np.random.randint(self.all_points_array.shape[0], size=1), :]).flatten() + delta
     return random_point
 
+  def sample_random_points(self, n):
+    """Generates a batch of random points in the shape free form
+
+    The steps of sample_random_point are performed for the whole batch at once, and the candidates are tested with points_inside. The points falling outside the shape are dropped and new candidates are drawn until n points are found.
+
+    Parameters:
+      n (:obj:`int`):
+        The number of points to generate
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of new points
+    """
+    new_random_points = np.empty((n, 2), dtype=float)
+    n_found = 0
+    while(n_found < n):
+      n_missing = n - n_found
+      candidates = self.all_points_array[np.random.randint(self.all_points_array.shape[0], size=n_missing), :]
+      candidates = candidates + np.random.rand(n_missing, 2)*np.array([self.hx, self.hy])
+      inside = candidates[self.points_inside(candidates)]
+      new_random_points[n_found:n_found+len(inside)] = inside
+      n_found += len(inside)
+    return new_random_points
@@ -108,7 +108,7 @@ class Rectangle(Shape):
       else:
         return False
 
-  def is_intersected_by_edge(self, point_1, point_2):
+  def is_intersected_by_edge(self, point_1, point_2, validate=True):
     """Checks if the line segment connecting two points intersects the rectangle
     
     Here the intersection of the line segment defined by the points (point_1 and point_2) is tested against all the sides of the rectangle.
@@ -121,6 +121,8 @@ class Rectangle(Shape):
         The (1,dim) numpy array defining one end of the edge
       point_2 (:obj:`np.ndarray`):
         The (1,dim) numpy array defining the other end of the edge
+      validate (:obj:`bool`):
+        If True the end points are asserted to be outside the rectangle. Callers that have already tested the end points (see :meth:`~input.domain_class.Domain.is_edge_blocked()`) pass False to skip the repeated tests
 
     Returns:
       bool::
@@ -129,7 +131,8 @@ class Rectangle(Shape):
         False -- The line segment does not intersect
         
     """
-    assert(self.is_point_inside(point_1)==False)
+    if(validate):
+      assert(self.is_point_inside(point_1)==False)
 
     # The implementation of code repetition was preferred as it was faster than the for loop
     if(self.check_line_segment_intersection(self.vertices[0], self.vertices[1], point_1, point_2)):
@@ -146,6 +149,93 @@ class Rectangle(Shape):
 
     return False
 
+  def points_inside(self, points):
+    """Checks which of a batch of points are inside the rectangle
+
+    Vectorized version of is_point_inside
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the points to be tested
+
+    Returns:
+      inside (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the point is inside
+    """
+    relative = self.vertices[0] - np.asarray(points, dtype=float).reshape(-1, 2)
+    side_1 = self.vertices[0]-self.vertices[1]
+    side_3 = self.vertices[0]-self.vertices[3]
+    dot_1 = relative[:,0]*side_1[0] + relative[:,1]*side_1[1]
+    dot_3 = relative[:,0]*side_3[0] + relative[:,1]*side_3[1]
+    return (0.0 <= dot_1) & (dot_1 <= np.dot(side_1, side_1)) & (0.0 <= dot_3) & (dot_3 <= np.dot(side_3, side_3))
+
+  def check_line_segments_intersection(self, point_1, point_2, points_3, points_4):
+    """Checks which of a batch of line segments intersect a single line segment
+
+    Vectorized version of check_line_segment_intersection. Parallel line segments are considered as not intersecting
+
+    Parameters:
+      point_1 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining one end of the line segment 1
+      point_2 (:obj:`np.ndarray`):
+        The (1,dim) numpy array defining the other end of the line segment 1
+      points_3 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the line segments 2
+      points_4 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the line segments 2
+
+    Returns:
+      intersected (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the two line segments intersect
+    """
+    denominator = (point_1[0]-point_2[0])*(points_3[:,1]-points_4[:,1]) - (point_1[1]-point_2[1])*(points_3[:,0]-points_4[:,0])
+    numerator_alpha = (point_1[0]-points_3[:,0])*(points_3[:,1]-points_4[:,1]) - (point_1[1]-points_3[:,1])*(points_3[:,0]-points_4[:,0])
+    numerator_beta = -1.*((point_1[0]-point_2[0])*(point_1[1]-points_3[:,1]) - (point_1[1]-point_2[1])*(point_1[0]-points_3[:,0]))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      alpha = numerator_alpha/denominator
+      beta = numerator_beta/denominator
+
+    return (denominator != 0) & (0.0 <= alpha) & (alpha <= 1.0) & (0.0 <= beta) & (beta <= 1.0)
+
+  def edges_intersected(self, points_1, points_2):
+    """Checks which of a batch of line segments intersect the rectangle
+
+    Vectorized version of is_intersected_by_edge, testing all the segments against each side of the rectangle at once.
+
+    Note:
+      As for is_intersected_by_edge, the end points of the segments are expected to be outside the rectangle. This is not asserted.
+
+    Parameters:
+      points_1 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining one end of the edges
+      points_2 (:obj:`np.ndarray`):
+        The (M,dim) numpy array defining the other end of the edges
+
+    Returns:
+      intersected (:obj:`np.ndarray` of :obj:`bool`):
+        The (M,) mask, True where the edge intersects or is tangent
+    """
+    points_1 = np.asarray(points_1, dtype=float).reshape(-1, 2)
+    points_2 = np.asarray(points_2, dtype=float).reshape(-1, 2)
+
+    intersected = self.check_line_segments_intersection(self.vertices[0], self.vertices[1], points_1, points_2)
+    intersected |= self.check_line_segments_intersection(self.vertices[1], self.vertices[2], points_1, points_2)
+    intersected |= self.check_line_segments_intersection(self.vertices[2], self.vertices[3], points_1, points_2)
+    intersected |= self.check_line_segments_intersection(self.vertices[3], self.vertices[0], points_1, points_2)
+    return intersected
+
+  def bounding_box(self):
+    """Computes the axis aligned bounding box of the rectangle, which is the rectangle itself
+
+    Returns:
+      lower (:obj:`np.ndarray`):
+        The lower corner of the box
+      upper (:obj:`np.ndarray`):
+        The upper corner of the box
+    """
+    return np.min(self.vertices, axis=0), np.max(self.vertices, axis=0)
+
   def sample_random_point(self):
     """Generates a random point in the rectangle
 
@@ -156,4 +246,36 @@ class Rectangle(Shape):
     new_random_point = np.random.rand(2)
     new_random_point[0] = new_random_point[0]*(self.width)+self.vertices[0][0]
     new_random_point[1] = new_random_point[1]*(self.height)+self.vertices[0][1]
-    return new_random_point
\ No newline at end of file
+    return new_random_point
+
+  def sample_random_points(self, n):
+    """Generates a batch of random points in the rectangle
+
+    Parameters:
+      n (:obj:`int`):
+        The number of points to generate
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of new points
+    """
+    new_random_points = np.random.rand(n, 2)
+    new_random_points[:,0] = new_random_points[:,0]*(self.width)+self.vertices[0][0]
+    new_random_points[:,1] = new_random_points[:,1]*(self.height)+self.vertices[0][1]
+    return new_random_points
+
+  def map_unit_points(self, points):
+    """Maps a batch of points of the unit square onto the rectangle
+
+    Parameters:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of points with coordinates in [0,1)
+
+    Returns:
+      points (:obj:`np.ndarray`):
+        The (n,dim) numpy array of points in the rectangle
+    """
+    new_points = np.array(points, dtype=float).reshape(-1, 2)
+    new_points[:,0] = new_points[:,0]*(self.width)+self.vertices[0][0]
+    new_points[:,1] = new_points[:,1]*(self.height)+self.vertices[0][1]
+    return new_points
@@ -276,8 +276,8 @@ class Plot:
 			pass
 
 		else:
-			vertices = solution.recorder.vertices 
-			parents = [int(parent) for parent in solution.recorder.parents] 
+			vertices = solution.recorder.live_vertices
+			parents = [int(parent) for parent in solution.recorder.live_parents]
 			path_verts = solution.solution_path
 
 			if self.dims == 2:  # plot in 2D
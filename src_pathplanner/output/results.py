@@ -43,24 +43,20 @@ class Results:
 		self.get_solution_costs()
 
 	def get_solution_vertices(self):
-		""" Gets the coordinates of the vertices in the solution path(s)"""
-		for idx, solution in enumerate(self.solution_path):
-			self.solution_vertices.append([])
-			for i in solution:
-				if np.isnan(i):
-					self.solution_vertices[idx] = [i]
-				else:
-					self.solution_vertices[idx].append(self.recorder.vertices[i].tolist())
+		""" Gets the coordinates of the vertices in the solution path(s), indexing all vertices of a path at once"""
+		for solution in self.solution_path:
+			if np.isnan(solution).any():
+				self.solution_vertices.append([np.nan])
+			else:
+				self.solution_vertices.append(self.recorder.vertices[np.asarray(solution, dtype=int)].tolist())
 
 	def get_solution_costs(self):
 		""" Gets the total cost for each solution path."""
-		for idx, solution in enumerate(self.solution_path):
-			self.solution_costs.append(0)
-			for i in solution:
-				if np.isnan(i):
-					self.solution_costs[idx] = i
-				else:
-					self.solution_costs[idx] += self.recorder.costs[i]
+		for solution in self.solution_path:
+			if np.isnan(solution).any():
+				self.solution_costs.append(np.nan)
+			else:
+				self.solution_costs.append(self.recorder.costs[np.asarray(solution, dtype=int)].sum())
 
 	def save_results(self, name):
 		""" Saves the text output results of the algorithm to a .txt file"""
@@ -0,0 +1,100 @@
+# goal_tracker.py
+# Author(s): Edvard Bruun
+
+import numpy as np
+
+class GoalTracker:
+	""" This class keeps track of the recorded vertices that have reached each goal while the algorithm is running.
+
+	Each new vertex is tested against all of the goals when it is tracked, so that the lowest cost vertex of a goal can be found at any point of the run without testing the whole vertex list again.
+
+	"""
+
+	def __init__(self, goals, recorder):
+		"""Initialize the GoalTracker class.
+
+		The circle goals are packed into arrays of their centers and radii, so that a vertex is tested against all of them in a single vectorized operation. The goals of the other shapes are tested with their :meth:`~input.shape.Shape.points_inside()` method.
+
+		Parameters:
+			goals (:obj:`list` of :obj:`~input.shape.Shape`): The goals of the domain.
+			recorder (:obj:`~solver.recorder.Recorder` object): The recorder holding the vertices and their costs.
+
+		Attributes:
+			goals: see Parameters
+			recorder: see Parameters
+
+			circle_goals (:obj:`numpy.ndarray` of :obj:`int`):
+				The indices (in goals) of the circle goals.
+			circle_centers (:obj:`numpy.ndarray` of :obj:`float`):
+				The centers of the circle goals, one per row.
+			circle_radii (:obj:`numpy.ndarray` of :obj:`float`):
+				The radii of the circle goals.
+			other_goals (:obj:`list` of :obj:`int`):
+				The indices (in goals) of the goals that are not circles.
+			members (:obj:`list` of :obj:`list` of :obj:`int`):
+				The indices of the vertices inside each goal, in increasing order.
+			n_tracked (:obj:`int`):
+				The number of recorded vertices tested against the goals so far.
+
+		"""
+		self.goals = goals
+		self.recorder = recorder
+
+		self.circle_goals = np.array([i for i, goal in enumerate(goals) if goal.name == "circle"], dtype=int)
+		self.circle_centers = np.array([goals[i].center for i in self.circle_goals], dtype=float).reshape(len(self.circle_goals), -1)
+		self.circle_radii = np.array([goals[i].radius for i in self.circle_goals], dtype=float)
+		self.other_goals = [i for i, goal in enumerate(goals) if goal.name != "circle"]
+
+		self.reset()
+
+	def reset(self):
+		""" This function forgets all of the tracked vertices.
+		"""
+		self.members = [[] for goal in self.goals]
+		self.n_tracked = 0
+
+	def update(self):
+		""" This function tests the vertices recorded since the previous update against all of the goals.
+
+		The new vertices are tested against all of the circle goals at once. The goal membership of a vertex does not change after it is recorded, so every vertex is only tested once. If the number of recorded vertices has decreased (the recorder arrays were replaced) the tracking starts over.
+
+		"""
+		n_vertices = self.recorder.n_vertices
+		if n_vertices < self.n_tracked:
+			self.reset()
+
+		vertices = self.recorder.vertices[self.n_tracked:n_vertices]
+		if len(vertices) == 0:
+			return
+
+		if len(self.circle_goals) > 0:
+			diff = vertices[:,np.newaxis,:] - self.circle_centers[np.newaxis,:,:]
+			inside = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff)) <= self.circle_radii
+			for k, j in zip(*np.nonzero(inside)):
+				self.members[self.circle_goals[j]].append(int(k) + self.n_tracked)
+
+		for i in self.other_goals:
+			inside = self.goals[i].points_inside(vertices)
+			self.members[i].extend((np.nonzero(inside)[0] + self.n_tracked).tolist())
+
+		self.n_tracked = n_vertices
+
+	def best_vertex(self, goal_index):
+		""" This function returns the lowest cost vertex that has reached a goal.
+
+		The costs are read from the recorder when this function is called, so changes of the costs by re-wiring are always taken into account. When several vertices have the same cost, the one with the highest index is returned, the same as :meth:`~solver.solution.Solution.find_lowest_cost()`.
+
+		Parameters:
+			goal_index (:obj:`int`): The index of the goal.
+
+		Returns:
+			index (:obj:`int`): The index of the lowest cost vertex inside the goal. This is set to :obj:`numpy.nan` if the goal is not reached.
+
+		"""
+		members = self.members[goal_index]
+		if len(members) == 0:
+			return np.nan
+
+		costs = self.recorder.costs[members]
+		k = len(costs) - 1 - int(np.argmin(costs[::-1]))
+		return members[k]
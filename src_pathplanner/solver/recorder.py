@@ -7,12 +7,17 @@ class Recorder:
 	"""This class acts as a container for the algorithm solution values.
 
 	"""
+
+	# The methods recording vertex i in iteration i, for which the connectivity history can be reconstructed
+	ITERATION_ROW_METHODS = ["rrt_basic", "rrt_star", "rrt_star_lazy", "rrt_star_informed"]
 	
 	def __init__(self,params):
 		"""Initialize the Recorder class.
 
 		The attributes arrays are initialized to the length specified by the number of trials in the params dictionary passed. These arrays are initialized to value of :obj:`numpy.nan`. Algorithm specific attributes are initialized are created and initialized.
 
+		The length of the arrays is only their initial capacity. The number of vertices actually recorded is kept in the `n_vertices` attribute, and the arrays are grown by doubling with the :meth:`~solver.recorder.Recorder.reserve()` method when more rows are needed.
+
 		Note:
 			The input parameters dictionary is assigned to an instance attribute with same name.
 
@@ -23,23 +28,38 @@ class Recorder:
 			params: see Parameters	
 					
 			vertices (:obj:`numpy.ndarray` of :obj:`float`):
-				A multi-column array of coordinates for the graph vertices. The number of rows is equal to the number of trials specified by the user. The number of columns is based on the dimensions of the solution space (2d=x,y and 3d=x,y,z) specified by the user.
+				A multi-column array of coordinates for the graph vertices. The number of rows is initially equal to the number of trials specified by the user. The number of columns is based on the dimensions of the solution space (2d=x,y and 3d=x,y,z) specified by the user.
 
 			parents (:obj:`numpy.ndarray` of :obj:`float`):
-				A single column array of indices for the parent of the vertex at the specified row index. Specifies the connectivity of the graph. The number of rows is equal to the number of trials specified by the user.
+				A single column array of indices for the parent of the vertex at the specified row index. Specifies the connectivity of the graph. The number of rows is initially equal to the number of trials specified by the user.
 
 			costs (:obj:`numpy.ndarray` of :obj:`float`):
-				A single column array of total cost (distance) to reach the vertex at the specified row index. The number of rows is equal to the number of trials specified by the user.
+				A single column array of total cost (distance) to reach the vertex at the specified row index. The number of rows is initially equal to the number of trials specified by the user.
+
+			n_vertices (:obj:`int`):
+				The number of vertices recorded so far. Rows `0` to `n_vertices-1` of the arrays are in use (the live prefix), the remaining rows are :obj:`numpy.nan`. The algorithms update this value as they record new vertices. Assigning a full array to the `vertices` attribute sets it to the number of leading rows without :obj:`numpy.nan` values.
+
+			rewire_events (:obj:`numpy.ndarray` of :obj:`int`):
+				An append-only log of the re-wiring events (rrt_star). Each row holds `(iteration, child, old_parent, new_parent)` for one vertex whose parent was changed. This variable tracks the evolution of the graph connectivity during the solution, to be used for the plotting and animation modules. Grows by doubling, only the first `n_rewire_events` rows are in use.
+
+			n_rewire_events (:obj:`int`):
+				The number of re-wiring events recorded so far.
+
+			children (:obj:`list` of :obj:`list` of :obj:`int`):
+				The child lists of the vertices, the inverse of the `parents` array. The lists are brought up to date by the :meth:`~solver.recorder.Recorder.update_children()` method from the vertices and re-wiring events recorded since the previous update, so the algorithms only have to write the `parents` array and call :meth:`~solver.recorder.Recorder.record_rewire()`.
 
-			parents_history (:obj:`numpy.ndarray` of :obj:`float`):
-				algorithm specific variable (rrt_star). A multi-column array of indices for the parent of the vertex at the specified row index. This variable tracks the evolution of the graph connectivity during the solution, to be used for the plotting and animation modules. The number of rows is equal to the number of trials specified by the user. The number of columns is equal to 2 times the number of trials specified by the user. Two adjacent columns represent the connectivity of the graph before and after after re-wiring.
+			n_children_vertices (:obj:`int`):
+				The number of vertices included in the `children` lists.
+
+			n_children_events (:obj:`int`):
+				The number of re-wiring events applied to the `children` lists.
 
 		Note:
 			vertex `j` is connected to vertex `i`. Therefore the parent of vertex j is i, recorder.parents[j] == i
 
-			record.parents_history[:,n] = the parent list (connectivity) of the graph before re-wiring in iteration n
+			recorder.parents_at(n, rewired=False) = the parent list (connectivity) of the graph before re-wiring in iteration n
 
-			record.parents_history[:,n+1] = the parent list (connectivity) of the graph after re-wiring in iteration n
+			recorder.parents_at(n) = the parent list (connectivity) of the graph after re-wiring in iteration n
 
 		"""
 		self.params = params
@@ -47,6 +67,7 @@ class Recorder:
 		self.vertices = np.zeros((self.params["n_trials"],self.params["dim"]),
 			dtype=float)
 		self.vertices.fill(np.nan)
+		self.n_vertices = 0
 
 		self.parents = np.zeros(self.params["n_trials"], dtype=float)
 		self.parents.fill(np.nan)
@@ -54,7 +75,238 @@ class Recorder:
 		self.costs = np.zeros(self.params["n_trials"], dtype=float)
 		self.costs.fill(np.nan)
 
-		if self.params["method"] == "rrt_star":
-			self.parents_history = np.zeros((self.params["n_trials"],self.params["n_trials"]*2),
-				dtype=float)
-			self.parents_history.fill(np.nan)
+		self.rewire_events = np.zeros((64, 4), dtype=int)
+		self.n_rewire_events = 0
+
+		self.children = []
+		self.n_children_vertices = 0
+		self.n_children_events = 0
+
+	@property
+	def vertices(self):
+		return self._vertices
+
+	@vertices.setter
+	def vertices(self, vertices):
+		self._vertices = vertices
+		missing = np.isnan(vertices).any(axis=1)
+		self.n_vertices = int(np.argmax(missing)) if missing.any() else len(vertices)
+
+	@property
+	def capacity(self):
+		""" The number of rows currently allocated in the recorder arrays.
+		"""
+		return self._vertices.shape[0]
+
+	@property
+	def live_vertices(self):
+		""" A view (no copy) of the recorded rows of the `vertices` array.
+		"""
+		return self._vertices[:self.n_vertices]
+
+	@property
+	def live_parents(self):
+		""" A view (no copy) of the recorded entries of the `parents` array.
+		"""
+		return self.parents[:self.n_vertices]
+
+	@property
+	def live_costs(self):
+		""" A view (no copy) of the recorded entries of the `costs` array.
+		"""
+		return self.costs[:self.n_vertices]
+
+	@property
+	def rewire_log(self):
+		""" A view (no copy) of the recorded rows of the `rewire_events` array.
+		"""
+		return self.rewire_events[:self.n_rewire_events]
+
+	def reserve(self, n_rows):
+		""" This function makes sure that the recorder arrays have at least the given number of rows.
+
+		If the current capacity is too small it is doubled until it is large enough, so that recording `n` vertices one at a time only copies the arrays `log(n)` times. The recorded rows are copied into the new arrays and the new rows are initialized to :obj:`numpy.nan`.
+
+		Parameters:
+			n_rows (:obj:`int`): The number of rows required.
+
+		"""
+		if n_rows <= self.capacity:
+			return
+
+		capacity = max(self.capacity, 1)
+		while capacity < n_rows:
+			capacity *= 2
+
+		self._vertices = self.grow(self._vertices, capacity)
+		self.parents = self.grow(self.parents, capacity)
+		self.costs = self.grow(self.costs, capacity)
+
+	@staticmethod
+	def grow(array, capacity, fill=np.nan):
+		""" This function returns a copy of an array extended to the given number of rows, the new rows are filled with the `fill` value.
+		"""
+		grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+		grown.fill(fill)
+		grown[:array.shape[0]] = array
+		return grown
+
+	def record_rewire(self, iteration, child, old_parent, new_parent):
+		""" This function appends a re-wiring event to the log.
+
+		Only the event is stored, the `parents` array itself is updated by the algorithm.
+
+		Parameters:
+			iteration (:obj:`int`): The iteration in which the vertex was re-wired.
+			child (:obj:`int`): The index of the re-wired vertex.
+			old_parent (:obj:`int`): The index of the parent before re-wiring.
+			new_parent (:obj:`int`): The index of the parent after re-wiring.
+
+		"""
+		if self.n_rewire_events == self.rewire_events.shape[0]:
+			self.rewire_events = self.grow(self.rewire_events, 2*self.rewire_events.shape[0], -1)
+
+		self.rewire_events[self.n_rewire_events,:] = (iteration, child, old_parent, new_parent)
+		self.n_rewire_events += 1
+
+	def parents_at(self, iteration, rewired=True):
+		""" This function reconstructs the parent list (connectivity) of the graph at the end of an iteration.
+
+		Starts from the current `parents` array and undoes, for every vertex, the re-wiring events logged after the requested iteration: the old parent of the first such event is the parent the vertex had at that time. Vertices recorded after the iteration are set to :obj:`numpy.nan`.
+
+		Note:
+			Vertex `i` is taken to be recorded in iteration `i`, as done by the rrt_basic and rrt_star algorithms (and the rrt_star_lazy and rrt_star_informed variants). The rrt_connect, fmt_star, prm and lazy_prm algorithms can record several vertices (or none) in an iteration, so the history of their graph is not available and an exception is raised.
+
+		Parameters:
+			iteration (:obj:`int`): The iteration of interest.
+			rewired (:obj:`bool`): If :obj:`True` the connectivity after the re-wiring step of the iteration is returned, otherwise the connectivity before it.
+
+		Returns:
+			parents (:obj:`numpy.ndarray` of :obj:`float`): The parent list of the graph, with the same length as the live `parents` view.
+
+		"""
+		if self.params.get("method") not in self.ITERATION_ROW_METHODS:
+			raise Exception('The connectivity history is not available for the {} method'.format(self.params.get("method")))
+
+		parents = self.live_parents.copy()
+		parents[iteration+1:] = np.nan
+
+		log = self.rewire_log
+		if rewired:
+			undone = log[log[:,0] > iteration]
+		else:
+			undone = log[log[:,0] >= iteration]
+
+		children, first = np.unique(undone[:,1], return_index=True)
+		existing = children <= iteration
+		parents[children[existing]] = undone[first[existing],2]
+
+		return parents
+
+	def update_children(self):
+		""" This function brings the `children` lists up to date with the recorded vertices and re-wiring events.
+
+		The re-wiring events logged since the previous update move their child from the old to the new parent list, in the order they were logged. Only the vertices that were already included are moved, the vertices recorded since the previous update are then added to the list of their current parent.
+
+		"""
+		n_vertices = self.n_vertices
+		self.children.extend([] for i in range(n_vertices - len(self.children)))
+
+		for iteration, child, old_parent, new_parent in self.rewire_events[self.n_children_events:self.n_rewire_events].tolist():
+			if child < self.n_children_vertices:
+				self.children[old_parent].remove(child)
+				self.children[new_parent].append(child)
+
+		for child in range(self.n_children_vertices, n_vertices):
+			parent = self.parents[child]
+			if parent >= 0:
+				self.children[int(parent)].append(child)
+
+		self.n_children_vertices = n_vertices
+		self.n_children_events = self.n_rewire_events
+
+	def descendants(self, index):
+		""" This function finds all the vertices in the subtree below a vertex.
+
+		The subtree is walked one level at a time through the `children` lists, which are updated first.
+
+		Parameters:
+			index (:obj:`int`): The index of the root vertex of the subtree.
+
+		Returns:
+			descendants (:obj:`numpy.ndarray` of :obj:`int`): The indices of the vertices below the root vertex, not including the root vertex itself.
+
+		"""
+		self.update_children()
+
+		descendants = []
+		level = self.children[int(index)]
+		while level:
+			descendants.extend(level)
+			level = [child for vertex in level for child in self.children[vertex]]
+
+		return np.array(descendants, dtype=int)
+
+	def propagate_cost(self, index, delta):
+		""" This function adds a change of the total cost of a vertex to the costs of all the vertices in its subtree.
+
+		When a vertex is re-wired, the total cost of every vertex below it changes by the same amount. The costs of the whole subtree are updated in a single vectorized operation.
+
+		Parameters:
+			index (:obj:`int`): The index of the vertex whose cost was changed. Its own entry in the `costs` array is not modified.
+			delta (:obj:`float`): The change of the total cost of the vertex.
+
+		"""
+		descendants = self.descendants(index)
+		if len(descendants) > 0:
+			self.costs[descendants] += delta
+
+	def depths(self):
+		""" This function finds the number of edges between every vertex and the origin.
+
+		The depths are found by pointer jumping over the `parents` array: every vertex starts with a pointer to its parent and a depth of one, and in each round the depth of the vertex pointed to is added and the pointer is replaced by the pointer of that vertex. The number of rounds is the logarithm of the largest depth, each of them a vectorized operation over all of the vertices. Rows without a parent (the origin and the unused rows) have a depth of zero.
+
+		Returns:
+			depths (:obj:`numpy.ndarray` of :obj:`int`): The depth of every row of the `parents` array.
+
+		"""
+		rows = np.arange(len(self.parents))
+		pointers = np.where(self.parents >= 0, np.nan_to_num(self.parents, nan=-1), rows).astype(int)
+		depths = (pointers != rows).astype(int)
+
+		while True:
+			jumped = pointers[pointers]
+			if np.array_equal(jumped, pointers):
+				return depths
+			depths += depths[pointers]
+			pointers = jumped
+
+	def extract_paths(self, targets):
+		""" This function finds the paths from the origin to many vertices at once.
+
+		The length of every path is known from the :meth:`~solver.recorder.Recorder.depths()` method, so all of the paths are filled into a single flat array. All of the paths are walked up towards the origin together, one level of the tree per vectorized step, writing each path from its end.
+
+		Parameters:
+			targets (:obj:`numpy.ndarray` of :obj:`int`): The indices of the end vertices of the paths.
+
+		Returns:
+			paths (:obj:`numpy.ndarray` of :obj:`int`): The vertex indices of all of the paths, each ordered from the origin to its end vertex, one path after the other.
+
+			offsets (:obj:`numpy.ndarray` of :obj:`int`): The path to `targets[i]` is `paths[offsets[i]:offsets[i+1]]`.
+
+		"""
+		targets = np.asarray(targets, dtype=int).ravel()
+		parents = np.where(self.parents >= 0, np.nan_to_num(self.parents, nan=-1), -1).astype(int)
+
+		lengths = self.depths()[targets] + 1
+		offsets = np.zeros(len(targets) + 1, dtype=int)
+		np.cumsum(lengths, out=offsets[1:])
+
+		paths = np.zeros(offsets[-1], dtype=int)
+		current = targets.copy()
+		for step in range(int(lengths.max()) if len(lengths) > 0 else 0):
+			active = lengths > step
+			paths[offsets[1:][active] - 1 - step] = current[active]
+			current = np.where(active, parents[current], current)
+
+		return paths, offsets
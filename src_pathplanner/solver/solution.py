@@ -4,17 +4,37 @@
 """
 Imports the :class:`~solver.recorder.Recorder` class
 
+Imports the :class:`~solver.goal_tracker.GoalTracker` class
+
 Imports the :class:`~algorithm.rrt_basic.RRT_Basic` class
 
 Imports the :class:`~algorithm.rrt_star.RRT_Star` class
 
+Imports the :class:`~algorithm.rrt_star_lazy.RRT_Star_Lazy` class
+
+Imports the :class:`~algorithm.rrt_connect.RRT_Connect` class
+
+Imports the :class:`~algorithm.rrt_star_informed.RRT_Star_Informed` class
+
+Imports the :class:`~algorithm.fmt_star.FMT_Star` class
+
+Imports the :class:`~algorithm.prm.PRM` class
+
 """
+import time
+import random
 import numpy as np
 from sys import exit
 
 from solver.recorder import Recorder
+from solver.goal_tracker import GoalTracker
 from algorithm.rrt_basic import RRT_Basic
 from algorithm.rrt_star import RRT_Star
+from algorithm.rrt_star_lazy import RRT_Star_Lazy
+from algorithm.rrt_connect import RRT_Connect
+from algorithm.rrt_star_informed import RRT_Star_Informed
+from algorithm.fmt_star import FMT_Star
+from algorithm.prm import PRM
 
 class Solution:
 	"""This class executes the path planning algorithm, and evaluates the completion of the path from the origin to the goals.
@@ -25,6 +45,8 @@ class Solution:
 
 		Creates new Recorder object, which is initialized based on the params dictionary passed.
 
+		Sets the collision mode of the domain to the optional "collision_mode" parameter, "fast" by default (see :meth:`~input.domain_class.Domain.set_collision_mode()`).
+
 		Note:
 			The input parameters dictionary is assigned to an instance attribute with same name.
 
@@ -38,19 +60,33 @@ class Solution:
 			domain: see Parameters
 			recorder (:class:`~solver.recorder.Recorder` object):
 				Initialized recorder object with the given input parameters.	
+			goal_tracker (:class:`~solver.goal_tracker.GoalTracker` object):
+				Tracks the vertices that have reached each goal of the domain as they are recorded.
 			solution_path (:obj:`list` of :obj:`list` of :obj:`int`):
 				Initialized as empty. Stores a path from origin to each goal in the form of vertex indices. A single path is generated for each goal.
 			algorithm: Initialized as empty. Assigned the algorithm object, which is used to solve the path planning problem.
+			termination_reason (:obj:`str`):
+				Initialized as :obj:`None`. Set by :meth:`~solver.solution.Solution.run_algorithm()` to the reason the run stopped, one of "n_trials", "goals_reached", "time_limit" or "cost_converged".
+			n_iterations (:obj:`int`):
+				The number of iterations (trials) completed by :meth:`~solver.solution.Solution.run_algorithm()`.
+			best_cost_history (:obj:`list` of :obj:`float`):
+				The sum of the lowest path costs to all of the goals after each iteration, :obj:`numpy.nan` while not all goals are reached. Only recorded when the "cost_tolerance" parameter is given.
 		
 		"""
 		self.params = params
 		self.domain_object = domain_object
+		self.domain_object.set_collision_mode(self.params.get("collision_mode", "fast"))
 
 		self.recorder = Recorder(self.params)
+		self.goal_tracker = GoalTracker(self.domain_object.goals, self.recorder)
 
 		self.solution_path = [] 
 		self.algorithm = []
 
+		self.termination_reason = None
+		self.n_iterations = 0
+		self.best_cost_history = []
+
 	def run_algorithm(self, print_vertex=True):
 		"""  This function runs through the full path planning algorithm.
 
@@ -59,9 +95,15 @@ class Solution:
 		Note:
 			Exits with an error if the user selects an algorithm that has not been implemented.	
 
-		Calls the :meth:`RRT.rrt_step() <algorithm.rrt.RRT.rrt_step()>` function in the loop.
+		Calls the :meth:`RRT.rrt_step() <algorithm.rrt.RRT.rrt_step()>` function in the loop. After each step the new vertex is tested against the goals with the :meth:`~solver.goal_tracker.GoalTracker.update()` method, and the loop is stopped early if one of the termination policies is met (see :meth:`~solver.solution.Solution.check_termination()`). The reason the run stopped is saved to the `termination_reason` attribute.
+
+		If the optional "seed" parameter is given, the random number generators are seeded with it before the algorithm is initialized, so that runs with the same input are repeated exactly (for benchmark runs).
 
 		"""
+		if self.params.get("seed") is not None:
+			random.seed(self.params["seed"])
+			np.random.seed(self.params["seed"])
+
 		if self.params["method"] == "rrt_basic":
 			if print_vertex == True:
 				print("-- Using Basic RRT Algorithm")
@@ -77,39 +119,146 @@ class Solution:
 				self.domain_object,
 				self.recorder,
 				self.params)
+
+		elif self.params["method"] == "rrt_star_lazy":
+			print("-- Using Lazy RRT Star Algorithm")
+			self.algorithm = RRT_Star_Lazy(
+				self.domain_object,
+				self.recorder,
+				self.params)
+
+		elif self.params["method"] == "rrt_star_informed":
+			print("-- Using Informed RRT Star Algorithm")
+			self.algorithm = RRT_Star_Informed(
+				self.domain_object,
+				self.recorder,
+				self.params)
+
+		elif self.params["method"] == "rrt_connect":
+			print("-- Using RRT Connect Algorithm")
+			self.algorithm = RRT_Connect(
+				self.domain_object,
+				self.recorder,
+				self.params)
+
+		elif self.params["method"] == "fmt_star":
+			print("-- Using FMT Star Algorithm")
+			self.algorithm = FMT_Star(
+				self.domain_object,
+				self.recorder,
+				self.params)
+
+		elif self.params["method"] in ["prm", "lazy_prm"]:
+			print("-- Using PRM Algorithm" if self.params["method"] == "prm" else "-- Using Lazy PRM Algorithm")
+			self.algorithm = PRM(
+				self.domain_object,
+				self.recorder,
+				self.params)
 		else:
 			exit("ERROR: No Valid Method")		
 
+		# The algorithms that track the goals themselves (rrt_star_informed) share their tracker, so that every vertex is only tested against the goals once
+		if hasattr(self.algorithm, "goal_tracker"):
+			self.goal_tracker = self.algorithm.goal_tracker
+
+		start_time = time.perf_counter()
+		self.termination_reason = "n_trials"
+		self.best_cost_history = []
+
 		for trial in range(1,self.params["n_trials"]):
 			self.algorithm.rrt_step(trial,print_vertex)
+			self.goal_tracker.update()
+			self.n_iterations = trial
 
-	def process_vertex_list(self):
-		"""  This function post-processes the full vertex list generated from completing the specified number of iterations.
+			reason = self.check_termination(trial, time.perf_counter() - start_time)
+			if reason is not None:
+				self.termination_reason = reason
+				break
+
+		if print_vertex == True:
+			print("-- Stopped after", self.n_iterations, "iterations:", self.termination_reason)
+			sampler = self.algorithm.sample_buffer
+			print("-- Sampler acceptance rate:", round(sampler.acceptance_rate, 3), "configurations used:", sampler.n_returned)
+
+	def check_termination(self, trial, elapsed):
+		"""  This function checks the optional termination policies specified in the input parameters.
+
+		The policies are checked in the following order::
 
-		Iterates through the number of goals specified in the domain to find how many vertices in the :obj:`~solver.recorder.Recorder` object are within the goal area. Calls the :meth:`~solver.solution.Solution.check_if_goal_reached` function.
+			stop_at_goals: if true, stop as soon as every goal has been reached
 
-		Out of the vertices that have reached the goal it then find the index of the vertex that results in the lowest cost (most optimal) path to the goal. Calls the :meth:`~solver.solution.Solution.find_lowest_cost()` function.
+			time_limit: stop when the run has taken longer than this number of seconds
 
-		Appends the full lowest cost path (from origin to goal) returned by the :meth:`~solver.solution.Solution.find_path()` function to the `solution_path` variable.
+			cost_tolerance, cost_window: stop when the sum of the lowest path costs to all of the goals has improved by less than cost_tolerance over the last cost_window iterations (100 by default)
+
+		Parameters:
+			trial (:obj:`int`): The iteration just completed.
+			elapsed (:obj:`float`): The time in seconds since the start of the run.
+
+		Returns:
+			reason (:obj:`str`): The name of the policy that was met, or :obj:`None` if the run should continue.
+
+		"""
+		if self.params.get("stop_at_goals", False) and self.all_goals_reached():
+			return "goals_reached"
+
+		time_limit = self.params.get("time_limit")
+		if time_limit is not None and elapsed >= time_limit:
+			return "time_limit"
+
+		tolerance = self.params.get("cost_tolerance")
+		if tolerance is not None:
+			window = self.params.get("cost_window", 100)
+			self.best_cost_history.append(self.best_total_cost())
+			if len(self.best_cost_history) > window:
+				improvement = self.best_cost_history[-window-1] - self.best_cost_history[-1]
+				if improvement < tolerance:
+					return "cost_converged"
+
+		return None
+
+	def all_goals_reached(self):
+		"""  This function checks whether every goal has been reached by at least one vertex.
+		"""
+		return all(len(members) > 0 for members in self.goal_tracker.members)
+
+	def best_total_cost(self):
+		"""  This function returns the sum of the lowest path costs to all of the goals, :obj:`numpy.nan` if a goal has not been reached.
+		"""
+		if not self.all_goals_reached():
+			return np.nan
+
+		return float(sum(self.recorder.costs[self.goal_tracker.best_vertex(i)] for i in range(len(self.domain_object.goals))))
+
+	def process_vertex_list(self):
+		"""  This function post-processes the full vertex list generated from completing the specified number of iterations.
+
+		Appends the current lowest cost path (from origin to goal) of every goal, returned by the :meth:`~solver.solution.Solution.current_paths()` function, to the `solution_path` variable.
 
 		Note:
 			If no vertex has reached the goal then the saved path is :obj:`numpy.nan`
 
 		"""
-		for goal in self.domain_object.goals:
-			reached_goal_index = self.check_if_goal_reached(goal)
+		self.solution_path.extend(self.current_paths())
 
-			if np.isnan(reached_goal_index[0]):
-				index = reached_goal_index[0]
-			else:
-				index = self.find_lowest_cost(reached_goal_index)
+	def current_paths(self):
+		"""  This function returns the lowest cost path to every goal found so far, it can be called at any point of the run.
 
-			self.solution_path.append(self.find_path(index))
+		The vertices recorded since the last step are first tested against the goals with the :meth:`~solver.goal_tracker.GoalTracker.update()` method. For each goal the lowest cost vertex inside it is then found with the :meth:`~solver.goal_tracker.GoalTracker.best_vertex()` method, and its path is created with the :meth:`~solver.solution.Solution.find_path()` function.
+
+		Returns:
+			paths (:obj:`list` of :obj:`list` of :obj:`int`): A path from origin to each goal in the form of vertex indices. The path is :obj:`numpy.nan` for the goals that are not reached.
+
+		"""
+		self.goal_tracker.update()
+
+		paths, vertices, costs = self.find_paths([self.goal_tracker.best_vertex(i) for i in range(len(self.domain_object.goals))])
+		return paths
 
 	def check_if_goal_reached(self,goal):
 		"""  This function checks which vertices have reached a single goal.
 
-		Uses the goal object's :meth:`~input.shape.Shape.is_point_inside()` method to find and save all the vertices that are inside and hence have reached the goal.
+		Uses the goal object's :meth:`~input.shape.Shape.is_point_inside()` method to find and save all the vertices that are inside and hence have reached the goal. Only the recorded vertices (the `live_vertices` view of the :obj:`~solver.recorder.Recorder` object) are checked.
 
 		Parameters:
 			goal: A shape object specfied as the target for the algorithm.	
@@ -119,12 +268,9 @@ class Solution:
 		"""
 		reached_goal_index = []
 
-		for i, vertex in enumerate(self.recorder.vertices):
-			if any(x == True for x in np.isnan(vertex)):
-				return reached_goal_index
-			else:
-				if(goal.is_point_inside(vertex)):
-					reached_goal_index.append(i)
+		for i, vertex in enumerate(self.recorder.live_vertices):
+			if(goal.is_point_inside(vertex)):
+				reached_goal_index.append(i)
 
 		if len(reached_goal_index) == 0:
 			reached_goal_index.append(np.nan)
@@ -174,17 +320,46 @@ class Solution:
 			Parent of vertex i is j, then recorder.parents[i] == j
 
 			For the origin vertex, recorder.parents[0] == -1
+
+			The path is found with the :meth:`~solver.recorder.Recorder.extract_paths()` method, use :meth:`~solver.solution.Solution.find_paths()` for many end vertices.
 		"""
-		path_list = []
-		path_list.append(index)
-		child = index
-
-		while child > 0:
-			parent = int(self.recorder.parents[child])
-			path_list.append(parent)
-			
-			child = parent #Set the parent index, as the child for next loop
-		
-		path_list.reverse()		
+		if np.isnan(index):
+			return [index]
+
+		path_list, offsets = self.recorder.extract_paths([index])
+
+		return path_list.tolist()
+
+	def find_paths(self, indices):
+		"""  This function creates the paths from the origin to many end vertices at once, with the coordinates of their vertices and their total costs.
+
+		All of the paths are extracted from the parents list in the :obj:`~solver.recorder.Recorder` object together, with the :meth:`~solver.recorder.Recorder.extract_paths()` method.
+
+		Parameters:
+			indices (:obj:`list` of :obj:`int`): The indices of the end vertices. An index can be :obj:`numpy.nan` (goal not reached).
+		Returns:
+			paths (:obj:`list` of :obj:`list` of :obj:`int`): For each end vertex, the list of ordered vertex indices for the path from the origin to the end vertex, or [:obj:`numpy.nan`] for a :obj:`numpy.nan` index.
+
+			vertices (:obj:`list` of :obj:`numpy.ndarray` of :obj:`float`): For each end vertex, the coordinates of the vertices of its path, one per row, or :obj:`numpy.nan` for a :obj:`numpy.nan` index.
+
+			costs (:obj:`numpy.ndarray` of :obj:`float`): The total path cost to each end vertex, :obj:`numpy.nan` for a :obj:`numpy.nan` index.
+
+		"""
+		indices = np.array(indices, dtype=float).ravel()
+		found = ~np.isnan(indices)
+		targets = indices[found].astype(int)
+
+		flat, offsets = self.recorder.extract_paths(targets)
+		flat_vertices = self.recorder.vertices[flat]
+		flat_paths = flat.tolist()
+
+		paths = [[np.nan] for index in indices]
+		vertices = [np.nan for index in indices]
+		costs = np.full(len(indices), np.nan)
+		costs[found] = self.recorder.costs[targets]
+
+		for k, i in enumerate(np.nonzero(found)[0]):
+			paths[i] = flat_paths[offsets[k]:offsets[k+1]]
+			vertices[i] = flat_vertices[offsets[k]:offsets[k+1]]
 
-		return path_list
\ No newline at end of file
+		return paths, vertices, costs
\ No newline at end of file
@@ -0,0 +1,61 @@
+# test_aabb_tree.py
+# Author(s): Vivek Kumar
+import numpy as np
+from input.aabb_tree import AABBTree
+from input.domain_class import Domain
+
+
+def test_query_point():
+  lower = np.array([[0.0, 0.0], [2.0, 0.0], [0.0, 2.0], [1.0, 1.0]])
+  upper = lower + 1.0
+  tree = AABBTree(lower, upper, leaf_size=1)
+  assert tree.query_point(np.array([0.5, 0.5]))==[0]
+  assert tree.query_point(np.array([1.0, 1.0]))==[0, 3] # corner is touching both boxes
+  assert tree.query_point(np.array([2.5, 2.5]))==[]
+
+def test_query_edge_matches_brute_force():
+  rng = np.random.RandomState(0)
+  lower = rng.rand(50, 2)*10.0
+  upper = lower + rng.rand(50, 2)
+  tree = AABBTree(lower, upper, tolerance=0.0)
+  for i in range(200):
+    point_1 = rng.rand(2)*10.0
+    point_2 = point_1 + rng.rand(2)*2.0-1.0
+    # boxes touched by the edge, found by sampling the edge densely
+    t = np.linspace(0.0, 1.0, 2001)[:,np.newaxis]
+    points = point_1 + t*(point_2-point_1)
+    touched = [j for j in range(50) if np.any(np.all((points >= lower[j]) & (points <= upper[j]), axis=1))]
+    found = tree.query_edge(point_1, point_2)
+    assert set(touched) <= set(found)
+    for j in found:
+      # every box found is touched by the edge (slab test, without the tree)
+      assert AABBTree(lower[j:j+1], upper[j:j+1], tolerance=0.0).query_edge(point_1, point_2)==[0]
+
+def test_axis_aligned_edge():
+  tree = AABBTree(np.array([[0.0, 0.0]]), np.array([[1.0, 1.0]]))
+  assert tree.query_edge(np.array([-1.0, 0.5]), np.array([2.0, 0.5]))==[0]
+  assert tree.query_edge(np.array([0.5, 1.5]), np.array([0.5, 3.0]))==[]
+  assert tree.query_edge(np.array([-1.0, 1.0]), np.array([2.0, 1.0]))==[0] # edge along the boundary
+
+def test_domain_is_edge_blocked():
+  domain_info = {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [0.0, 0.0], 'upper_right': [4.0, 4.0]}
+  obstacles_info = {
+    'obstacle_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.5, 'center': [1.0, 1.0]},
+    'obstacle_2': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [2.5, 2.5], 'upper_right': [3.5, 3.0]},
+    'obstacle_3': {'dim': 2, 'shape_type': 'free_form', 'bitmap_file': './test/test_rectangle.pbm', 'bb_lower_left': [0.5, 2.5], 'bb_upper_right': [1.5, 3.5]}}
+  origin_goal_info = {'origin': [0.1, 0.1], 'goals': {}}
+  domain = Domain(domain_info, obstacles_info, origin_goal_info)
+  assert len(domain.obstacle_tree)==3 # too few rectangles to use the packed arrays
+  assert domain.rectangle_obstacles.tolist()==[1]
+
+  rng = np.random.RandomState(1)
+  for i in range(200):
+    point_1 = rng.rand(2)*4.0
+    point_2 = rng.rand(2)*4.0
+    blocked = False
+    for obstacle in domain.obstacles:
+      if(obstacle.is_point_inside(point_1) or obstacle.is_point_inside(point_2) or obstacle.is_intersected_by_edge(point_1, point_2)):
+        blocked = True
+        break
+    assert domain.is_edge_blocked(point_1, point_2)==blocked
+    assert domain.is_point_blocked(point_1)==any(obstacle.is_point_inside(point_1) for obstacle in domain.obstacles)
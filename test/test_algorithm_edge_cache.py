@@ -0,0 +1,37 @@
+import unittest
+
+from algorithm.edge_cache import EdgeCache
+
+class TestEdgeCache(unittest.TestCase):
+	def setUp(self):
+		self.cache = EdgeCache(max_size=2)
+
+	def tearDown(self):
+		self.cache = None
+
+
+	def test_edge_cache_00_lookup(self):
+		self.assertIsNone(self.cache.lookup(1, 2), "result returned from empty cache")
+
+		self.cache.store(1, 2, True)
+		self.cache.store(3, 1, False)
+
+		self.assertTrue(self.cache.lookup(2, 1), "edge result incorrect")
+		self.assertFalse(self.cache.lookup(1, 3), "edge result incorrect")
+		self.assertEqual((self.cache.hits, self.cache.misses), (2, 1), "hit and miss counters incorrect")
+		self.assertAlmostEqual(self.cache.hit_rate, 2.0/3.0, 12, "hit rate incorrect")
+
+
+	def test_edge_cache_01_least_recently_used(self):
+		self.cache.store(0, 1, False)
+		self.cache.store(0, 2, False)
+		self.cache.lookup(0, 1)
+		self.cache.store(0, 3, True)
+
+		self.assertEqual(len(self.cache), 2, "cache size not bounded")
+		self.assertIsNone(self.cache.lookup(0, 2), "least recently used edge not dropped")
+		self.assertFalse(self.cache.lookup(0, 1), "recently used edge dropped")
+
+
+if __name__ == '__main__':
+	unittest.main()
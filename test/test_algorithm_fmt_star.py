@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from algorithm.fmt_star import FMT_Star
+from solver.recorder import Recorder
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [2.5, 3.5]}
+		}
+	}
+
+obstacles_info = {
+	'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [1.0, 0.0], 'upper_right': [1.2, 0.5]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'fmt_star',
+	'n_trials': 400,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+class TestFMT_Star(unittest.TestCase):
+	def setUp(self):
+		np.random.seed(2)
+		self.recorder = Recorder(rrt_algorithm_info)
+		self.algorithm = FMT_Star(domain_test, self.recorder, rrt_algorithm_info)
+
+	def tearDown(self):
+		self.algorithm = None
+
+
+	def test_fmt_star_00_samples(self):
+		self.assertTrue(np.array_equal(self.algorithm.samples[0], [0.1, 0.1]), "origin not the first sample")
+		self.assertEqual(self.algorithm.sample_buffer.n_returned, rrt_algorithm_info['n_trials'] - 3, "number of samples drawn incorrect")
+		self.assertLess(len(self.algorithm.samples), rrt_algorithm_info['n_trials'] - 1, "blocked samples kept")
+		self.assertTrue(domain_test.goals[0].is_point_inside(self.algorithm.samples[-1]), "no sample added inside the goal")
+		self.assertFalse(np.any(domain_test.points_blocked(self.algorithm.samples)), "blocked sample kept")
+
+
+	def test_fmt_star_01_neighbors(self):
+		samples = self.algorithm.samples
+		dist = np.linalg.norm(samples[:,np.newaxis,:] - samples[np.newaxis,:,:], axis=2)
+
+		indices = np.array([0, 5, 17])
+		owners, neighbors, neighbor_dist = self.algorithm.gather_neighbors(indices)
+		for k, index in enumerate(indices):
+			expected = np.nonzero((dist[index] <= self.algorithm.radius) & (np.arange(len(samples)) != index))[0]
+			self.assertEqual(sorted(neighbors[owners == k].tolist()), expected.tolist(), "neighbors incorrect")
+			self.assertTrue(np.allclose(neighbor_dist[owners == k], dist[index, neighbors[owners == k]]), "neighbor distances incorrect")
+
+
+	def test_fmt_star_02_lowest_cost_parent(self):
+		params = dict(rrt_algorithm_info, connection_radius=1.0)
+		algorithm = FMT_Star(domain_test, Recorder(params), params)
+		algorithm.samples = np.array([[0.1, 0.1], [0.8, 0.2], [0.6, 0.8], [1.4, 0.55]])
+		algorithm.find_neighbors()
+		algorithm.sample_costs = np.array([0.0, np.inf, np.inf, np.inf])
+		algorithm.sample_rows = np.array([0, -1, -1, -1])
+		algorithm.is_open = np.array([True, False, False, False])
+		algorithm.is_unvisited = np.array([False, True, True, True])
+
+		algorithm.rrt_step(1, print_vertex=False)
+		self.assertEqual(algorithm.recorder.n_vertices, 3, "neighbors of the origin not connected")
+
+		# The lowest cost parent of the last sample is behind the obstacle, it is only connected once that parent is closed
+		algorithm.rrt_step(2, print_vertex=False)
+		self.assertEqual(algorithm.recorder.n_vertices, 3, "edge through the obstacle accepted")
+
+		algorithm.rrt_step(3, print_vertex=False)
+		recorder = algorithm.recorder
+		self.assertEqual(recorder.n_vertices, 4, "sample not connected")
+		self.assertEqual(recorder.parents[3], 2, "parent incorrect")
+		self.assertAlmostEqual(recorder.costs[3], np.linalg.norm([0.5, 0.7]) + np.linalg.norm([0.8, 0.25]), 12, "cost incorrect")
+
+
+	def test_fmt_star_03_costs(self):
+		for trial in range(1, rrt_algorithm_info['n_trials']):
+			self.algorithm.rrt_step(trial, print_vertex=False)
+
+		recorder = self.recorder
+		parents = recorder.live_parents[1:].astype(int)
+		edges = np.linalg.norm(recorder.live_vertices[1:] - recorder.vertices[parents], axis=1)
+
+		self.assertEqual(len(self.algorithm.open_heap), 0, "wavefront not expanded in n_trials steps")
+		self.assertTrue(np.all(parents < np.arange(1, recorder.n_vertices)), "parent recorded after its child")
+		self.assertTrue(np.allclose(recorder.live_costs[1:], recorder.costs[parents] + edges), "costs not consistent with parents")
+		self.assertFalse(np.any(domain_test.edges_blocked(recorder.live_vertices[1:], recorder.vertices[parents])), "blocked edge in the tree")
+
+
+if __name__ == '__main__':
+	unittest.main()
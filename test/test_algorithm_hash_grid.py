@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+
+from algorithm.hash_grid import HashGrid
+
+class TestHashGrid(unittest.TestCase):
+	def setUp(self):
+		self.grid = HashGrid(0.3, 2)
+
+	def tearDown(self):
+		self.grid = None
+
+
+	def test_hash_grid_00_empty(self):
+		indices, dist = self.grid.query_radius(np.array([0.0, 0.0]), 0.3)
+
+		self.assertEqual(indices.tolist(), [], "indices returned from empty grid")
+		self.assertEqual(dist.tolist(), [], "distances returned from empty grid")
+
+
+	def test_hash_grid_01_matches_brute_force(self):
+		rng = np.random.RandomState(0)
+		vertices = rng.rand(1000, 2)*4.0 - 2.0
+
+		for i, vertex in enumerate(vertices):
+			self.grid.insert(i, vertex)
+
+		for query in rng.rand(100, 2)*4.0 - 2.0:
+			for radius in [0.1, 0.3, 0.7]:
+				indices, dist = self.grid.query_radius(query, radius)
+
+				dist_brute = np.linalg.norm(vertices - query, axis=1)
+				indices_brute = np.nonzero(dist_brute <= radius)[0]
+
+				self.assertEqual(indices.tolist(), indices_brute.tolist(), "neighbor indices differ from brute force")
+				self.assertTrue(np.allclose(dist, dist_brute[indices_brute]), "neighbor distances differ from brute force")
+
+
+	def test_hash_grid_02_perimeter(self):
+		self.grid.insert(0, np.array([0.0, 0.0]))
+		self.grid.insert(1, np.array([0.5, 0.0]))
+
+		indices, dist = self.grid.query_radius(np.array([0.25, 0.0]), 0.25)
+
+		self.assertEqual(indices.tolist(), [0, 1], "points on the perimeter not included")
+		self.assertTrue(np.allclose(dist, [0.25, 0.25]), "distances incorrect")
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from algorithm.informed_sampler import InformedSampler
+from input.shape_rectangle import Rectangle
+
+domain_info = {
+	'dim': 2,
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+class TestInformedSampler(unittest.TestCase):
+	def setUp(self):
+		np.random.seed(3)
+		self.sampler = InformedSampler(Rectangle(domain_info), [0.5, 0.5], batch_size=64)
+
+	def tearDown(self):
+		self.sampler = None
+
+
+	def test_informed_sampler_00_inactive(self):
+		self.assertFalse(self.sampler.is_active, "sampler active without a solution")
+		self.assertEqual(len(self.sampler), 0, "buffer not empty")
+
+
+	def test_informed_sampler_01_rotation(self):
+		axis = np.array([1.0, 1.0])
+		rotation = InformedSampler.rotation_to_world(axis, np.linalg.norm(axis))
+
+		self.assertTrue(np.allclose(rotation @ [1.0, 0.0], axis/np.linalg.norm(axis)), "first axis not mapped onto the focal axis")
+		self.assertAlmostEqual(np.linalg.det(rotation), 1.0, 12, "rotation matrix incorrect")
+
+
+	def test_informed_sampler_02_points_inside_ellipse(self):
+		goal = np.array([2.5, 3.0])
+		self.sampler.set_solution([goal], [3.5])
+		points = np.array([self.sampler.next() for i in range(200)])
+
+		to_foci = np.linalg.norm(points - [0.5, 0.5], axis=1) + np.linalg.norm(points - goal, axis=1)
+		self.assertTrue(self.sampler.is_active, "sampler not active")
+		self.assertTrue(np.all(to_foci <= 3.5 + 1e-9), "point outside of the informed set")
+		self.assertTrue(np.all(self.sampler.shape.points_inside(points)), "point outside of the domain")
+
+
+	def test_informed_sampler_03_union(self):
+		goals = np.array([[2.5, 0.5], [0.5, 3.5]])
+		self.sampler.set_solution(goals, [2.2, 3.2])
+		points = np.array([self.sampler.next() for i in range(400)])
+
+		to_foci = np.linalg.norm(points - [0.5, 0.5], axis=1)[:,np.newaxis] + np.linalg.norm(points[:,np.newaxis,:] - goals, axis=2)
+		inside = to_foci <= np.array([2.2, 3.2]) + 1e-9
+		self.assertTrue(np.all(inside.any(axis=1)), "point outside of the union of the ellipses")
+		self.assertTrue(np.all(inside.sum(axis=0) > 0), "ellipse never sampled")
+
+
+	def test_informed_sampler_04_shrink_tolerance(self):
+		goal = np.array([2.5, 3.0])
+		self.sampler.set_solution([goal], [4.0])
+		self.sampler.next()
+		n_left = len(self.sampler)
+
+		self.sampler.set_solution([goal], [3.99])
+		self.assertEqual(len(self.sampler), n_left, "buffer cleared for a small cost decrease")
+
+		self.sampler.set_solution([goal], [3.5])
+		self.assertEqual(len(self.sampler), 0, "buffer not cleared for a large cost decrease")
+
+		self.sampler.next()
+		self.sampler.set_solution([[2.4, 3.0]], [3.5])
+		self.assertEqual(len(self.sampler), 0, "buffer not cleared for a new goal vertex")
+
+
+if __name__ == '__main__':
+	unittest.main()
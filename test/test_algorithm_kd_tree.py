@@ -0,0 +1,100 @@
+import unittest
+
+import numpy as np
+
+from algorithm.kd_tree import KDTree
+from algorithm.vertex import Vertex
+
+class TestKDTree(unittest.TestCase):
+	def setUp(self):
+		self.tree = KDTree(2, leaf_size=4)
+
+	def tearDown(self):
+		self.tree = None
+
+
+	def test_kd_tree_00_single_point(self):
+		self.tree.insert(0, np.array([0.1, 0.1]))
+
+		index, dist = self.tree.nearest(np.array([0.1, 0.3]))
+
+		self.assertEqual(index, 0, "nearest index incorrect")
+		self.assertAlmostEqual(dist, 0.2, 7, "nearest distance incorrect")
+
+
+	def test_kd_tree_01_matches_brute_force(self):
+		rng = np.random.RandomState(0)
+		vertices = rng.rand(500, 2)
+
+		for i, vertex in enumerate(vertices):
+			self.tree.insert(i, vertex)
+
+		for query in rng.rand(200, 2):
+			index, dist = self.tree.nearest(query)
+			index_brute, dist_brute = Vertex.find_nearest_vertex(vertices, query)
+
+			self.assertEqual(index, index_brute, "nearest index differs from brute force")
+			self.assertAlmostEqual(dist, dist_brute, 12, "nearest distance differs from brute force")
+
+
+	def test_kd_tree_02_incremental_queries(self):
+		rng = np.random.RandomState(1)
+		vertices = rng.rand(300, 3)
+		self.tree = KDTree(3, leaf_size=4)
+
+		for i, vertex in enumerate(vertices):
+			self.tree.insert(i, vertex)
+			query = rng.rand(3)
+
+			index, dist = self.tree.nearest(query)
+			index_brute, dist_brute = Vertex.find_nearest_vertex(vertices[:i+1], query)
+
+			self.assertEqual(index, index_brute, "nearest index differs from brute force")
+			self.assertAlmostEqual(dist, dist_brute, 12, "nearest distance differs from brute force")
+
+
+	def test_kd_tree_03_duplicate_points(self):
+		for i in range(20):
+			self.tree.insert(i, np.array([1.0, 1.0]))
+		self.tree.insert(20, np.array([2.0, 2.0]))
+
+		index, dist = self.tree.nearest(np.array([1.1, 1.0]))
+
+		self.assertEqual(index, 0, "lowest index of tied points not returned")
+		self.assertAlmostEqual(dist, 0.1, 7, "nearest distance incorrect")
+
+		index, dist = self.tree.nearest(np.array([2.0, 2.1]))
+		self.assertEqual(index, 20, "nearest index incorrect")
+
+
+	def test_kd_tree_04_rebuild(self):
+		for i in range(100):
+			self.tree.insert(i, np.array([i*0.01, 0.0]))
+
+		self.assertEqual(len(self.tree), 100, "number of points incorrect")
+		self.assertGreaterEqual(self.tree.n_rebuild, 100, "tree not rebalanced")
+
+		index, dist = self.tree.nearest(np.array([0.504, 0.0]))
+		self.assertEqual(index, 50, "nearest index incorrect")
+
+
+	def test_kd_tree_05_new_vertex(self):
+		vertices = np.array(
+			[[0.0, 1.0],
+			[0.0, 0.0],
+			[1.0, 1.05]]
+		)
+		for i, vertex in enumerate(vertices):
+			self.tree.insert(i, vertex)
+
+		new_q = [0.3, 0.3]
+
+		v, i, d = Vertex.new_vertex(vertices, new_q, 0.2, self.tree)
+
+		self.assertEqual(v[1], 0.141421, "new vertex incorrect")
+		self.assertEqual(i, 1, "index of vertex wrong")
+		self.assertEqual(d, 0.2, "distance of vertex wrong")
+
+
+if __name__ == '__main__':
+	unittest.main()
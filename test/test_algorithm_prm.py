@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from algorithm.prm import PRM
+from algorithm.roadmap import Roadmap
+from solver.recorder import Recorder
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [2.5, 3.5]},
+		'goal_2': {'dim': 2, 'shape_type': 'circle', 'radius': 0.01, 'center': [2.5, 0.5]}
+		}
+	}
+
+obstacles_info = {
+	'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [1.0, 0.0], 'upper_right': [1.2, 3.0]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'lazy_prm',
+	'n_trials': 400,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+class TestPRM(unittest.TestCase):
+	def setUp(self):
+		np.random.seed(2)
+		self.folder = tempfile.TemporaryDirectory()
+		self.params = dict(rrt_algorithm_info, roadmap_folder=self.folder.name)
+		self.recorder = Recorder(self.params)
+		self.algorithm = PRM(domain_test, self.recorder, self.params)
+
+	def tearDown(self):
+		self.algorithm = None
+		self.folder.cleanup()
+
+	def solve(self, algorithm):
+		trial = 1
+		while not algorithm.solved:
+			algorithm.rrt_step(trial, print_vertex=False)
+			trial += 1
+		return trial - 1
+
+
+	def test_prm_00_roadmap(self):
+		roadmap = self.algorithm.roadmap
+		self.assertFalse(self.algorithm.loaded, "roadmap loaded from an empty folder")
+		self.assertEqual(self.algorithm.sample_buffer.n_returned, rrt_algorithm_info['n_trials'], "number of samples drawn incorrect")
+		self.assertFalse(np.any(domain_test.points_blocked(roadmap.samples)), "blocked sample kept")
+		self.assertTrue(np.all(roadmap.edge_state == Roadmap.UNKNOWN), "edges checked by the lazy algorithm")
+
+		# The small goal has no roadmap sample, a point is added inside it
+		self.assertGreater(len(self.algorithm.goal_members[0]), 0, "no roadmap sample inside the goal")
+		self.assertIsNone(self.algorithm.goal_points[0], "point added inside a goal with roadmap samples")
+		self.assertTrue(domain_test.goals[1].is_point_inside(self.algorithm.goal_points[1]), "no point added inside the goal")
+		self.assertTrue(np.all(np.linalg.norm(roadmap.samples[self.algorithm.origin_neighbors] - [0.1, 0.1], axis=1) <= roadmap.radius), "origin neighbors incorrect")
+
+
+	def test_prm_01_paths(self):
+		self.solve(self.algorithm)
+
+		recorder = self.recorder
+		parents = recorder.live_parents[1:].astype(int)
+		edges = np.linalg.norm(recorder.live_vertices[1:] - recorder.vertices[parents], axis=1)
+
+		self.assertTrue(np.all(parents < np.arange(1, recorder.n_vertices)), "parent recorded after its child")
+		self.assertTrue(np.allclose(recorder.live_costs[1:], recorder.costs[parents] + edges), "costs not consistent with parents")
+		self.assertFalse(np.any(domain_test.edges_blocked(recorder.live_vertices[1:], recorder.vertices[parents])), "blocked edge in a path")
+		for goal in domain_test.goals:
+			self.assertTrue(np.any(goal.points_inside(recorder.live_vertices)), "goal not reached")
+
+		# Only some of the edges are checked, and the steps after the solution do nothing
+		self.assertLess(self.algorithm.roadmap.n_checked, len(self.algorithm.roadmap.edge_ends), "all edges checked")
+		n_vertices = recorder.n_vertices
+		self.algorithm.rrt_step(0, print_vertex=False)
+		self.assertEqual(recorder.n_vertices, n_vertices, "vertices added after the solution")
+
+
+	def test_prm_02_reuse(self):
+		self.solve(self.algorithm)
+		n_checked = self.algorithm.roadmap.n_checked
+
+		# The second query on the same map loads the roadmap and its known edges
+		algorithm = PRM(domain_test, Recorder(self.params), self.params)
+		self.assertTrue(algorithm.loaded, "roadmap not loaded")
+		self.assertTrue(np.array_equal(algorithm.roadmap.samples, self.algorithm.roadmap.samples), "roadmap samples changed")
+		self.assertEqual(np.count_nonzero(algorithm.roadmap.edge_state), n_checked, "known edge states not loaded")
+
+		self.solve(algorithm)
+		self.assertEqual(algorithm.roadmap.n_checked, 0, "known edges checked again")
+		for goal in domain_test.goals:
+			self.assertTrue(np.any(goal.points_inside(algorithm.recorder.live_vertices)), "goal not reached")
+
+
+	def test_prm_03_standard(self):
+		params = dict(self.params, method="prm", roadmap_folder=os.path.join(self.folder.name, "prm"))
+		algorithm = PRM(domain_test, Recorder(params), params)
+		self.assertTrue(np.all(algorithm.roadmap.edge_state != Roadmap.UNKNOWN), "edges not checked by the standard algorithm")
+		self.solve(algorithm)
+		self.assertFalse(np.any(domain_test.edges_blocked(algorithm.recorder.live_vertices[1:], algorithm.recorder.vertices[algorithm.recorder.live_parents[1:].astype(int)])), "blocked edge in a path")
+
+
+if __name__ == '__main__':
+	unittest.main()
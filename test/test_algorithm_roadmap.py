@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from algorithm.roadmap import Roadmap
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [2.5, 3.5]}
+		}
+	}
+
+obstacles_info = {
+	'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [1.0, 0.0], 'upper_right': [1.2, 0.5]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'lazy_prm',
+	'n_trials': 400,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+class TestRoadmap(unittest.TestCase):
+	def setUp(self):
+		# Four samples on a line, the obstacle is between samples 1 and 2
+		self.roadmap = Roadmap(np.array([[0.1, 0.2], [0.8, 0.2], [1.4, 0.2], [0.9, 1.0]]), 0.95)
+
+	def tearDown(self):
+		self.roadmap = None
+
+
+	def test_roadmap_00_edges(self):
+		self.assertEqual(self.roadmap.edge_ends.tolist(), [[0, 1], [1, 2], [1, 3], [2, 3]], "edges incorrect")
+		self.assertTrue(np.all(self.roadmap.edge_state == Roadmap.UNKNOWN), "edge states not unknown")
+
+		# Both directions of an edge share the same edge
+		roadmap = self.roadmap
+		for u in range(len(roadmap.samples)):
+			for k in range(roadmap.neighbor_start[u], roadmap.neighbor_start[u + 1]):
+				v = roadmap.neighbor_indices[k]
+				self.assertEqual(sorted([u, v]), roadmap.edge_ends[roadmap.neighbor_edges[k]].tolist(), "edge of neighbor incorrect")
+
+
+	def test_roadmap_01_check_edges(self):
+		blocked = self.roadmap.check_edges(domain_test, [1, 0, 1])
+		self.assertEqual(blocked.tolist(), [True, False, True], "blocked edges incorrect")
+		self.assertEqual(self.roadmap.edge_state.tolist(), [Roadmap.FREE, Roadmap.BLOCKED, Roadmap.UNKNOWN, Roadmap.UNKNOWN], "edge states incorrect")
+		self.assertEqual(self.roadmap.n_checked, 2, "edge checked more than once")
+
+		self.roadmap.check_edges(domain_test, [0, 1, 2])
+		self.assertEqual(self.roadmap.n_checked, 3, "known edges checked again")
+
+
+	def test_roadmap_02_shortest_paths(self):
+		dist, pred, pred_edge = self.roadmap.shortest_paths(np.array([0]), np.array([0.5]))
+		self.assertTrue(np.allclose(dist, [0.5, 1.2, 1.8, 1.2 + np.hypot(0.1, 0.8)]), "distances incorrect")
+		self.assertEqual(pred.tolist(), [-1, 0, 1, 1], "previous samples incorrect")
+		self.assertEqual(pred_edge.tolist(), [-1, 0, 1, 2], "previous edges incorrect")
+
+		# The blocked edge is avoided
+		self.roadmap.check_edges(domain_test, [1])
+		dist, pred, pred_edge = self.roadmap.shortest_paths(np.array([0]), np.array([0.5]))
+		self.assertEqual(pred.tolist(), [-1, 0, 3, 1], "blocked edge used")
+		self.assertAlmostEqual(dist[2], 1.2 + np.hypot(0.1, 0.8) + np.hypot(0.5, 0.8), 12, "distance incorrect")
+
+		# Samples that cannot be reached
+		self.roadmap.edge_state[0] = Roadmap.BLOCKED
+		dist, pred, pred_edge = self.roadmap.shortest_paths(np.array([0]), np.array([0.0]))
+		self.assertTrue(np.all(np.isinf(dist[1:])), "blocked sample reached")
+		self.assertEqual(pred.tolist(), [-1, -1, -1, -1], "previous samples incorrect")
+
+
+	def test_roadmap_03_save_load(self):
+		self.roadmap.check_edges(domain_test, [0, 1])
+		with tempfile.TemporaryDirectory() as folder:
+			file = os.path.join(folder, 'roadmaps', 'roadmap.npz')
+			self.assertIsNone(Roadmap.load(file), "missing file loaded")
+
+			self.roadmap.save(file)
+			loaded = Roadmap.load(file)
+
+		self.assertTrue(np.array_equal(loaded.samples, self.roadmap.samples), "samples not loaded")
+		self.assertEqual(loaded.radius, self.roadmap.radius, "radius not loaded")
+		self.assertTrue(np.array_equal(loaded.edge_state, self.roadmap.edge_state), "edge states not loaded")
+		self.assertEqual(loaded.n_checked, 0, "checked edges not reset")
+
+		# A truncated file is not usable
+		with tempfile.TemporaryDirectory() as folder:
+			file = os.path.join(folder, 'roadmap.npz')
+			self.roadmap.save(file)
+			with open(file, 'rb') as f:
+				content = f.read()
+			for size in [0, 10, len(content)//2]:
+				with open(file, 'wb') as f:
+					f.write(content[:size])
+				self.assertIsNone(Roadmap.load(file), "truncated file loaded")
+
+
+	def test_roadmap_04_key(self):
+		key = Roadmap.key(domain_test, rrt_algorithm_info)
+		self.assertEqual(key, Roadmap.key(Domain(domain_info, obstacles_info, origin_goal_info), rrt_algorithm_info), "key not repeatable")
+
+		# The query is not part of the key
+		other_goals = dict(origin_goal_info, origin=[0.2, 0.3])
+		self.assertEqual(key, Roadmap.key(Domain(domain_info, obstacles_info, other_goals), rrt_algorithm_info), "key depends on the origin")
+
+		other_obstacles = {'obstacle_1': dict(obstacles_info['obstacle_1'], upper_right=[1.2, 0.6])}
+		self.assertNotEqual(key, Roadmap.key(Domain(domain_info, other_obstacles, origin_goal_info), rrt_algorithm_info), "key does not depend on the obstacles")
+		self.assertNotEqual(key, Roadmap.key(domain_test, dict(rrt_algorithm_info, roadmap_size=100)), "key does not depend on the roadmap size")
+		self.assertNotEqual(key, Roadmap.key(domain_test, dict(rrt_algorithm_info, n_trials=5000)), "key does not depend on the default roadmap size")
+		self.assertEqual(key, Roadmap.key(domain_test, dict(rrt_algorithm_info, roadmap_size=rrt_algorithm_info['n_trials'])), "key depends on how the roadmap size is given")
+		for name, value in [("sampler", "halton"), ("scramble", False), ("sampler_sigma", 0.1), ("uniform_fraction", 0.2), ("goal_bias", 0.1), ("seed", 3)]:
+			self.assertNotEqual(key, Roadmap.key(domain_test, dict(rrt_algorithm_info, **{name: value})), "key does not depend on " + name)
+
+
+	def test_roadmap_05_optimal_radius(self):
+		np.random.seed(0)
+		radius = Roadmap.optimal_radius(domain_test, 1000, 1000, 0.0)
+		expected = 2.0*(0.5**0.5)*(12.0/np.pi)**0.5*(np.log(1001)/1001)**0.5
+		self.assertAlmostEqual(radius, expected, 12, "radius incorrect")
+		self.assertLess(Roadmap.optimal_radius(domain_test, 4000, 4000, 0.0), radius, "radius does not decrease with the number of samples")
+
+
+	def test_roadmap_06_sample_free_point(self):
+		np.random.seed(0)
+		point = Roadmap.sample_free_point(domain_test, domain_test.goals[0])
+		self.assertEqual(point.shape, (2,), "point shape incorrect")
+		self.assertTrue(domain_test.goals[0].is_point_inside(point), "point not inside the goal")
+		self.assertIsNone(Roadmap.sample_free_point(domain_test, domain_test.obstacles[0]), "point inside an obstacle returned")
+
+
+if __name__ == '__main__':
+	unittest.main()
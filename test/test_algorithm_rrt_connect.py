@@ -0,0 +1,124 @@
+import unittest
+
+import numpy as np
+
+from algorithm.rrt_connect import RRT_Connect
+from solver.recorder import Recorder
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [2.5, 3.5]}
+		}
+	}
+
+obstacles_info = {
+	'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [0.0, 1.8], 'upper_right': [2.2, 2.2]},
+	'obstacle_2': {'dim': 2, 'shape_type': 'circle', 'radius': 0.4, 'center': [1.5, 0.5]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'rrt_connect',
+	'n_trials': 10,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+class TestRRT_Connect(unittest.TestCase):
+	def setUp(self):
+		self.recorder = Recorder(rrt_algorithm_info)
+		self.algorithm = RRT_Connect(domain_test, self.recorder, rrt_algorithm_info)
+
+	def tearDown(self):
+		self.algorithm = None
+
+
+	def test_rrt_connect_00_goal_root(self):
+		goal_root = self.algorithm.goal_recorder.vertices[0]
+
+		self.assertTrue(domain_test.goals[0].is_point_inside(goal_root), "goal tree root not in the goal")
+		self.assertEqual(self.algorithm.goal_recorder.n_vertices, 1, "goal tree not initialized")
+		self.assertEqual(self.recorder.n_vertices, 1, "start tree not initialized")
+
+
+	def test_rrt_connect_01_extend(self):
+		status, index = self.algorithm.extend(self.algorithm.trees[0], np.array([0.1, 0.15]))
+		self.assertEqual((status, index), ("reached", 1), "configuration not reached")
+
+		status, index = self.algorithm.extend(self.algorithm.trees[0], np.array([0.1, 1.0]))
+		self.assertEqual((status, index), ("advanced", 2), "tree not advanced")
+		self.assertAlmostEqual(self.recorder.costs[2], 0.25, 6, "cost of new vertex incorrect")
+
+		status, index = self.algorithm.connect(self.algorithm.trees[0], np.array([0.1, 3.0]))
+		self.assertEqual(status, "trapped", "tree not blocked by obstacle")
+		self.assertLess(self.recorder.vertices[index,1], 1.8, "vertex added inside obstacle")
+
+
+	def test_rrt_connect_02_path_to_goal(self):
+		trial = 1
+		while not self.algorithm.connected and trial < 20000:
+			self.algorithm.rrt_step(trial, print_vertex=False)
+			trial += 1
+
+		self.assertTrue(self.algorithm.connected, "trees not connected")
+
+		goal_vertex = self.algorithm.goal_vertex
+		self.assertTrue(domain_test.goals[0].is_point_inside(self.recorder.vertices[goal_vertex]), "path does not end in the goal")
+
+		child = goal_vertex
+		while child > 0:
+			parent = int(self.recorder.parents[child])
+			edge = np.linalg.norm(self.recorder.vertices[child] - self.recorder.vertices[parent])
+			self.assertFalse(domain_test.is_edge_blocked(self.recorder.vertices[parent], self.recorder.vertices[child]), "blocked edge in path")
+			self.assertAlmostEqual(self.recorder.costs[child], self.recorder.costs[parent] + edge, 5, "path cost incorrect")
+			child = parent
+
+		n_vertices = self.recorder.n_vertices
+		self.algorithm.rrt_step(trial, print_vertex=False)
+		self.assertEqual(self.recorder.n_vertices, n_vertices + 1, "start tree not grown after connection")
+
+
+	def test_rrt_connect_03_covered_goal(self):
+		covered_goal_info = {
+			'origin': [0.1, 0.1],
+			'goals': {
+				'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [2.5, 3.5]}
+				}
+			}
+		covered_obstacles_info = dict(obstacles_info, obstacle_3={'dim': 2, 'shape_type': 'circle', 'radius': 0.45, 'center': [2.5, 3.5]})
+		covered_domain = Domain(domain_info, covered_obstacles_info, covered_goal_info)
+
+		recorder = Recorder(rrt_algorithm_info)
+		algorithm = RRT_Connect(covered_domain, recorder, rrt_algorithm_info)
+		self.assertEqual(algorithm.goal_recorder.n_vertices, 0, "goal tree rooted inside an obstacle")
+		self.assertTrue(algorithm.connected, "goal tree used without a root")
+
+		for trial in range(1, rrt_algorithm_info['n_trials']):
+			algorithm.rrt_step(trial, print_vertex=False)
+		self.assertEqual(recorder.n_vertices, rrt_algorithm_info['n_trials'], "start tree not grown as basic RRT")
+		self.assertEqual(algorithm.goal_vertex, -1, "goal reached inside an obstacle")
+
+
+	def test_rrt_connect_04_goal_index(self):
+		for goal_index in [1, -1]:
+			params = dict(rrt_algorithm_info, goal_index=goal_index)
+			with self.assertRaises(Exception) as cm:
+				RRT_Connect(domain_test, Recorder(params), params)
+			self.assertNotIsInstance(cm.exception, IndexError, "goal index not checked")
+			self.assertIn("goal index", str(cm.exception))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 import numpy as np
 
 from algorithm.rrt_star import RRT_Star
+from algorithm.hash_grid import HashGrid
 from input.domain_class import Domain
 
 domain_info = {
@@ -52,8 +53,6 @@ class TestRRT_Star(unittest.TestCase):
 		recorder.costs = np.zeros(6, dtype=float)
 		recorder.costs.fill(np.nan)
 
-		recorder.parents_history = np.zeros((6,6*2), dtype=float)
-		recorder.parents_history.fill(np.nan)
 
 		self.algorithm = RRT_Star(domain_test, recorder, rrt_algorithm_info)
 
@@ -153,7 +152,7 @@ class TestRRT_Star(unittest.TestCase):
 		index = np.amax(bool_index[0])
 		self.assertEqual(step,index,"costs list not incremented")
 
-	def test_rrt_star_03_indices_extents1(self):
+	def test_rrt_star_03_indices_grid1(self):
 		self.algorithm.recorder.parents = np.array([-1,0,0,2,np.nan,np.nan])
 		self.algorithm.recorder.costs = np.array([0.0,1.2,3.2,1.4,np.nan,np.nan])
 
@@ -168,9 +167,13 @@ class TestRRT_Star(unittest.TestCase):
 
 		self.algorithm.new_v = [1.0,1.39]
 
-		indices = self.algorithm.find_indices_in_extents()
+		grid = HashGrid(0.3, 2)
+		for i in range(4):
+			grid.insert(i, self.algorithm.recorder.vertices[i])
 
-		self.assertEqual(indices,[1,2,3],"correct indices in the extents not returned")
+		indices, dist = grid.query_radius(self.algorithm.new_v, 0.3)
+
+		self.assertEqual(indices.tolist(),[1,2,3],"correct indices in the grid cells not returned")
 
 	def test_rrt_star_04_indices_neighbor1(self):
 		self.algorithm.recorder.parents = np.array([-1,0,0,2,np.nan,np.nan])
@@ -187,14 +190,18 @@ class TestRRT_Star(unittest.TestCase):
 
 		self.algorithm.new_v = [1.0,1.39]
 
+		self.algorithm.neighbor_grid = HashGrid(0.3, 2)
+		for i in range(4):
+			self.algorithm.neighbor_grid.insert(i, self.algorithm.recorder.vertices[i])
+
 		self.algorithm.find_vertices_in_neighborhood()
 
 		self.algorithm.neighbor_dist = [ round(elem, 6) for elem in self.algorithm.neighbor_dist]
 
-		self.assertEqual(self.algorithm.neighbor_indices,[1,2,3],"correct indices in the neighborhood not returned")
+		self.assertEqual(self.algorithm.neighbor_indices.tolist(),[1,2,3],"correct indices in the neighborhood not returned")
 		self.assertEqual(self.algorithm.neighbor_dist,[0.09,0.01,0.06],"distances from neighbor to point incorrect")
 
-	def test_rrt_star_05_indices_extents2(self):
+	def test_rrt_star_05_indices_grid2(self):
 		self.algorithm.recorder.parents = np.array([-1,0,0,2,np.nan,np.nan])
 		self.algorithm.recorder.costs = np.array([0.0,1.2,3.2,1.4,np.nan,np.nan])
 
@@ -208,12 +215,15 @@ class TestRRT_Star(unittest.TestCase):
 		)	
 
 		self.algorithm.params["neighborhood"] = 0.3
-		self.algorithm.neighbor_offset = 1.1
 		self.algorithm.new_v = [1.0,1.779]
 
-		indices = self.algorithm.find_indices_in_extents()
+		grid = HashGrid(0.3, 2)
+		for i in range(4):
+			grid.insert(i, self.algorithm.recorder.vertices[i])
+
+		indices, dist = grid.query_radius(self.algorithm.new_v, 0.3*1.1)
 
-		self.assertEqual(indices,[3],"corrent indices in the extents not returned")
+		self.assertEqual(indices.tolist(),[3],"corrent indices in the grid cells not returned")
 
 	def test_rrt_star_06_indices_neighbor2(self):
 		self.algorithm.recorder.parents = np.array([-1,0,0,2,np.nan,np.nan])
@@ -229,13 +239,16 @@ class TestRRT_Star(unittest.TestCase):
 		)	
 
 		self.algorithm.params["neighborhood"] = 0.3
-		self.algorithm.neighbor_offset = 1.1
 		self.algorithm.new_v = [1.0,1.779]
 
+		self.algorithm.neighbor_grid = HashGrid(0.3, 2)
+		for i in range(4):
+			self.algorithm.neighbor_grid.insert(i, self.algorithm.recorder.vertices[i])
+
 		self.algorithm.find_vertices_in_neighborhood()
 
-		self.assertEqual(self.algorithm.neighbor_indices,[],"corrent indices in the neighborhood not returned")
-		self.assertEqual(self.algorithm.neighbor_dist,[],"distances from neighbor to point incorrect")
+		self.assertEqual(self.algorithm.neighbor_indices.tolist(),[],"corrent indices in the neighborhood not returned")
+		self.assertEqual(self.algorithm.neighbor_dist.tolist(),[],"distances from neighbor to point incorrect")
 
 
 	def test_rrt_star_07_parent_shortest_path(self):
@@ -286,6 +299,31 @@ class TestRRT_Star(unittest.TestCase):
 		self.assertTrue(np.allclose([-1,4,1,4,2],self.algorithm.recorder.parents[0:5]),"rewire parents list incorrect")
 		self.assertTrue(np.allclose([0,1.6, 1.4, 1.6, 1.5],self.algorithm.recorder.costs[0:5]),"distances to new parent incorrect")
 
+	def test_rrt_star_09_edge_cache(self):
+		self.algorithm.is_new_edge_blocked = Mock(return_value=False)
+
+		self.algorithm.recorder.parents = np.array([-1,0,1,2,np.nan])
+		self.algorithm.recorder.costs = np.array([0.0,1.7,1.4,1.9,np.nan])
+		self.algorithm.recorder.vertices = np.array(
+			[[1.0, 0.0],
+			[1.0, 1.30],
+			[1.0, 1.40],
+			[1.0, 1.45],
+			[0.9, 1.40]]
+		)
+		self.algorithm.new_v = [0.9,1.4]
+		self.algorithm.new_index = 4
+		self.algorithm.neighbor_indices = [1,2,3]
+		self.algorithm.neighbor_dist= [0.1,0.1,0.1]
+
+		new_parent_index, new_parent_dist = self.algorithm.find_parent_shortest_path()
+		self.algorithm.recorder.costs[4] = self.algorithm.update_path_cost(new_parent_index,new_parent_dist)
+		self.algorithm.rewire(trial=4)
+
+		self.assertEqual(self.algorithm.is_new_edge_blocked.call_count, 3, "edges checked more than once")
+		self.assertEqual(self.algorithm.edge_cache.misses, 3, "edge cache misses incorrect")
+		self.assertEqual(self.algorithm.edge_cache.hits, 1, "edge cache hits incorrect")
+
 
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file
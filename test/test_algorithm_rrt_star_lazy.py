@@ -0,0 +1,130 @@
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+
+from algorithm.rrt_star_lazy import RRT_Star_Lazy
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [0.3, 2.1]}
+		}
+	}
+
+obstacles_info = {
+	'obstacle_1':{'dim': 2, 'shape_type': 'circle', 'radius': 0.1, 'center': [0.5, 0.5]},
+	'obstacle_2': {'dim': 2, 'shape_type': 'circle', 'radius': 0.4, 'center': [1.5, 0.5]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'rrt_star_lazy',
+	'n_trials': 100,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+recorder = Mock()
+
+class TestRRT_Star_Lazy(unittest.TestCase):
+	def setUp(self):
+
+		recorder.vertices = np.zeros((6,2), dtype=float)
+		recorder.vertices.fill(np.nan)
+
+		recorder.parents = np.zeros(6, dtype=float)
+		recorder.parents.fill(np.nan)
+
+		recorder.costs = np.zeros(6, dtype=float)
+		recorder.costs.fill(np.nan)
+
+
+		self.algorithm = RRT_Star_Lazy(domain_test, recorder, rrt_algorithm_info)
+
+		self.algorithm.recorder.vertices = np.array(
+			[[1.0, 0.0],
+			[1.0, 1.30],
+			[1.0, 1.40],
+			[1.0, 1.45],
+			[0.9, 1.40],
+			[np.nan, np.nan]]
+		)
+		self.algorithm.new_v = [0.9,1.4]
+		self.algorithm.new_index = 4
+
+	def tearDown(self):
+		self.algorithm = None
+
+
+	def test_rrt_star_lazy_00_parent_shortest_path(self):
+		self.algorithm.recorder.parents = np.array([-1,0,1,2,np.nan,np.nan])
+		self.algorithm.recorder.costs = np.array([0.0,1.3,1.4,1.5,np.nan,np.nan])
+
+		self.algorithm.neighbor_indices = [1,2,3]
+		self.algorithm.neighbor_dist= [10,0.1,10]
+
+		new_parent_index, new_parent_dist = self.algorithm.find_parent_shortest_path()
+
+		new_parent_dist = round(new_parent_dist,6)
+
+		self.assertEqual(new_parent_index,2,"closest parent index incorrect")
+		self.assertEqual(new_parent_dist,0.1,"distances to new parent incorrect")
+		self.assertEqual(self.algorithm.edge_cache.misses,1,"more than one edge checked")
+
+
+	def test_rrt_star_lazy_01_parent_blocked(self):
+		self.algorithm.recorder.costs = np.array([0.0,1.3,1.4,1.5,np.nan,np.nan])
+		self.algorithm.is_new_edge_blocked = Mock(side_effect=[True, False])
+
+		self.algorithm.neighbor_indices = [1,2,3]
+		self.algorithm.neighbor_dist= [0.2,0.05,0.1]
+
+		new_parent_index, new_parent_dist = self.algorithm.find_parent_shortest_path()
+
+		self.assertEqual(new_parent_index,1,"first unobstructed parent not returned")
+		self.assertEqual(self.algorithm.is_new_edge_blocked.call_count,2,"edges not checked in order of cost")
+
+
+	def test_rrt_star_lazy_02_parent_all_blocked(self):
+		self.algorithm.recorder.costs = np.array([0.0,1.3,1.4,1.5,np.nan,np.nan])
+		self.algorithm.is_new_edge_blocked = Mock(return_value=True)
+		self.algorithm.new_parent = 0
+		self.algorithm.new_cost = 0.2
+
+		self.algorithm.neighbor_indices = [1,2,3]
+		self.algorithm.neighbor_dist= [0.2,0.05,0.1]
+
+		new_parent_index, new_parent_dist = self.algorithm.find_parent_shortest_path()
+
+		self.assertEqual((new_parent_index, new_parent_dist),(0, 0.2),"nearest vertex not kept as parent")
+
+
+	def test_rrt_star_lazy_03_rewire(self):
+		self.algorithm.recorder.parents = np.array([-1,0,1,2,2,np.nan])
+		self.algorithm.recorder.costs = np.array([0.0,1.7,1.4,1.9,1.5,np.nan])
+		self.algorithm.is_new_edge_blocked = Mock(return_value=False)
+
+		self.algorithm.neighbor_indices = [1,2,3]
+		self.algorithm.neighbor_dist= [0.1,0.1,0.1]
+
+		self.algorithm.rewire(trial=4)
+
+		self.assertTrue(np.allclose([-1,4,1,4,2],self.algorithm.recorder.parents[0:5]),"rewire parents list incorrect")
+		self.assertTrue(np.allclose([0,1.6, 1.4, 1.6, 1.5],self.algorithm.recorder.costs[0:5]),"distances to new parent incorrect")
+		self.assertEqual(self.algorithm.is_new_edge_blocked.call_count,2,"edges that cannot improve the path checked")
+
+
+if __name__ == '__main__':
+	unittest.main()
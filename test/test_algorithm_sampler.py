@@ -0,0 +1,149 @@
+import unittest
+
+import numpy as np
+
+from algorithm.sample_buffer import SampleBuffer
+from algorithm.sampler_goal_bias import GoalBiasSampler
+from algorithm.sampler_gaussian import GaussianSampler
+from algorithm.sampler_bridge import BridgeSampler
+from algorithm.sampler_quasi_random import QuasiRandomSampler
+from algorithm.rrt_basic import RRT_Basic
+from solver.recorder import Recorder
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2,
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [4.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.5, 0.5],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.2, 'center': [3.5, 3.5]},
+		'goal_2': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [3.2, 0.2], 'upper_right': [3.6, 0.6]}
+		}
+	}
+
+# Two walls with a narrow passage between them at y = 2.0
+obstacles_info = {
+	'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [1.5, 0.0], 'upper_right': [2.5, 1.9]},
+	'obstacle_2': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [1.5, 2.1], 'upper_right': [2.5, 4.0]}
+	}
+
+rrt_algorithm_info = {
+	'method': 'rrt_basic',
+	'n_trials': 100,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+domain_test = Domain(domain_info, obstacles_info, origin_goal_info)
+
+class TestSampler(unittest.TestCase):
+	def setUp(self):
+		np.random.seed(5)
+
+	def test_sampler_00_uniform_statistics(self):
+		sampler = SampleBuffer(domain_test.domain, batch_size=8)
+		self.assertEqual(sampler.acceptance_rate, 1.0, "acceptance rate incorrect before sampling")
+
+		for i in range(10):
+			sampler.next()
+
+		self.assertEqual((sampler.n_candidates, sampler.n_accepted, sampler.n_returned), (16, 16, 10), "sampler statistics incorrect")
+
+
+	def test_sampler_01_goal_bias(self):
+		sampler = GoalBiasSampler(domain_test.domain, domain_test.goals, goal_bias=1.0, batch_size=64)
+		points = np.array([sampler.next() for i in range(64)])
+
+		in_goals = domain_test.goals[0].points_inside(points) | domain_test.goals[1].points_inside(points)
+		self.assertTrue(np.all(in_goals), "point drawn outside of the goals")
+		self.assertTrue(np.any(domain_test.goals[0].points_inside(points)) and np.any(domain_test.goals[1].points_inside(points)), "goal never sampled")
+
+
+	def test_sampler_02_gaussian(self):
+		sampler = GaussianSampler(domain_test, sigma=0.1, uniform_fraction=0.0, batch_size=512)
+		points = np.array([sampler.next() for i in range(100)])
+
+		distance = np.maximum(np.abs(points[:,0] - 2.0) - 0.5, 0.0)
+		self.assertFalse(np.any(domain_test.points_blocked(points)), "blocked point accepted")
+		self.assertTrue(np.median(distance) < 0.2, "points not concentrated near the obstacles")
+		self.assertTrue(sampler.acceptance_rate < 1.0, "acceptance rate incorrect")
+
+
+	def test_sampler_03_bridge(self):
+		sampler = BridgeSampler(domain_test, sigma=0.3, uniform_fraction=0.0, batch_size=512)
+		points = np.array([sampler.next() for i in range(20)])
+
+		self.assertFalse(np.any(domain_test.points_blocked(points)), "blocked point accepted")
+		self.assertTrue(np.all(np.abs(points[:,1] - 2.0) <= 0.1), "midpoint outside of the narrow passage")
+
+
+	def test_sampler_04_no_obstacles(self):
+		free_domain = Domain(domain_info, {}, origin_goal_info)
+		sampler = BridgeSampler(free_domain, sigma=0.3, uniform_fraction=0.0, batch_size=16)
+		sampler.next()
+
+		self.assertEqual(sampler.acceptance_rate, 1.0, "uniform sampling not used without obstacles")
+
+
+	def test_sampler_05_create_sampler(self):
+		for name, sampler_class in [("uniform", SampleBuffer), ("goal_bias", GoalBiasSampler), ("gaussian", GaussianSampler), ("bridge", BridgeSampler), ("halton", QuasiRandomSampler), ("sobol", QuasiRandomSampler)]:
+			params = dict(rrt_algorithm_info, sampler=name)
+			algorithm = RRT_Basic(domain_test, Recorder(params), params)
+			self.assertIsInstance(algorithm.sample_buffer, sampler_class, "sampler not selected from the parameters")
+
+		params = dict(rrt_algorithm_info, sampler="unknown")
+		with self.assertRaises(Exception):
+			RRT_Basic(domain_test, Recorder(params), params)
+
+
+	def test_sampler_06_quasi_random_sequences(self):
+		halton = QuasiRandomSampler(domain_test.domain, "halton", scramble=False)
+		sobol = QuasiRandomSampler(domain_test.domain, "sobol", scramble=False)
+
+		self.assertTrue(np.allclose(halton.halton([1, 2, 3, 4]), [[1/2, 1/3], [1/4, 2/3], [3/4, 1/9], [1/8, 4/9]]), "Halton sequence incorrect")
+		self.assertTrue(np.allclose(sobol.sobol([1, 2, 3, 4]), [[0.5, 0.5], [0.75, 0.25], [0.25, 0.75], [0.375, 0.375]]), "Sobol sequence incorrect")
+
+		points = np.array([halton.next() for i in range(3)])
+		self.assertTrue(np.allclose(points, [[2.0, 4/3], [1.0, 8/3], [3.0, 4/9]]), "sequence not mapped onto the domain")
+
+
+	def test_sampler_07_quasi_random_scramble(self):
+		for sequence in QuasiRandomSampler.SEQUENCES:
+			sampler_1 = QuasiRandomSampler(domain_test.domain, sequence, seed=4, batch_size=64)
+			sampler_2 = QuasiRandomSampler(domain_test.domain, sequence, seed=4, batch_size=64)
+			sampler_3 = QuasiRandomSampler(domain_test.domain, sequence, seed=5, batch_size=64)
+
+			points_1 = np.array([sampler_1.next() for i in range(100)])
+			points_2 = np.array([sampler_2.next() for i in range(100)])
+			points_3 = np.array([sampler_3.next() for i in range(100)])
+
+			self.assertTrue(np.array_equal(points_1, points_2), "scrambled sequence not reproduced from the seed")
+			self.assertFalse(np.allclose(points_1, points_3), "scrambling independent of the seed")
+			self.assertTrue(np.all(domain_test.domain.points_inside(points_1)), "point outside of the domain")
+
+		# Every cell of a 8 by 8 grid holds one of the points 0 to 63 of the scrambled Sobol sequence, a (0,6,2)-net
+		cells = np.floor(QuasiRandomSampler(domain_test.domain, "sobol", seed=4).sobol(np.arange(64))*8).astype(int)
+		self.assertEqual(len(set(map(tuple, cells))), 64, "scrambled Sobol points not evenly spread")
+
+		with self.assertRaises(Exception):
+			QuasiRandomSampler(domain_test.domain, "unknown")
+
+
+	def test_sampler_08_next_batch(self):
+		sampler = SampleBuffer(domain_test.domain, batch_size=8)
+		first = sampler.next()
+		points = sampler.next_batch(20)
+
+		self.assertEqual(points.shape, (20, 2), "batch size incorrect")
+		self.assertEqual((sampler.n_candidates, sampler.n_returned, len(sampler)), (24, 21, 3), "buffer not used in order")
+		self.assertFalse(np.any(np.all(points == first, axis=1)), "point handed out twice")
+
+
+if __name__ == '__main__':
+	unittest.main()
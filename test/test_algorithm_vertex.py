@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch
 import numpy as np
 
 from algorithm.vertex import Vertex
+from algorithm.sample_buffer import SampleBuffer
 from input.domain_class import Domain
 
 domain_info = {
@@ -146,6 +147,20 @@ class TestVertex(unittest.TestCase):
 			"config not right dimensions")
 
 
+	def test_vertex_06_random_config_buffer(self):
+		buffer = SampleBuffer(domain_test.domain, batch_size=4)
+
+		for i in range(10):
+			rand_config = Vertex.new_config(domain_test, buffer)
+
+			self.assertEqual(len(rand_config), domain_test.dim,
+				"config not right dimensions")
+			self.assertTrue(domain_test.domain.is_point_inside(rand_config),
+				"config not inside the domain")
+
+		self.assertEqual(len(buffer), 2, "buffer not refilled in batches")
+
+
 	def test_vertex_07_new_vertex_close1(self):
 		
 		vertices = np.array(
@@ -61,4 +61,37 @@ def test_sample_random_point():
   circle = Circle(shape_info)
   for i in range(10):
     new_random_point = circle.sample_random_point()
-    assert(circle.is_point_inside(new_random_point)==True)
\ No newline at end of file
+    assert(circle.is_point_inside(new_random_point)==True)
+
+def test_sample_random_points():
+  shape_info = {'dim':2, 'shape_type':'circle','radius': 1.0, 'center':np.array([1.0, -1.0])}
+  circle = Circle(shape_info)
+  new_random_points = circle.sample_random_points(100)
+  assert new_random_points.shape==(100, 2)
+  for new_random_point in new_random_points:
+    assert circle.is_point_inside(new_random_point)==True
+
+def test_batch_matches_scalar():
+  shape_info = {'dim':2, 'shape_type':'circle','radius': 1.0, 'center':np.array([0.0, 0.0])}
+  circle = Circle(shape_info)
+  points = np.array([[0.0, 1.0], [0.0, 1.0+1.0e-7], [0.5, 0.5], [2.0, 2.0]])
+  assert circle.points_inside(points).tolist()==[True, False, True, False]
+
+  points_1 = np.array([[-2.0, 1.0], [-2.0, 1.0], [-2.0, 1.0], [-2.0, 1.0], [-2.0, 1.0]])
+  points_2 = np.array([[2.0, 1.0], [2.0, 2.0], [2.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+  intersected = circle.edges_intersected(points_1, points_2)
+  assert intersected.tolist()==[circle.is_intersected_by_edge(point_1, point_2) for point_1, point_2 in zip(points_1, points_2)]
+  assert intersected.tolist()==[True, False, True, True, False]
+
+def test_map_unit_points():
+  shape_info = {'dim':2, 'shape_type':'circle','radius': 2.0, 'center':np.array([1.0, -1.0])}
+  circle = Circle(shape_info)
+  unit_points = np.random.RandomState(0).rand(4000, 2)
+  points = circle.map_unit_points(unit_points)
+  assert points.shape==(4000, 2)
+  assert np.all(circle.points_inside(points))
+  # The center of the square maps to the center of the circle, the corners to the perimeter
+  assert np.allclose(circle.map_unit_points(np.array([[0.5, 0.5], [1.0, 1.0]])), [[1.0, -1.0], [1.0+np.sqrt(2.0), -1.0+np.sqrt(2.0)]])
+  # The map preserves areas: the inner circle of half the radius gets a quarter of the points
+  inner = np.linalg.norm(points-shape_info['center'], axis=1) < 1.0
+  assert abs(inner.mean()-0.25) < 0.03
@@ -0,0 +1,108 @@
+# test_domain.py
+# Author(s): Vivek Kumar
+import numpy as np
+import pytest
+from input.domain_class import Domain
+
+domain_info = {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [-10.0, -10.0], 'upper_right': [10.0, 10.0]}
+origin_goal_info = {'origin': [9.9, 9.9], 'goals': {}}
+
+def create_domain(n_rectangles, n_circles, seed=0):
+  rng = np.random.RandomState(seed)
+  obstacles_info = {}
+  for i in range(n_rectangles):
+    lower_left = rng.rand(2)*18.0-9.0
+    obstacles_info['rectangle_{}'.format(i)] = {'dim': 2, 'shape_type': 'rectangle', 'lower_left': lower_left.tolist(), 'upper_right': (lower_left+rng.rand(2)*0.5+0.05).tolist()}
+  for i in range(n_circles):
+    obstacles_info['circle_{}'.format(i)] = {'dim': 2, 'shape_type': 'circle', 'radius': float(rng.rand()*0.3+0.05), 'center': (rng.rand(2)*16.0-8.0).tolist()}
+  return Domain(domain_info, obstacles_info, origin_goal_info)
+
+def is_edge_blocked_reference(domain, point_1, point_2):
+  for obstacle in domain.obstacles:
+    if(obstacle.is_point_inside(point_1) or obstacle.is_point_inside(point_2)):
+      return True
+    if(obstacle.is_intersected_by_edge(point_1, point_2)):
+      return True
+  return False
+
+def test_rectangle_arrays():
+  domain = create_domain(3, 2)
+  assert domain.rectangle_obstacles.tolist()==[0, 1, 2]
+  assert domain.rectangle_lower.shape==(3, 2)
+  assert np.array_equal(domain.rectangle_lower[1], domain.obstacles[1].ll_corner)
+  assert np.array_equal(domain.rectangle_upper[1], domain.obstacles[1].ur_corner)
+
+def test_rectangles_hit_by_edge():
+  domain = Domain(domain_info, {'obstacle_1': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [0.0, 0.0], 'upper_right': [1.0, 1.0]}}, origin_goal_info)
+  assert domain.rectangles_hit_by_edge(np.array([-1.0, 0.5]), np.array([2.0, 0.5])).tolist()==[True]
+  assert domain.rectangles_hit_by_edge(np.array([-1.0, 1.5]), np.array([2.0, 0.5])).tolist()==[True] # crosses the corner region
+  assert domain.rectangles_hit_by_edge(np.array([-1.0, 1.5]), np.array([0.5, 3.0])).tolist()==[False]
+  assert domain.rectangles_hit_by_edge(np.array([-1.0, 0.0]), np.array([-0.5, 0.0])).tolist()==[False] # collinear, stops short
+  assert domain.rectangles_hit_by_edge(np.array([0.5, -1.0]), np.array([0.5, 0.0])).tolist()==[True] # touches the side
+  assert domain.rectangles_hit_by_edge(np.array([0.5, 0.5]), np.array([0.6, 0.6])).tolist()==[True] # inside
+
+def test_circle_arrays():
+  domain = create_domain(2, 3)
+  assert domain.circle_obstacles.tolist()==[2, 3, 4]
+  assert domain.circle_centers.shape==(3, 2)
+  assert np.array_equal(domain.circle_centers[1], domain.obstacles[3].center)
+  assert domain.circle_radii[1]==domain.obstacles[3].radius
+  assert not domain.use_circle_arrays # too few circles, they are in the AABB tree
+  assert len(domain.obstacle_tree)==5
+
+def test_circles_hit_by_edge():
+  domain = Domain(domain_info, {'obstacle_1': {'dim': 2, 'shape_type': 'circle', 'radius': 1.0, 'center': [0.0, 0.0]}}, origin_goal_info)
+  assert domain.circles_hit_by_edge(np.array([-2.0, 0.5]), np.array([2.0, 0.5])).tolist()==[True]
+  assert domain.circles_hit_by_edge(np.array([-2.0, 1.0]), np.array([2.0, 1.0])).tolist()==[True] # tangent
+  assert domain.circles_hit_by_edge(np.array([-2.0, 1.5]), np.array([2.0, 1.5])).tolist()==[False]
+  assert domain.circles_hit_by_edge(np.array([2.0, 0.0]), np.array([3.0, 0.0])).tolist()==[False] # stops short
+  assert domain.circles_hit_by_edge(np.array([0.1, 0.1]), np.array([0.2, 0.2])).tolist()==[True] # inside
+  assert domain.circles_hit_by_edge(np.array([0.5, 0.5]), np.array([0.5, 0.5])).tolist()==[True] # zero length
+  assert domain.circles_containing_point(np.array([0.0, 1.0])).tolist()==[True]
+  assert domain.circles_containing_point(np.array([0.8, 0.8])).tolist()==[False]
+
+def test_is_edge_blocked_matches_reference():
+  for n_rectangles, n_circles in [(100, 40), (10, 10)]:
+    domain = create_domain(n_rectangles, n_circles)
+    assert domain.use_rectangle_arrays==(n_rectangles >= Domain.PACKED_MIN_OBSTACLES)
+    assert domain.use_circle_arrays==(n_circles >= Domain.PACKED_MIN_OBSTACLES)
+    check_is_edge_blocked(domain)
+
+def check_is_edge_blocked(domain):
+  rng = np.random.RandomState(1)
+  for i in range(300):
+    point_1 = rng.rand(2)*20.0-10.0
+    point_2 = point_1 + rng.rand(2)*1.0-0.5
+    assert domain.is_edge_blocked(point_1, point_2)==is_edge_blocked_reference(domain, point_1, point_2)
+    assert domain.is_point_blocked(point_1)==any(obstacle.is_point_inside(point_1) for obstacle in domain.obstacles)
+
+def test_collision_mode():
+  domain = create_domain(10, 10)
+  assert domain.collision_mode=="validated"
+  rng = np.random.RandomState(2)
+  edges = [(point_1, point_1 + rng.rand(2)*1.0-0.5) for point_1 in rng.rand(200, 2)*20.0-10.0]
+  validated = [domain.is_edge_blocked(point_1, point_2) for point_1, point_2 in edges]
+  domain.set_collision_mode("fast")
+  assert domain.validate_edges==False
+  assert [domain.is_edge_blocked(point_1, point_2) for point_1, point_2 in edges]==validated
+  with pytest.raises(Exception):
+    domain.set_collision_mode("unknown")
+
+def test_points_blocked():
+  for n_rectangles, n_circles in [(100, 40), (10, 10)]:
+    domain = create_domain(n_rectangles, n_circles)
+    points = np.random.RandomState(2).rand(500, 2)*20.0-10.0
+    expected = [domain.is_point_blocked(point) for point in points]
+    assert domain.points_blocked(points).tolist()==expected
+  assert domain.points_blocked(np.zeros((0, 2))).tolist()==[]
+
+def test_edges_blocked():
+  rng = np.random.RandomState(3)
+  points_1 = rng.rand(400, 2)*20.0-10.0
+  points_2 = points_1 + rng.rand(400, 2)*2.0-1.0
+  points_2[:20,0] = points_1[:20,0] # vertical edges
+  points_2[20:30] = points_1[20:30] # zero length edges
+  for n_rectangles, n_circles in [(100, 40), (10, 10)]:
+    domain = create_domain(n_rectangles, n_circles)
+    expected = [domain.is_edge_blocked(point_1, point_2) for point_1, point_2 in zip(points_1, points_2)]
+    assert domain.edges_blocked(points_1, points_2).tolist()==expected
@@ -4,6 +4,8 @@ This is the test file for the class to read the FreeForm class
 Author(s) : Vivek Kumar
 Last Updated: December 2019
 """
+import os
+import shutil
 from pytest import approx
 import numpy as np
 from input.shape_free_form import FreeForm2D
@@ -38,4 +40,100 @@ def test_new_random_point():
   free_shape = FreeForm2D(shape_info)
   for i in range(10):
     new_random_point = free_shape.sample_random_point()
-    assert(free_shape.is_point_inside(new_random_point)==True)
\ No newline at end of file
+    assert(free_shape.is_point_inside(new_random_point)==True)
+
+def test_new_random_points():
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': './test/test_rectangle.pbm', 'bb_lower_left':np.array([1.5,1.5]), 'bb_upper_right':np.array([2.5,3.5])}
+  free_shape = FreeForm2D(shape_info)
+  new_random_points = free_shape.sample_random_points(20)
+  assert(new_random_points.shape==(20, 2))
+  for new_random_point in new_random_points:
+    assert(free_shape.is_point_inside(new_random_point)==True)
+
+def test_batch_matches_scalar():
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': './test/test_rectangle.pbm', 'bb_lower_left':np.array([1.5,1.5]), 'bb_upper_right':np.array([2.5,3.5])}
+  free_shape = FreeForm2D(shape_info)
+  rng = np.random.RandomState(0)
+  points = rng.rand(200, 2)*4.0
+  inside = free_shape.points_inside(points)
+  assert(inside.tolist()==[free_shape.is_point_inside(point) for point in points])
+
+  points_1 = np.array([[0.0, 2.0], [0.0, 2.0], [0.0, 0.0], [1.0, 0.0]])
+  points_2 = np.array([[3.5, 2.0], [3.5, 4.0], [1.0, 1.0], [1.0, 4.0]])
+  intersected = free_shape.edges_intersected(points_1, points_2)
+  assert(intersected.tolist()==[free_shape.is_intersected_by_edge(point_1, point_2) for point_1, point_2 in zip(points_1, points_2)])
+
+def test_occupancy_grid_matches_brute_force():
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': './src_pathplanner/input/bitmap_files/test_circle.pbm', 'bb_lower_left':np.array([0.0,0.0]), 'bb_upper_right':np.array([3.0,1.0])}
+  free_shape = FreeForm2D(shape_info)
+  assert(free_shape.cell_state.shape==free_shape.lattice_shape)
+  assert(np.any(free_shape.cell_state==free_shape.BOUNDARY))
+
+  rng = np.random.RandomState(0)
+  points = rng.rand(500, 2)*np.array([3.0, 1.0])
+  y_band = 2.1*free_shape.hy
+  test_radius = max(free_shape.hx,free_shape.hy)*2.1
+  for point in points:
+    shape_points = free_shape.all_points_array
+    shape_points = shape_points[(shape_points[:,1] < point[1]+y_band) & (shape_points[:,1] > point[1]-y_band)]
+    inside = len(shape_points) > 0 and np.min(np.linalg.norm(shape_points-point, axis=1)) < test_radius
+    assert(free_shape.is_point_inside(point)==inside)
+
+def test_grid_traversal():
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': './test/test_rectangle.pbm', 'bb_lower_left':np.array([1.5,1.5]), 'bb_upper_right':np.array([2.5,3.5])}
+  free_shape = FreeForm2D(shape_info)
+  points_1 = np.array([[1.0, 1.49], [1.0, 1.6], [1.4, 1.7], [1.4, 1.4], [2.0, 1.0], [3.0, 3.6]])
+  points_2 = np.array([[3.0, 1.49], [3.0, 1.6], [1.7, 1.4], [1.45, 1.45], [2.0, 4.0], [1.0, 3.6]])
+  expected = [False, True, True, False, True, False]
+  for point_1, point_2, intersected in zip(points_1, points_2, expected):
+    assert(free_shape.is_intersected_by_edge(point_1, point_2)==intersected)
+  assert(free_shape.edges_intersected(points_1, points_2).tolist()==expected)
+
+def test_cache_write_failure(tmp_path, monkeypatch):
+  bitmap_file = tmp_path / 'test_rectangle.pbm'
+  shutil.copyfile('./test/test_rectangle.pbm', bitmap_file)
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': str(bitmap_file), 'bb_lower_left':np.array([1.5,1.5]), 'bb_upper_right':np.array([2.5,3.5]), 'use_cache': True}
+
+  def savez_partial(file, **arrays):
+    with open(file, 'wb') as f:
+      f.write(b'PK')
+    raise OSError('No space left on device')
+  monkeypatch.setattr(np, 'savez_compressed', savez_partial)
+
+  free_shape = FreeForm2D(shape_info)
+  assert(os.listdir(os.path.dirname(free_shape.cache_file()))==[]) # The partial temporary file was removed
+
+def test_cache(tmp_path):
+  bitmap_file = tmp_path / 'test_rectangle.pbm'
+  shutil.copyfile('./test/test_rectangle.pbm', bitmap_file)
+  shape_info = {'dim': 2, 'shape_type':'free_form', 'bitmap_file': str(bitmap_file), 'bb_lower_left':np.array([1.5,1.5]), 'bb_upper_right':np.array([2.5,3.5])}
+
+  shape_info['use_cache'] = False
+  free_shape = FreeForm2D(shape_info)
+  assert(not os.path.exists(free_shape.cache_file()))
+
+  shape_info['use_cache'] = True
+  free_shape = FreeForm2D(shape_info)
+  assert(os.path.exists(free_shape.cache_file()))
+  assert(hasattr(free_shape, 'img'))
+
+  cached_shape = FreeForm2D(shape_info)
+  assert(not hasattr(cached_shape, 'img')) # The bitmap was not processed again
+  for key in FreeForm2D.CACHE_ATTRIBUTES:
+    assert(np.array_equal(getattr(cached_shape, key), getattr(free_shape, key)))
+  assert(cached_shape.is_intersected_by_edge(np.array([0.0, 2.0]), np.array([3.5, 2.0]))==True)
+
+  # A truncated cache file is a cache miss, and is replaced
+  with open(free_shape.cache_file(), 'rb') as f:
+    content = f.read()
+  for size in [0, 10, len(content)//2]:
+    with open(free_shape.cache_file(), 'wb') as f:
+      f.write(content[:size])
+    rebuilt_shape = FreeForm2D(shape_info)
+    assert(hasattr(rebuilt_shape, 'img'))
+    assert(np.array_equal(rebuilt_shape.cell_state, free_shape.cell_state))
+  assert(os.listdir(os.path.dirname(free_shape.cache_file()))==[os.path.basename(free_shape.cache_file())])
+
+  # A different bounding box uses a different cache file
+  shape_info['bb_upper_right'] = np.array([2.5,3.0])
+  assert(FreeForm2D(shape_info).cache_file()!=free_shape.cache_file())
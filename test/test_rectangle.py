@@ -60,4 +60,33 @@ def test_sample_random_point():
   rectangle = Rectangle(shape_info)
   for i in range(10):
     new_random_point = rectangle.sample_random_point()
-    assert(rectangle.is_point_inside(new_random_point)==True)
\ No newline at end of file
+    assert(rectangle.is_point_inside(new_random_point)==True)
+
+def test_sample_random_points():
+  shape_info = {'dim':2, 'shape_type':'rectangle','lower_left': np.array([-1.0, -1.0]), 'upper_right':np.array([1.0, 1.0])}
+  rectangle = Rectangle(shape_info)
+  new_random_points = rectangle.sample_random_points(100)
+  assert(new_random_points.shape==(100, 2))
+  for new_random_point in new_random_points:
+    assert(rectangle.is_point_inside(new_random_point)==True)
+
+def test_batch_matches_scalar():
+  shape_info = {'dim':2, 'shape_type':'rectangle','lower_left': np.array([-1.0, -0.5]), 'upper_right':np.array([1.0, 0.5])}
+  rectangle = Rectangle(shape_info)
+  rng = np.random.RandomState(0)
+  points = rng.rand(200, 2)*4.0-2.0
+  inside = rectangle.points_inside(points)
+  assert(inside.tolist()==[rectangle.is_point_inside(point) for point in points])
+
+  points_1 = points[~inside]
+  points_2 = rng.rand(len(points_1), 2)*4.0-2.0
+  points_2 = points_2[~rectangle.points_inside(points_2)]
+  points_1 = points_1[:len(points_2)]
+  intersected = rectangle.edges_intersected(points_1, points_2)
+  assert(intersected.tolist()==[rectangle.is_intersected_by_edge(point_1, point_2) for point_1, point_2 in zip(points_1, points_2)])
+
+def test_map_unit_points():
+  shape_info = {'dim':2, 'shape_type':'rectangle','lower_left': [1.0, 2.0], 'upper_right':[5.0, 3.0]}
+  rectangle = Rectangle(shape_info)
+  points = rectangle.map_unit_points(np.array([[0.0, 0.0], [0.5, 0.5], [0.25, 1.0]]))
+  assert np.allclose(points, [[1.0, 2.0], [3.0, 2.5], [2.0, 3.0]])
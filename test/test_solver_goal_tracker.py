@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from solver.recorder import Recorder
+from solver.goal_tracker import GoalTracker
+from input.domain_class import Domain
+
+domain_info = {
+	'dim': 2, 
+	'shape_type': 'rectangle',
+	'lower_left': [0.0, 0.0],
+	'upper_right': [3.0, 4.0]
+	}
+
+origin_goal_info = {
+	'origin': [0.1, 0.1],
+	'goals': {
+		'goal_1': {'dim': 2, 'shape_type': 'circle', 'radius': 0.25, 'center': [1.0, 1.1]},
+		'goal_2': {'dim': 2, 'shape_type': 'rectangle', 'lower_left': [2.0, 2.0], 'upper_right': [2.5, 2.5]},
+		'goal_3': {'dim': 2, 'shape_type': 'circle', 'radius': 0.1, 'center': [2.5, 3.5]}
+		}
+	}
+
+rrt_algorithm_info = {
+	'method': 'rrt_star',
+	'n_trials': 10,
+	'step_size': 0.2,
+	'dim': 2,
+	'neighborhood': 0.3
+	}
+
+domain_test = Domain(domain_info, {}, origin_goal_info)
+
+class TestGoalTracker(unittest.TestCase):
+	def setUp(self):
+		self.recorder = Recorder(rrt_algorithm_info)
+		self.tracker = GoalTracker(domain_test.goals, self.recorder)
+
+	def tearDown(self):
+		self.tracker = None
+
+
+	def test_goal_tracker_00_members(self):
+		self.recorder.vertices[0:5] = [[0.1, 0.1], [1.0, 1.05], [2.2, 2.2], [1.1, 1.0], [1.0, 2.0]]
+		self.recorder.n_vertices = 3
+		self.tracker.update()
+		self.recorder.n_vertices = 5
+		self.tracker.update()
+
+		self.assertEqual(self.tracker.members, [[1, 3], [2], []], "goal members incorrect")
+		self.assertEqual(self.tracker.n_tracked, 5, "number of tracked vertices incorrect")
+
+
+	def test_goal_tracker_01_best_vertex(self):
+		self.recorder.vertices[0:4] = [[0.1, 0.1], [1.0, 1.05], [2.2, 2.2], [1.1, 1.0]]
+		self.recorder.costs[0:4] = [0.0, 1.5, 3.0, 1.2]
+		self.recorder.n_vertices = 4
+		self.tracker.update()
+
+		self.assertEqual(self.tracker.best_vertex(0), 3, "lowest cost vertex incorrect")
+		self.assertEqual(self.tracker.best_vertex(1), 2, "lowest cost vertex incorrect")
+		self.assertTrue(np.isnan(self.tracker.best_vertex(2)), "unreached goal not nan")
+
+		# re-wiring lowers the cost of vertex 1
+		self.recorder.costs[1] = 1.0
+		self.assertEqual(self.tracker.best_vertex(0), 1, "re-wired cost not taken into account")
+
+
+	def test_goal_tracker_02_reset(self):
+		self.recorder.vertices[0:4] = [[0.1, 0.1], [1.0, 1.05], [2.2, 2.2], [1.1, 1.0]]
+		self.recorder.n_vertices = 4
+		self.tracker.update()
+
+		self.recorder.vertices = np.array([[0.1, 0.1], [2.2, 2.2]])
+		self.tracker.update()
+
+		self.assertEqual(self.tracker.members, [[], [1], []], "tracking not restarted")
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -56,22 +56,177 @@ class TestRecorder(unittest.TestCase):
 		self.assertFalse(hasattr(self.recorder, 'parents_history'),
 			"parents history exists for rrt_basic")	
 
-	def test_recorder_05_yes_history(self):
+	def test_recorder_05_rewire_log(self):
 		rrt_algorithm_info['method'] = "rrt_star"
 		self.recorder = Recorder(rrt_algorithm_info)
 
-		self.assertTrue(hasattr(self.recorder, 'parents_history'),
-			"parents history does not exist for rrt_star")	
+		self.assertEqual(self.recorder.rewire_log.shape, (0, 4),
+			"rewire log not initially empty")
 
-	def test_recorder_05_yes_history_len(self):
+		for i in range(100):
+			self.recorder.record_rewire(i, 1, 0, i)
+
+		self.assertEqual(self.recorder.rewire_log.shape, (100, 4),
+			"rewire log not grown")
+		self.assertEqual(self.recorder.rewire_log[99].tolist(), [99, 1, 0, 99],
+			"rewire event incorrect")
+
+	def test_recorder_06_parents_at(self):
 		rrt_algorithm_info['method'] = "rrt_star"
 		self.recorder = Recorder(rrt_algorithm_info)
 
-		self.assertEqual(self.recorder.parents_history.shape,
-						(self.recorder.params["n_trials"],
-						2*self.recorder.params["n_trials"]),
-						"p_history, not right matrix size")		
-
+		# iteration 3 rewires vertex 1 (0 -> 3), iteration 4 rewires it again (3 -> 4) and vertex 2 (1 -> 4)
+		self.recorder.parents[0:5] = [-1, 4, 4, 0, 0]
+		self.recorder.n_vertices = 5
+		self.recorder.record_rewire(3, 1, 0, 3)
+		self.recorder.record_rewire(4, 1, 3, 4)
+		self.recorder.record_rewire(4, 2, 1, 4)
+
+		parents = self.recorder.parents_at(2)
+		self.assertTrue(np.array_equal(parents, [-1, 0, 1, np.nan, np.nan], equal_nan=True),
+			"parents before any rewire incorrect")
+
+		parents = self.recorder.parents_at(3, rewired=False)
+		self.assertTrue(np.array_equal(parents, [-1, 0, 1, 0, np.nan], equal_nan=True),
+			"parents before rewire in iteration 3 incorrect")
+
+		parents = self.recorder.parents_at(3)
+		self.assertTrue(np.array_equal(parents, [-1, 3, 1, 0, np.nan], equal_nan=True),
+			"parents after rewire in iteration 3 incorrect")
+
+		parents = self.recorder.parents_at(4)
+		self.assertTrue(np.array_equal(parents, [-1, 4, 4, 0, 0], equal_nan=True),
+			"parents after last rewire incorrect")
+
+		# The rows of the methods adding several vertices per iteration are not iterations
+		for method in ["rrt_connect", "fmt_star", "prm", "lazy_prm"]:
+			recorder = Recorder(dict(rrt_algorithm_info, method=method))
+			with self.assertRaises(Exception):
+				recorder.parents_at(2)
+
+	def test_recorder_07_live_count(self):
+		self.assertEqual(self.recorder.n_vertices, 0,
+			"live count not initialized to zero")
+
+		self.assertEqual(self.recorder.live_vertices.shape, (0, self.recorder.params["dim"]),
+			"live vertices not empty")
+
+		self.recorder.vertices = np.array(
+			[[0.0, 0.0],
+			[1.0, 1.0],
+			[np.nan, np.nan]]
+		)
+
+		self.assertEqual(self.recorder.n_vertices, 2,
+			"live count not found from assigned vertices")
+
+	def test_recorder_08_live_views(self):
+		self.recorder.vertices[0:3,:] = [[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]]
+		self.recorder.parents[0:3] = [-1, 0, 1]
+		self.recorder.costs[0:3] = [0.0, 1.4, 2.8]
+		self.recorder.n_vertices = 3
+
+		self.assertTrue(np.allclose(self.recorder.live_parents, [-1, 0, 1]),
+			"live parents incorrect")
+		self.assertTrue(np.allclose(self.recorder.live_costs, [0.0, 1.4, 2.8]),
+			"live costs incorrect")
+
+		self.recorder.live_costs[1] = 1.5
+		self.assertEqual(self.recorder.costs[1], 1.5,
+			"live costs not a view")
+
+	def test_recorder_09_reserve(self):
+		n_trials = self.recorder.params["n_trials"]
+		self.recorder.vertices[0,:] = [0.5, 0.5]
+		self.recorder.parents[0] = -1
+		self.recorder.costs[0] = 0.0
+		self.recorder.n_vertices = 1
+
+		self.recorder.reserve(n_trials)
+		self.assertEqual(self.recorder.capacity, n_trials,
+			"capacity changed when not needed")
+
+		self.recorder.reserve(n_trials + 1)
+		self.assertEqual(self.recorder.capacity, 2*n_trials,
+			"capacity not doubled")
+		self.assertEqual(self.recorder.vertices.shape, (2*n_trials, self.recorder.params["dim"]),
+			"vertices not grown")
+		self.assertEqual(len(self.recorder.parents), 2*n_trials,
+			"parents not grown")
+		self.assertEqual(len(self.recorder.costs), 2*n_trials,
+			"costs not grown")
+
+		self.assertTrue(np.allclose(self.recorder.live_vertices, [[0.5, 0.5]]),
+			"recorded vertices not kept")
+		self.assertTrue(np.all(np.isnan(self.recorder.vertices[1:])),
+			"new rows not initialized to NaN")
+		self.assertEqual(self.recorder.n_vertices, 1,
+			"live count changed by growth")
+
+
+	def test_recorder_10_children(self):
+		# vertex 3 is recorded under 1 and then rewired to 2, vertex 4 is recorded under 3
+		self.recorder.parents[0:4] = [-1, 0, 0, 1]
+		self.recorder.n_vertices = 4
+		self.assertEqual(self.recorder.descendants(1).tolist(), [3],
+			"descendants incorrect")
+
+		self.recorder.record_rewire(4, 3, 1, 2)
+		self.recorder.parents[3] = 2
+		self.recorder.parents[4] = 3
+		self.recorder.n_vertices = 5
+		self.recorder.update_children()
+
+		self.assertEqual(self.recorder.children[0:5], [[1, 2], [], [3], [4], []],
+			"children lists incorrect")
+		self.assertEqual(self.recorder.descendants(0).tolist(), [1, 2, 3, 4],
+			"descendants of the origin incorrect")
+		self.assertEqual(self.recorder.descendants(1).tolist(), [],
+			"rewired vertex not removed from old parent")
+
+
+	def test_recorder_11_propagate_cost(self):
+		self.recorder.parents[0:5] = [-1, 0, 1, 2, 0]
+		self.recorder.costs[0:5] = [0.0, 1.0, 2.0, 3.0, 1.0]
+		self.recorder.n_vertices = 5
+
+		self.recorder.propagate_cost(1, -0.5)
+
+		self.assertTrue(np.allclose(self.recorder.live_costs, [0.0, 1.0, 1.5, 2.5, 1.0]),
+			"subtree costs not updated")
+
+
+
+	def test_recorder_12_extract_paths(self):
+		self.recorder.parents[0:6] = [-1, 0, 4, 1, 3, 3]
+		self.recorder.n_vertices = 6
+
+		self.assertEqual(self.recorder.depths()[0:7].tolist(), [0, 1, 4, 2, 3, 3, 0],
+			"depths incorrect")
+
+		paths, offsets = self.recorder.extract_paths([2, 0, 5])
+		self.assertEqual(paths.tolist(), [0, 1, 3, 4, 2, 0, 0, 1, 3, 5],
+			"paths incorrect")
+		self.assertEqual(offsets.tolist(), [0, 5, 6, 10],
+			"path offsets incorrect")
+
+
+	def test_recorder_13_extract_paths_random_tree(self):
+		rng = np.random.RandomState(0)
+		self.recorder.parents[0] = -1
+		for i in range(1, 100):
+			self.recorder.parents[i] = rng.randint(i)
+		self.recorder.n_vertices = 100
+
+		targets = rng.randint(100, size=30)
+		paths, offsets = self.recorder.extract_paths(targets)
+
+		for k, target in enumerate(targets):
+			path = [target]
+			while path[-1] > 0:
+				path.append(int(self.recorder.parents[path[-1]]))
+			self.assertEqual(paths[offsets[k]:offsets[k+1]].tolist(), path[::-1],
+				"path differs from walking the parents")
 
 
 if __name__ == '__main__':
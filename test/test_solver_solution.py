@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 from unittest.mock import Mock
 
@@ -139,6 +140,20 @@ class TestSolution(unittest.TestCase):
 		self.assertTrue(np.isnan(a), "goal path incorrect")
 
 
+	def test_solution_06_findpaths(self):
+		self.solution.recorder.vertices = np.array([[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 2.0], [2.0, 2.0]])
+		self.solution.recorder.parents = np.array([-1, 0, 3, 1, 3])
+		self.solution.recorder.costs = np.array([0.0, 1.0, 3.0, 2.0, 3.0])
+
+		paths, vertices, costs = self.solution.find_paths([2, np.nan, 4])
+
+		self.assertEqual(paths[0], [0, 1, 3, 2], "goal path incorrect")
+		self.assertTrue(np.isnan(paths[1][0]), "path to unreached goal not nan")
+		self.assertEqual(paths[2], [0, 1, 3, 4], "goal path incorrect")
+		self.assertTrue(np.allclose(vertices[2], [[0.0, 0.0], [0.0, 1.0], [1.0, 2.0], [2.0, 2.0]]), "path vertices incorrect")
+		self.assertTrue(np.array_equal(costs, [3.0, np.nan, 3.0], equal_nan=True), "path costs incorrect")
+
+
 	def test_solution_07_solutionpath(self):
 		origin_goal_info = {
 			'origin': [0.1, 0.1],
@@ -202,6 +217,87 @@ class TestSolution(unittest.TestCase):
 						"costs, not fully filled")	
 
 
+	def test_solution_09_runalgorithm_star_lazy(self):
+		params = dict(rrt_algorithm_info, method="rrt_star_lazy")
+		self.solution = Solution(params,domain_test)
+
+		self.solution.run_algorithm()
+
+		self.assertEqual(self.solution.recorder.n_vertices, params["n_trials"], "vertices, not fully filled")
+		self.assertFalse(np.any(np.isnan(self.solution.recorder.live_parents)), "parents, not fully filled")
+		self.assertFalse(np.any(np.isnan(self.solution.recorder.live_costs)), "costs, not fully filled")
+
+
+	def test_solution_09_star_costs(self):
+		for method in ["rrt_star", "rrt_star_lazy", "rrt_star_informed", "fmt_star"]:
+			params = dict(rrt_algorithm_info, method=method, n_trials=300)
+			self.solution = Solution(params,domain_test)
+			self.solution.run_algorithm(print_vertex=False)
+
+			recorder = self.solution.recorder
+			parents = recorder.live_parents[1:].astype(int)
+			edges = np.linalg.norm(recorder.live_vertices[1:] - recorder.vertices[parents], axis=1)
+
+			self.assertTrue(np.allclose(recorder.live_costs[1:], recorder.costs[parents] + edges),
+				"costs not consistent with parents after rewiring")
+
+
+	def test_solution_09_runalgorithm_star_informed(self):
+		params = dict(rrt_algorithm_info, method="rrt_star_informed", n_trials=1500)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+
+		self.assertIs(self.solution.goal_tracker, self.solution.algorithm.goal_tracker, "goal tracker not shared with the algorithm")
+		sampler = self.solution.algorithm.informed_sampler
+		self.assertTrue(sampler.is_active, "informed set not used after the goals were reached")
+		self.assertTrue(np.allclose(sampler.goals, [goal.center for goal in domain_test.goals]), "informed set not focused on the goal centers")
+		self.assertTrue(np.allclose(sampler.costs, [self.solution.recorder.costs[self.solution.goal_tracker.best_vertex(i)] + domain_test.goals[i].radius for i in range(len(domain_test.goals))]),
+			"informed set not updated with the best path costs")
+
+		# Every vertex inside a goal is in the informed set of that goal
+		vertices = self.solution.recorder.live_vertices
+		for i, goal in enumerate(domain_test.goals):
+			members = self.solution.goal_tracker.members[i]
+			dist = np.linalg.norm(vertices[members] - domain_test.origin, axis=1) + np.linalg.norm(vertices[members] - sampler.goals[i], axis=1)
+			self.assertTrue(np.all(dist[self.solution.recorder.costs[members] <= sampler.costs[i] - goal.radius] <= sampler.costs[i] + 1e-9), "goal vertex outside of the informed set")
+
+
+	def test_solution_09_runalgorithm_connect(self):
+		params = dict(rrt_algorithm_info, method="rrt_connect", n_trials=20000, stop_at_goals=True)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+		self.solution.process_vertex_list()
+
+		self.assertEqual(self.solution.termination_reason, "goals_reached", "goals not reached")
+		for path in self.solution.solution_path:
+			self.assertEqual(path[0], 0, "path to goal not found")
+
+
+	def test_solution_09_runalgorithm_fmt_star(self):
+		params = dict(rrt_algorithm_info, method="fmt_star", n_trials=1000, stop_at_goals=True)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+		self.solution.process_vertex_list()
+
+		self.assertEqual(self.solution.termination_reason, "goals_reached", "goals not reached")
+		for path in self.solution.solution_path:
+			self.assertEqual(path[0], 0, "path to goal not found")
+
+
+	def test_solution_09_runalgorithm_lazy_prm(self):
+		with tempfile.TemporaryDirectory() as folder:
+			params = dict(rrt_algorithm_info, method="lazy_prm", n_trials=1000, stop_at_goals=True, roadmap_folder=folder)
+			for run in range(2):
+				self.solution = Solution(params,domain_test)
+				self.solution.run_algorithm(print_vertex=False)
+				self.solution.process_vertex_list()
+
+				self.assertEqual(self.solution.algorithm.loaded, run == 1, "roadmap not reused")
+				self.assertEqual(self.solution.termination_reason, "goals_reached", "goals not reached")
+				for path in self.solution.solution_path:
+					self.assertEqual(path[0], 0, "path to goal not found")
+
+
 	def test_solution_10_unknown_method(self):
 		rrt_algorithm_info['method'] = "unknown"
 		self.solution = Solution(rrt_algorithm_info,domain_test)
@@ -212,5 +308,62 @@ class TestSolution(unittest.TestCase):
 		self.assertEqual(cm.exception.code, "ERROR: No Valid Method")
 
 
+	def test_solution_11_collision_mode(self):
+		self.assertEqual(self.solution.domain_object.collision_mode, "fast", "default collision mode incorrect")
+
+		params = dict(rrt_algorithm_info, collision_mode="validated")
+		self.solution = Solution(params,domain_test)
+		self.assertEqual(self.solution.domain_object.collision_mode, "validated", "collision mode not set from params")
+		self.assertTrue(self.solution.domain_object.validate_edges, "edges not validated")
+
+
+	def test_solution_12_termination(self):
+		params = dict(rrt_algorithm_info, method="rrt_star", n_trials=50)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+		self.assertEqual(self.solution.termination_reason, "n_trials", "termination reason incorrect")
+		self.assertEqual(self.solution.n_iterations, 49, "number of iterations incorrect")
+
+		params = dict(rrt_algorithm_info, method="rrt_star", n_trials=5000, time_limit=0.0)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+		self.assertEqual(self.solution.termination_reason, "time_limit", "time limit not applied")
+		self.assertEqual(self.solution.n_iterations, 1, "run not stopped after the first iteration")
+
+
+	def test_solution_13_stop_at_goals(self):
+		params = dict(rrt_algorithm_info, method="rrt_star", n_trials=20000, stop_at_goals=True)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+		self.solution.process_vertex_list()
+
+		self.assertEqual(self.solution.termination_reason, "goals_reached", "termination reason incorrect")
+		self.assertEqual(self.solution.recorder.n_vertices, self.solution.n_iterations + 1, "vertices recorded after stopping")
+		for path in self.solution.solution_path:
+			self.assertEqual(path[0], 0, "path to goal not found")
+
+
+	def test_solution_14_cost_converged(self):
+		params = dict(rrt_algorithm_info, method="rrt_star", n_trials=20000, cost_tolerance=1e-9, cost_window=50)
+		self.solution = Solution(params,domain_test)
+		self.solution.run_algorithm(print_vertex=False)
+
+		history = self.solution.best_cost_history
+		self.assertEqual(self.solution.termination_reason, "cost_converged", "termination reason incorrect")
+		self.assertLess(history[-51] - history[-1], 1e-9, "cost still improving when stopped")
+
+
+	def test_solution_15_seed(self):
+		runs = []
+		for sampler in ["uniform", "uniform", "halton"]:
+			params = dict(rrt_algorithm_info, method="rrt_star", n_trials=200, sampler=sampler, seed=11)
+			self.solution = Solution(params,domain_test)
+			self.solution.run_algorithm(print_vertex=False)
+			runs.append(self.solution.recorder.live_vertices.copy())
+
+		self.assertTrue(np.array_equal(runs[0], runs[1]), "seeded runs not repeated exactly")
+		self.assertFalse(np.array_equal(runs[0], runs[2]), "sampler not used")
+
+
 if __name__ == '__main__':
 	unittest.main()
\ No newline at end of file